@@ -0,0 +1 @@
+"""Throughput and memory benchmarks for the Wyrd engines."""
@@ -0,0 +1,183 @@
+"""Benchmark case definitions.
+
+Every case factory does its setup once and returns a ``run(step)`` callable
+that performs one unit of work and reports ``(weeks, events)`` processed.
+``step`` increases on every call, so cases that sit behind a result cache can
+derive a fresh seed from it and always measure real generation.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Callable, Dict, List, Tuple
+
+from engines import web_adapter
+from engines.base import ScheduleInput
+from engines.engine_mk1 import EngineMK1
+from engines.engine_mk2 import EngineMK2, EngineMK21, normalize_mk2_events
+from models import Activity
+from modules.validation import validate_week
+
+__all__ = ["BenchmarkCase", "CASES", "WEEK_START"]
+
+Run = Callable[[int], Tuple[int, int]]
+
+WEEK_START = date(2025, 1, 6)
+ARCHETYPES = ("office", "parent", "freelancer")
+
+MK1_CONFIG = {
+    "name": "Benchmark Character",
+    "sleep": {"bedtime": "23:00", "duration_hours": 8},
+    "work": {
+        "start": "09:00",
+        "duration_hours": 8,
+        "days": ["monday", "tuesday", "wednesday", "thursday", "friday"],
+    },
+    "meals": {"breakfast": "07:30", "lunch": "12:30", "dinner": "18:30"},
+    "activities": [
+        {"name": "gym", "time": "07:00", "duration_minutes": 60, "days": ["tuesday", "thursday"]},
+        {"name": "hobby", "time": "20:00", "duration_minutes": 120, "days": ["monday", "wednesday"]},
+        {"name": "family", "time": "19:00", "duration_minutes": 180, "days": ["saturday"]},
+    ],
+}
+
+# Weeks of events fed to ``normalize_mk2_events`` in one call.
+NORMALIZE_WEEKS = 52
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    """A named benchmark and how many ``run`` calls make up one measurement."""
+
+    name: str
+    setup: Callable[[], Run]
+    iterations: int
+
+
+def _mk1_generate() -> Run:
+    engine = EngineMK1()
+    schedule_input = ScheduleInput(constraints=MK1_CONFIG)
+
+    def run(step: int) -> Tuple[int, int]:
+        return 1, len(engine.generate(schedule_input).events)
+
+    return run
+
+
+def _mk2_week(engine_type: type, archetype: str) -> Callable[[], Run]:
+    def setup() -> Run:
+        engine = engine_type()
+        profile, templates = engine.select_profile(archetype)
+
+        def run(step: int) -> Tuple[int, int]:
+            result = engine.generate_complete_week(profile, WEEK_START, step, templates)
+            return 1, len(result["events"])
+
+        return run
+
+    return setup
+
+
+def _normalize_large() -> Run:
+    engine = EngineMK2()
+    profile, templates = engine.select_profile("office")
+    raw_events = list(
+        engine.iter_events(profile, WEEK_START, NORMALIZE_WEEKS * 7, 1, templates)
+    )
+
+    def run(step: int) -> Tuple[int, int]:
+        return NORMALIZE_WEEKS, len(normalize_mk2_events(raw_events))
+
+    return run
+
+
+def _validate_week() -> Run:
+    plans: List[Dict[str, List[Activity]]] = []
+
+    def capture(week: Dict[str, List[Activity]]) -> list:
+        # Keep the exact plans the engine validates, via its public validator hook.
+        plans.append({label: list(activities) for label, activities in week.items()})
+        return validate_week(week)
+
+    engine = EngineMK2(validator=capture)
+    for archetype in ARCHETYPES:
+        profile, templates = engine.select_profile(archetype)
+        engine.generate_complete_week(profile, WEEK_START, 0, templates)
+    activities = sum(len(day) for week in plans for day in week.values())
+
+    def run(step: int) -> Tuple[int, int]:
+        for week in plans:
+            validate_week(week)
+        return len(plans), activities
+
+    return run
+
+
+def _web_mk1() -> Run:
+    def run(step: int) -> Tuple[int, int]:
+        payload = web_adapter.mk1_run_web("office", WEEK_START.isoformat(), step)
+        return 1, len(payload["events"])
+
+    return run
+
+
+def _web_mk2(entry_point: Callable[..., Dict[str, object]], with_budget: bool) -> Callable[[], Run]:
+    def setup() -> Run:
+        budget = {
+            "person_id": "benchmark",
+            "year": WEEK_START.year,
+            "unique_days": [
+                {"date": (WEEK_START + timedelta(days=2)).isoformat(), "day_type": "vacation"}
+            ],
+        }
+
+        def run(step: int) -> Tuple[int, int]:
+            # A fresh seed per call keeps the adapter's result cache from answering.
+            args: List[object] = ["office", WEEK_START.isoformat(), step]
+            if with_budget:
+                args.append(budget)
+            payload = entry_point(*args)
+            return 1, len(payload["events"])
+
+        return run
+
+    return setup
+
+
+CASES: List[BenchmarkCase] = [
+    BenchmarkCase("mk1.generate", _mk1_generate, 200),
+    *(
+        BenchmarkCase(f"mk2.generate_complete_week[{archetype}]", _mk2_week(EngineMK2, archetype), 100)
+        for archetype in ARCHETYPES
+    ),
+    *(
+        BenchmarkCase(
+            f"mk2_1.generate_complete_week[{archetype}]", _mk2_week(EngineMK21, archetype), 100
+        )
+        for archetype in ARCHETYPES
+    ),
+    BenchmarkCase(f"normalize_mk2_events[{NORMALIZE_WEEKS}w]", _normalize_large, 5),
+    BenchmarkCase("validate_week", _validate_week, 300),
+    BenchmarkCase("web_adapter.mk1_run_web", _web_mk1, 200),
+    BenchmarkCase(
+        "web_adapter.mk2_run_calendar_web",
+        _web_mk2(web_adapter.mk2_run_calendar_web, False),
+        100,
+    ),
+    BenchmarkCase(
+        "web_adapter.mk2_run_workforce_web",
+        _web_mk2(web_adapter.mk2_run_workforce_web, True),
+        100,
+    ),
+    BenchmarkCase(
+        "web_adapter.mk2_1_run_calendar_web",
+        _web_mk2(web_adapter.mk2_1_run_calendar_web, False),
+        100,
+    ),
+    BenchmarkCase(
+        "web_adapter.mk2_1_run_workforce_web",
+        _web_mk2(web_adapter.mk2_1_run_workforce_web, True),
+        100,
+    ),
+]
@@ -0,0 +1,238 @@
+"""Run the benchmark suite and compare it against a stored baseline.
+
+Usage::
+
+    python -m benchmarks                      # compare against benchmarks/baseline.json
+    python -m benchmarks --update             # record a new baseline
+    python -m benchmarks --only mk2 --tolerance 0.3
+
+Throughput is the best of ``--repeats`` timed measurements; peak memory is
+traced separately for a single call so tracing never slows the timed runs.
+A case regresses when weeks/sec or events/sec fall more than ``tolerance``
+below the baseline, or when peak memory grows by more than ``tolerance``.
+Baselines are machine-specific; record one on the machine that checks it.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import platform
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from modules.json_stream import dump_json
+
+from .cases import CASES, BenchmarkCase
+
+__all__ = ["compare", "main", "measure", "run_suite"]
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+DEFAULT_TOLERANCE = 0.25
+
+# Peak-memory growth below this many KiB is treated as noise.
+_MEMORY_SLACK_KIB = 16.0
+
+
+def measure(case: BenchmarkCase, *, repeats: int = 5, scale: float = 1.0) -> Dict[str, Any]:
+    """Measure one case and return its throughput and peak-memory figures."""
+
+    run = case.setup()
+    iterations = max(1, int(case.iterations * scale))
+    step = 0
+    run(step)  # warm-up: populate lazy caches before timing
+
+    best: Optional[float] = None
+    weeks = events = 0
+    gc_was_enabled = gc.isenabled()
+    gc.disable()  # as timeit does, so collector pauses do not land in one case
+    try:
+        for _ in range(max(1, repeats)):
+            weeks = events = 0
+            started = time.perf_counter()
+            for _ in range(iterations):
+                step += 1
+                done_weeks, done_events = run(step)
+                weeks += done_weeks
+                events += done_events
+            elapsed = time.perf_counter() - started
+            if best is None or elapsed < best:
+                best = elapsed
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    step += 1
+    tracemalloc.start()
+    try:
+        run(step)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    seconds = best or 1e-9
+    return {
+        "iterations": iterations,
+        "weeks": weeks,
+        "events": events,
+        "seconds": round(seconds, 6),
+        "weeks_per_sec": round(weeks / seconds, 3),
+        "events_per_sec": round(events / seconds, 3),
+        "peak_kib": round(peak / 1024, 3),
+    }
+
+
+def run_suite(
+    cases: Iterable[BenchmarkCase] = CASES,
+    *,
+    only: Sequence[str] = (),
+    repeats: int = 5,
+    scale: float = 1.0,
+) -> Dict[str, Dict[str, Any]]:
+    """Measure every case whose name contains one of *only* (all when empty)."""
+
+    return {
+        case.name: measure(case, repeats=repeats, scale=scale)
+        for case in cases
+        if not only or any(fragment in case.name for fragment in only)
+    }
+
+
+def compare(
+    results: Dict[str, Dict[str, Any]],
+    baseline: Dict[str, Dict[str, Any]],
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> List[str]:
+    """Return one message per metric in *results* that regressed against *baseline*."""
+
+    regressions: List[str] = []
+    for name, current in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        for metric in ("weeks_per_sec", "events_per_sec"):
+            floor = reference[metric] * (1 - tolerance)
+            if current[metric] < floor:
+                regressions.append(
+                    f"{name}: {metric} {current[metric]:.1f} < {floor:.1f} "
+                    f"(baseline {reference[metric]:.1f})"
+                )
+        ceiling = reference["peak_kib"] * (1 + tolerance) + _MEMORY_SLACK_KIB
+        if current["peak_kib"] > ceiling:
+            regressions.append(
+                f"{name}: peak_kib {current['peak_kib']:.1f} > {ceiling:.1f} "
+                f"(baseline {reference['peak_kib']:.1f})"
+            )
+    return regressions
+
+
+def _load_baseline(path: Path) -> Dict[str, Dict[str, Any]]:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())["cases"]
+
+
+def _print_results(
+    results: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]]
+) -> None:
+    width = max((len(name) for name in results), default=0)
+    print(f"{'case':<{width}}  {'weeks/s':>10}  {'events/s':>12}  {'peak KiB':>9}  vs baseline")
+    for name, row in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            change = "new"
+        else:
+            ratio = row["events_per_sec"] / reference["events_per_sec"] - 1
+            change = f"{ratio:+.1%}"
+        print(
+            f"{name:<{width}}  {row['weeks_per_sec']:>10.1f}  {row['events_per_sec']:>12.1f}  "
+            f"{row['peak_kib']:>9.1f}  {change}"
+        )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description="Wyrd engine benchmark suite"
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=DEFAULT_BASELINE,
+        help="Baseline JSON to compare against (and to write with --update)",
+    )
+    parser.add_argument(
+        "--update",
+        action="store_true",
+        help="Write the measured results as the new baseline instead of comparing",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help="Allowed relative slowdown or memory growth before a case fails",
+    )
+    parser.add_argument(
+        "--only",
+        action="append",
+        default=[],
+        help="Only run cases whose name contains this text (repeatable)",
+    )
+    parser.add_argument(
+        "--repeats",
+        type=int,
+        default=5,
+        help="Timed measurements per case; the fastest one is reported",
+    )
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="Multiply every case's iteration count (e.g. 0.1 for a smoke run)",
+    )
+    parser.add_argument(
+        "--json",
+        type=Path,
+        default=None,
+        help="Optional path to write this run's results as JSON",
+    )
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    results = run_suite(only=args.only, repeats=args.repeats, scale=args.scale)
+    report = {
+        "recorded": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cases": results,
+    }
+
+    if args.json is not None:
+        dump_json(report, args.json)
+
+    if args.update:
+        if args.only and args.baseline.exists():
+            # Partial runs refresh their cases and keep the rest of the baseline.
+            report["cases"] = {**_load_baseline(args.baseline), **results}
+        dump_json(report, args.baseline)
+        _print_results(results, {})
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    baseline = _load_baseline(args.baseline)
+    _print_results(results, baseline)
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print()
+        print(f"{len(regressions)} regression(s) beyond {args.tolerance:.0%} tolerance:")
+        for message in regressions:
+            print(f"  - {message}")
+        return 1
+    if not baseline:
+        print(f"No baseline at {args.baseline}; run with --update to record one.")
+    return 0
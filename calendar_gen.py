@@ -13,9 +13,10 @@ from __future__ import annotations
 import argparse
 import json
 from pathlib import Path
-from typing import Dict, Optional, Sequence
+from typing import Dict, Iterable, Optional, Sequence
 
 from engines.base import ScheduleInput
+from modules.json_stream import dump_json
 from rigs.simple_rig import SimpleRig
 
 
@@ -25,10 +26,16 @@ def load_config(path: Path) -> Dict[str, object]:
     return json.loads(path.read_text())
 
 
-def write_output(events: Sequence[Dict[str, object]], path: Path) -> None:
-    """Serialise the generated events to JSON."""
+def write_output(
+    events: Iterable[Dict[str, object]],
+    path: Path,
+    *,
+    compact: bool = False,
+    gzip_output: Optional[bool] = None,
+) -> None:
+    """Stream the generated events to *path* as a JSON array."""
 
-    path.write_text(json.dumps(list(events), indent=2))
+    dump_json(iter(events), path, compact=compact, gzip_output=gzip_output)
 
 
 def format_totals(totals: Dict[str, float]) -> Sequence[str]:
@@ -39,6 +46,13 @@ def main(argv: Optional[Sequence[str]] = None) -> None:
     parser = argparse.ArgumentParser(description="Synthetic Calendar Generator")
     parser.add_argument("config", type=Path, help="Path to configuration JSON")
     parser.add_argument("output", type=Path, help="Path to output JSON file")
+    parser.add_argument("--compact", action="store_true", help="Write JSON without indentation")
+    parser.add_argument(
+        "--gzip",
+        action="store_true",
+        default=None,
+        help="Gzip the output (implied when the output path ends in .gz)",
+    )
     args = parser.parse_args(argv)
 
     raw_config = load_config(args.config)
@@ -47,7 +61,7 @@ def main(argv: Optional[Sequence[str]] = None) -> None:
     schedule_input = ScheduleInput(constraints=raw_config)
     result = rig.generate(schedule_input)
 
-    write_output(result.events, args.output)
+    write_output(result.events, args.output, compact=args.compact, gzip_output=args.gzip)
 
     week_start = result.diagnostics.get("week_start")
     week_end = result.diagnostics.get("week_end")
@@ -4,9 +4,9 @@ from __future__ import annotations
 
 import argparse
 import json
-from datetime import date
+from datetime import date, timedelta
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterable, Iterator, Optional
 
 from engines.engine_mk2 import (
     DayPlan,
@@ -17,6 +17,7 @@ from engines.engine_mk2 import (
 )
 from rigs.workforce_rig import WorkforceRig
 from models import ActivityTemplate, PersonProfile
+from modules.json_stream import dump_json
 from modules.unique_events import UniqueDay
 from yearly_budget import YearlyBudget
 
@@ -29,6 +30,7 @@ __all__ = [
     "apply_seasonal_modifiers",
     "apply_special_period_effects",
     "generate_complete_week",
+    "write_weeks",
 ]
 
 
@@ -44,6 +46,36 @@ def generate_complete_week(
     return _rig.generate_complete_week(profile, start_date, week_seed, templates, yearly_budget)
 
 
+def write_weeks(
+    weeks: Iterable[Dict[str, object]],
+    path: Path,
+    *,
+    person: str,
+    compact: bool = False,
+    gzip_output: Optional[bool] = None,
+) -> Dict[str, int]:
+    """Stream *weeks* to *path* as ``{"person": ..., "weeks": [...]}``.
+
+    Weeks are pulled from *weeks* one at a time and written before the next
+    is generated, so with a lazy source such as ``generate_range`` peak memory
+    stays at a single week. Returns the number of weeks, events and issues.
+    """
+
+    counts = {"weeks": 0, "events": 0, "issues": 0}
+
+    def tally() -> Iterator[Dict[str, object]]:
+        for week in weeks:
+            counts["weeks"] += 1
+            counts["events"] += len(week["events"])  # type: ignore[arg-type]
+            counts["issues"] += len(week["issues"])  # type: ignore[arg-type]
+            yield week
+
+    dump_json(
+        {"person": person, "weeks": tally()}, path, compact=compact, gzip_output=gzip_output
+    )
+    return counts
+
+
 def _select_profile(archetype: str):
     return _rig.select_profile(archetype)
 
@@ -77,21 +109,54 @@ def main() -> None:
     parser.add_argument("--output", type=Path, required=True, help="Where to write the generated JSON")
     parser.add_argument("--seed", type=int, default=42, help="Random seed controlling stochastic variation")
     parser.add_argument("--start-date", type=str, default=None, help="ISO start date for the schedule")
+    parser.add_argument(
+        "--weeks",
+        type=int,
+        default=1,
+        help="Number of consecutive weeks; more than one streams a weeks array week by week",
+    )
     parser.add_argument(
         "--yearly-budget",
         type=Path,
         default=None,
         help="Optional path to a yearly budget JSON file",
     )
+    parser.add_argument("--compact", action="store_true", help="Write JSON without indentation")
+    parser.add_argument(
+        "--gzip",
+        action="store_true",
+        default=None,
+        help="Gzip the output (implied when the output path ends in .gz)",
+    )
     args = parser.parse_args()
+    if args.weeks < 1:
+        parser.error("--weeks must be at least 1")
 
     start = date.fromisoformat(args.start_date) if args.start_date else date.today()
     profile, templates = _select_profile(args.archetype)
 
     yearly_budget = _load_yearly_budget(args.yearly_budget)
+    if args.weeks > 1:
+        weeks = _rig.generate_range(
+            profile,
+            start,
+            start + timedelta(weeks=args.weeks - 1),
+            args.seed,
+            templates,
+            yearly_budget,
+        )
+        counts = write_weeks(
+            weeks, args.output, person=profile.name, compact=args.compact, gzip_output=args.gzip
+        )
+        print(f"Generated {counts['weeks']} weeks for {profile.name}")
+        print(f"Events: {counts['events']}")
+        print(f"Issues: {counts['issues']}")
+        print(f"Schedule saved to {args.output}")
+        return
+
     result = generate_complete_week(profile, start, args.seed, templates, yearly_budget)
 
-    args.output.write_text(json.dumps(result, indent=2))
+    dump_json(result, args.output, compact=args.compact, gzip_output=args.gzip)
 
     print(f"Generated week for {profile.name}")
     print(f"Week starting: {result['week_start']}")
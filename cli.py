@@ -3,21 +3,33 @@
 from __future__ import annotations
 
 import argparse
-import json
-from datetime import date
+import cProfile
+import platform
+import pstats
+import time
+import tracemalloc
+from datetime import date, timedelta
 from pathlib import Path
-from typing import Optional, Sequence
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 from calendar_gen import format_totals as _format_simple_totals
 from calendar_gen import load_config as _load_simple_config
 from calendar_gen import write_output as _write_simple_output
-from calendar_gen_v2 import _load_yearly_budget
+from calendar_gen_v2 import _load_yearly_budget, write_weeks
 from engines.base import ScheduleInput
 from engines.engine_mk1 import EngineMK1
 from engines.engine_mk2 import EngineMK2, EngineMK21
+from modules.instrumentation import StageTimer
+from modules.json_stream import dump_json
 from rigs.simple_rig import SimpleRig
 from rigs.workforce_rig import WorkforceRig
 
+ROOT = Path(__file__).resolve().parent
+
+# Fixed default so profiles taken on different days stay comparable.
+PROFILE_START_DATE = date(2025, 1, 6)
+PROFILE_WEEKS = 4
+
 
 def _build_engine(engine_name: str) -> object:
     if engine_name == "mk1":
@@ -39,7 +51,9 @@ def _run_simple(args: argparse.Namespace) -> None:
     schedule_input = ScheduleInput(constraints=raw_config)
     result = rig.generate(schedule_input)
 
-    _write_simple_output(result.events, args.output)
+    _write_simple_output(
+        result.events, args.output, compact=args.compact, gzip_output=args.gzip
+    )
 
     week_start = result.diagnostics.get("week_start")
     week_end = result.diagnostics.get("week_end")
@@ -65,6 +79,24 @@ def _run_workforce(args: argparse.Namespace) -> None:
     profile, templates = rig.select_profile(args.archetype)
 
     yearly_budget = _load_yearly_budget(args.yearly_budget)
+    if args.weeks > 1:
+        weeks = rig.generate_range(
+            profile,
+            start,
+            start + timedelta(weeks=args.weeks - 1),
+            args.seed,
+            templates,
+            yearly_budget,
+        )
+        counts = write_weeks(
+            weeks, args.output, person=profile.name, compact=args.compact, gzip_output=args.gzip
+        )
+        print(f"Generated {counts['weeks']} weeks for {profile.name}")
+        print(f"Events: {counts['events']}")
+        print(f"Issues: {counts['issues']}")
+        print(f"Schedule saved to {args.output}")
+        return
+
     result = rig.generate_complete_week(
         profile,
         start,
@@ -73,7 +105,7 @@ def _run_workforce(args: argparse.Namespace) -> None:
         yearly_budget,
     )
 
-    args.output.write_text(json.dumps(result, indent=2))
+    dump_json(result, args.output, compact=args.compact, gzip_output=args.gzip)
 
     print(f"Generated week for {profile.name}")
     print(f"Week starting: {result['week_start']}")
@@ -94,79 +126,350 @@ def _run_workforce(args: argparse.Namespace) -> None:
     print(f"Schedule saved to {args.output}")
 
 
-def build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(description="Unified Wyrd Engine CLI")
+def _profile_jobs(
+    args: argparse.Namespace,
+) -> Tuple[List[Callable[[], Any]], Optional[StageTimer], Callable[[Any], int]]:
+    """Return one zero-argument job per (seed, week) plus a stage timer and event counter."""
+
+    seeds = range(args.seed, args.seed + args.seeds)
+    engine = _build_engine(args.engine)
+
+    if args.rig == "simple":
+        raw_config = _load_simple_config(args.config)
+        rig = SimpleRig(engine=engine)
+        jobs = [
+            (lambda seed=seed: rig.generate(ScheduleInput(constraints=raw_config, seed=seed)))
+            for seed in seeds
+            for _ in range(args.weeks)
+        ]
+        return jobs, None, lambda result: len(result.events)
+
+    timer = StageTimer()
+    workforce = WorkforceRig(engine=engine, instrumentation=timer)
+    profile, templates = workforce.select_profile(args.archetype)
+    yearly_budget = _load_yearly_budget(args.yearly_budget)
+    start = date.fromisoformat(args.start_date) if args.start_date else PROFILE_START_DATE
+
+    def job(seed: int, week_start: date) -> Callable[[], Any]:
+        return lambda: workforce.generate_complete_week(
+            profile, week_start, seed, templates, yearly_budget
+        )
+
+    jobs = [
+        job(seed, start + timedelta(weeks=week)) for seed in seeds for week in range(args.weeks)
+    ]
+    return jobs, timer, lambda result: len(result["events"])
+
+
+def _function_label(key: Tuple[str, int, str]) -> str:
+    filename, line, name = key
+    if filename == "~":
+        return name
+    path = Path(filename)
+    try:
+        filename = path.resolve().relative_to(ROOT).as_posix()
+    except ValueError:
+        filename = path.name
+    return f"{filename}:{line}({name})"
+
+
+def profile_generation(args: argparse.Namespace) -> Dict[str, Any]:
+    """Profile the engine/rig selected by *args* and return a JSON-friendly report.
+
+    The workload runs three times after a one-week warm-up: once plainly for
+    throughput and per-stage timings, once under :mod:`cProfile` for the
+    hottest functions and once under :mod:`tracemalloc` for memory, so no
+    measurement is skewed by another tool's overhead.
+
+    Only the MK2-series engines are instrumented per stage; for the simple MK1
+    rig ``stage_timing`` is ``False`` and ``stages`` stays empty.
+    """
+
+    jobs, timer, count_events = _profile_jobs(args)
+    if jobs:
+        jobs[0]()
+    if timer is not None:
+        timer.reset()
+
+    started = time.perf_counter()
+    events = sum(count_events(job()) for job in jobs)
+    wall_seconds = time.perf_counter() - started
+    stages = timer.report() if timer is not None else []
+    if timer is not None:
+        timer.reset()
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    for job in jobs:
+        job()
+    profiler.disable()
+    stats = pstats.Stats(profiler)
+    sort_index = 2 if args.sort == "tottime" else 3
+    hottest = sorted(
+        stats.stats.items(),  # type: ignore[attr-defined]
+        key=lambda item: item[1][sort_index],
+        reverse=True,
+    )[: args.top]
+    hot_functions = [
+        {
+            "function": _function_label(key),
+            "calls": calls,
+            "tottime_ms": round(tottime * 1000, 3),
+            "cumtime_ms": round(cumtime * 1000, 3),
+        }
+        for key, (_, calls, tottime, cumtime, _) in hottest
+    ]
+
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        results = [job() for job in jobs]
+        retained, peak = tracemalloc.get_traced_memory()
+        retained_blocks = sum(
+            stat.count for stat in tracemalloc.take_snapshot().statistics("filename")
+        )
+    finally:
+        tracemalloc.stop()
+    del results
+
+    per_event = max(events, 1)
+    return {
+        "engine": args.engine,
+        "rig": args.rig,
+        "archetype": None if args.rig == "simple" else args.archetype,
+        "seeds": args.seeds,
+        "weeks": args.weeks,
+        "python": platform.python_version(),
+        "weeks_generated": len(jobs),
+        "events": events,
+        "wall_seconds": round(wall_seconds, 6),
+        "weeks_per_second": round(len(jobs) / wall_seconds, 3) if wall_seconds else None,
+        "events_per_second": round(events / wall_seconds, 3) if wall_seconds else None,
+        "stage_timing": timer is not None,
+        "stages": stages,
+        "hot_functions": hot_functions,
+        "memory": {
+            "peak_kib": round((peak - baseline) / 1024, 3),
+            "retained_kib": round((retained - baseline) / 1024, 3),
+            "retained_bytes_per_event": round((retained - baseline) / per_event, 3),
+            "retained_blocks_per_event": round(retained_blocks / per_event, 3),
+        },
+    }
+
+
+def _print_profile(report: Dict[str, Any]) -> None:
+    label = f"{report['engine']} / {report['rig']}"
+    if report["archetype"]:
+        label += f" / {report['archetype']}"
+    print(f"Profile: {label}")
+    print(
+        f"Weeks: {report['weeks_generated']} ({report['seeds']} seeds x {report['weeks']} weeks), "
+        f"events: {report['events']}"
+    )
+    print(
+        f"Wall time: {report['wall_seconds']:.3f}s "
+        f"({report['weeks_per_second']} weeks/s, {report['events_per_second']} events/s)"
+    )
+
+    if not report["stage_timing"]:
+        print()
+        print(f"Stages: not recorded; {report['engine']} has no per-stage instrumentation")
+    elif report["stages"]:
+        print()
+        print("Stages (ms):")
+        for row in report["stages"]:
+            print(
+                f"  {row['stage']:<14} total={row['total_ms']:>10.3f} "
+                f"mean={row['mean_ms']:>8.3f} calls={row['calls']:>6} events={row['events']}"
+            )
+
+    print()
+    print("Hottest functions (ms):")
+    for row in report["hot_functions"]:
+        print(
+            f"  {row['tottime_ms']:>10.3f} {row['cumtime_ms']:>10.3f} "
+            f"{row['calls']:>8}  {row['function']}"
+        )
+
+    memory = report["memory"]
+    print()
+    print(
+        f"Memory: peak {memory['peak_kib']:.1f} KiB, retained {memory['retained_kib']:.1f} KiB "
+        f"({memory['retained_bytes_per_event']:.1f} bytes and "
+        f"{memory['retained_blocks_per_event']:.2f} blocks per event)"
+    )
+
+
+def _run_profile(args: argparse.Namespace) -> None:
+    report = profile_generation(args)
+    _print_profile(report)
+    if args.json is not None:
+        dump_json(report, args.json)
+        print(f"Profile saved to {args.json}")
+
+
+def _add_run_arguments(parser: argparse.ArgumentParser, *, defaults: bool) -> None:
+    """Add the engine/rig selection options shared by generation and ``profile``.
+
+    The ``profile`` subparser registers them with ``defaults=False`` so they are
+    suppressed unless given after the subcommand; that way options placed before
+    ``profile`` are not overwritten by the subparser's defaults.
+    """
+
+    def default(value: Any) -> Any:
+        return value if defaults else argparse.SUPPRESS
+
     parser.add_argument(
         "--engine",
         choices=["mk1", "mk2", "mk2_1"],
-        required=True,
-        help="Select which engine implementation to use",
+        default=default(None),
+        help="Select which engine implementation to use (required)",
     )
     parser.add_argument(
         "--rig",
         choices=["simple", "calendar", "workforce"],
-        required=True,
-        help="Choose the rig that wires dependencies for the engine",
+        default=default(None),
+        help="Choose the rig that wires dependencies for the engine (required)",
     )
     parser.add_argument(
         "--config",
         type=Path,
+        default=default(None),
         help="Configuration file for deterministic (mk1) generation",
     )
     parser.add_argument(
         "--archetype",
         choices=["office", "parent", "freelancer"],
-        default="office",
+        default=default("office"),
         help="Person profile archetype for workforce rigs",
     )
     parser.add_argument(
         "--seed",
         type=int,
-        default=42,
-        help="Random seed controlling stochastic variation",
+        default=default(42),
+        help="Random seed controlling stochastic variation (first seed when profiling)",
     )
     parser.add_argument(
         "--start-date",
         dest="start_date",
         type=str,
-        default=None,
-        help="Optional ISO start date for workforce schedules",
+        default=default(None),
+        help=(
+            "Optional ISO start date for workforce schedules "
+            f"(profiling defaults to {PROFILE_START_DATE.isoformat()})"
+        ),
+    )
+    parser.add_argument(
+        "--weeks",
+        type=int,
+        default=default(None),
+        help=(
+            f"Consecutive workforce weeks (default 1, or {PROFILE_WEEKS} per seed when "
+            "profiling a workforce rig); more than one streams a weeks array week by week"
+        ),
     )
     parser.add_argument(
         "--yearly-budget",
         dest="yearly_budget",
         type=Path,
-        default=None,
+        default=default(None),
         help="Optional path to a yearly budget JSON file",
     )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Unified Wyrd Engine CLI")
+    _add_run_arguments(parser, defaults=True)
     parser.add_argument(
         "--output",
         type=Path,
-        required=True,
-        help="Where to write the generated JSON output",
+        default=None,
+        help="Where to write the generated JSON output (required unless profiling)",
+    )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Write JSON without indentation",
+    )
+    parser.add_argument(
+        "--gzip",
+        action="store_true",
+        default=None,
+        help="Gzip the output (implied when the output path ends in .gz)",
+    )
+
+    commands = parser.add_subparsers(dest="command", title="commands")
+    profile = commands.add_parser(
+        "profile",
+        help="Profile an engine and rig over several seeds and weeks",
+        description="Profile an engine and rig over several seeds and weeks",
+    )
+    _add_run_arguments(profile, defaults=False)
+    profile.add_argument(
+        "--seeds",
+        type=int,
+        default=5,
+        help="Number of consecutive seeds to generate",
+    )
+    profile.add_argument(
+        "--top",
+        type=int,
+        default=20,
+        help="Number of hottest functions to report",
+    )
+    profile.add_argument(
+        "--sort",
+        choices=["tottime", "cumtime"],
+        default="tottime",
+        help="Rank functions by their own time or by cumulative time",
+    )
+    profile.add_argument(
+        "--json",
+        type=Path,
+        default=None,
+        help="Optional path to write the report as JSON",
     )
     return parser
 
 
-def main(argv: Optional[Sequence[str]] = None) -> None:
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    """Parse and validate *argv*, exiting with a usage error on bad combinations."""
+
     parser = build_parser()
     args = parser.parse_args(argv)
+    profiling = args.command == "profile"
+
+    if args.engine is None or args.rig is None:
+        parser.error("--engine and --rig are required")
+    if args.weeks is None:
+        args.weeks = PROFILE_WEEKS if profiling and args.rig != "simple" else 1
+    if args.weeks < 1:
+        parser.error("--weeks must be at least 1")
+    if profiling and args.seeds < 1:
+        parser.error("--seeds must be at least 1")
+    if not profiling and args.output is None:
+        parser.error("--output is required when generating a schedule")
 
     if args.rig == "simple":
         if args.engine != "mk1":
             parser.error("The simple rig requires the mk1 engine")
-        _run_simple(args)
-        return
+        if args.config is None:
+            parser.error("--config is required when using the simple rig")
+        if args.weeks != 1:
+            parser.error("--weeks is only supported by the calendar and workforce rigs")
+    elif args.engine not in {"mk2", "mk2_1"}:
+        parser.error(f"The {args.rig} rig requires an MK2-series engine (mk2 or mk2_1)")
+    return args
 
-    if args.rig in {"calendar", "workforce"}:
-        if args.engine not in {"mk2", "mk2_1"}:
-            parser.error(
-                f"The {args.rig} rig requires an MK2-series engine (mk2 or mk2_1)"
-            )
-        _run_workforce(args)
-        return
 
-    parser.error(f"Unsupported rig: {args.rig}")
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    args = parse_args(argv)
+    if args.command == "profile":
+        _run_profile(args)
+    elif args.rig == "simple":
+        _run_simple(args)
+    else:
+        _run_workforce(args)
 
 
 if __name__ == "__main__":
@@ -2,7 +2,12 @@
 
 __all__ = [
     "base",
+    "columnar",
     "engine_mk1",
     "engine_mk2",
+    "mk2_vectorized",
+    "placement",
+    "population",
+    "seeding",
     "web_adapter",
 ]
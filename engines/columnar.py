@@ -0,0 +1,162 @@
+"""Columnar storage for MK2 week results.
+
+A :class:`ColumnarWeek` keeps one row per event in typed :mod:`array` columns
+instead of one dictionary per event. Activity identities and day types are
+interned in :class:`CodeTable` instances that many weeks can share, so a large
+population only stores each activity name once.
+"""
+
+from __future__ import annotations
+
+import threading
+from array import array
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Any, Dict, Generic, Hashable, List, NamedTuple, TypeVar
+
+from models import DAY_NAMES
+
+__all__ = ["ActivityCode", "CodeTable", "ColumnarWeek"]
+
+KeyT = TypeVar("KeyT", bound=Hashable)
+
+
+class ActivityCode(NamedTuple):
+    """Shared identity of an activity as stored in a code table."""
+
+    name: str
+    waste_multiplier: float
+    optional: bool
+    priority: int
+
+
+class CodeTable(Generic[KeyT]):
+    """Thread-safe interning table mapping hashable keys to small integer codes."""
+
+    def __init__(self) -> None:
+        self._keys: List[KeyT] = []
+        self._codes: Dict[KeyT, int] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __getitem__(self, code: int) -> KeyT:
+        return self._keys[code]
+
+    def code(self, key: KeyT) -> int:
+        """Return the code for *key*, assigning the next free code if needed."""
+
+        code = self._codes.get(key)
+        if code is not None:
+            return code
+        with self._lock:
+            code = self._codes.get(key)
+            if code is None:
+                code = len(self._keys)
+                self._keys.append(key)
+                self._codes[key] = code
+        return code
+
+
+@dataclass
+class ColumnarWeek:
+    """Compact, column-oriented form of a ``generate_complete_week`` result.
+
+    Event columns are parallel arrays in engine order (by day, then start).
+    ``activity_code`` indexes :attr:`activities`; ``day_type_codes`` holds one
+    :attr:`day_types` code per day offset. :meth:`to_records` and
+    :meth:`to_result` rebuild the dictionary shapes on demand.
+    """
+
+    person: str
+    week_start: date
+    engine_version: str
+    activities: CodeTable[ActivityCode]
+    day_types: CodeTable[str]
+    day_type_codes: array = field(default_factory=lambda: array("B"))
+    day_index: array = field(default_factory=lambda: array("i"))
+    start_minutes: array = field(default_factory=lambda: array("i"))
+    end_minutes: array = field(default_factory=lambda: array("i"))
+    duration_minutes: array = field(default_factory=lambda: array("i"))
+    activity_code: array = field(default_factory=lambda: array("H"))
+    base_minutes: array = field(default_factory=lambda: array("i"))
+    actual_minutes: array = field(default_factory=lambda: array("i"))
+    issues: List[Dict[str, object]] = field(default_factory=list)
+    compression: Dict[str, Dict[str, object]] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.start_minutes)
+
+    def day_type(self, day_offset: int) -> str:
+        return self.day_types[self.day_type_codes[day_offset]]
+
+    def activity_name(self, index: int) -> str:
+        return self.activities[self.activity_code[index]].name
+
+    def summary_minutes(self) -> Dict[str, int]:
+        """Return total minutes per activity name."""
+
+        totals: Dict[str, int] = {}
+        for code, minutes in zip(self.activity_code, self.duration_minutes):
+            name = self.activities[code].name
+            totals[name] = totals.get(name, 0) + minutes
+        return totals
+
+    def summary_hours(self) -> Dict[str, float]:
+        return {name: round(minutes / 60, 2) for name, minutes in self.summary_minutes().items()}
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Return the events in the normalised MK2 dictionary shape."""
+
+        # Local import: engine_mk2 imports this module.
+        from .engine_mk2 import _EventRecord, _serialize_event_records
+
+        records: List[_EventRecord] = []
+        for index in range(len(self)):
+            day_offset = self.day_index[index]
+            event_date = self.week_start + timedelta(days=day_offset)
+            activity = self.activities[self.activity_code[index]]
+            records.append(
+                _EventRecord(
+                    date=event_date,
+                    day=DAY_NAMES[event_date.weekday()],
+                    day_index=day_offset,
+                    weekday_index=event_date.weekday(),
+                    start_minutes=self.start_minutes[index],
+                    end_minutes=self.end_minutes[index],
+                    activity=activity.name,
+                    activity_details={
+                        "base_duration_minutes": self.base_minutes[index],
+                        "waste_multiplier": activity.waste_multiplier,
+                        "optional": activity.optional,
+                        "priority": activity.priority,
+                        "actual_duration": self.actual_minutes[index],
+                    },
+                    day_type=self.day_type(day_offset),
+                )
+            )
+        return _serialize_event_records(records)
+
+    def to_result(self) -> Dict[str, object]:
+        """Return the full ``generate_complete_week`` dictionary."""
+
+        events = self.to_records()
+        metadata: Dict[str, Any] = {
+            "total_events": len(events),
+            "issue_count": len(self.issues),
+            "summary_hours": self.summary_hours(),
+            "compression": self.compression,
+            "day_types": {
+                (self.week_start + timedelta(days=offset)).isoformat(): self.day_type(offset)
+                for offset in range(len(self.day_type_codes))
+            },
+        }
+        metadata["engine_version"] = self.engine_version
+        return {
+            "person": self.person,
+            "week_start": self.week_start.isoformat(),
+            "events": events,
+            "issues": list(self.issues),
+            "metadata": metadata,
+        }
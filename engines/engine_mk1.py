@@ -2,16 +2,31 @@
 
 from __future__ import annotations
 
+import os
 import random
+import threading
+from bisect import bisect_right
+from collections import OrderedDict, deque
+from concurrent.futures import Executor, Future
 from dataclasses import dataclass, field
 from datetime import date, timedelta
-from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+from itertools import islice
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
 
+from modules.result_cache import fingerprint
+from modules.occupancy import DayOccupancy
 from modules.validation import assert_day_coverage
 
 from .base import ScheduleEngine, ScheduleInput, ScheduleOutput
-
-__all__ = ["EngineMK1", "load_character_config"]
+from .seeding import derive_seed
+
+__all__ = [
+    "CompiledCharacterConfig",
+    "EngineMK1",
+    "compile_character_config",
+    "load_character_config",
+    "week_rng",
+]
 
 
 DAY_NAMES = [
@@ -120,6 +135,9 @@ class MealConfig:
             ("dinner", self.dinner),
         )
 
+    def start_minutes(self) -> Sequence[Tuple[str, int]]:
+        return tuple((name, parse_time_to_minutes(value)) for name, value in self.items())
+
 
 @dataclass
 class ActivityConfig:
@@ -146,6 +164,73 @@ class CharacterConfig:
     activities: Sequence[ActivityConfig] = field(default_factory=list)
 
 
+@dataclass(frozen=True, slots=True)
+class CompiledSleep:
+    start_minutes: int
+    duration_minutes: int
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledWork:
+    start_minutes: int
+    duration_minutes: int
+    day_indices: Tuple[int, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledMeals:
+    meals: Tuple[Tuple[str, int], ...]
+
+    def start_minutes(self) -> Sequence[Tuple[str, int]]:
+        return self.meals
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledActivity:
+    name: str
+    start_minutes: int
+    duration_minutes: int
+    day_indices: Tuple[int, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledCharacterConfig:
+    """Immutable :class:`CharacterConfig` with every time and day index resolved.
+
+    Attribute names mirror the parsed config, so the ``add_*`` helpers accept
+    either form; build one with :func:`compile_character_config`.
+    """
+
+    name: str
+    sleep: CompiledSleep
+    work: Optional[CompiledWork]
+    meals: CompiledMeals
+    activities: Tuple[CompiledActivity, ...] = ()
+
+    @classmethod
+    def from_config(cls, config: CharacterConfig) -> "CompiledCharacterConfig":
+        work = config.work
+        return cls(
+            name=config.name,
+            sleep=CompiledSleep(config.sleep.start_minutes, config.sleep.duration_minutes),
+            work=(
+                CompiledWork(work.start_minutes, work.duration_minutes, tuple(work.day_indices))
+                if work
+                else None
+            ),
+            meals=CompiledMeals(tuple(config.meals.start_minutes())),
+            activities=tuple(
+                CompiledActivity(
+                    activity.name,
+                    activity.start_minutes,
+                    activity.duration_minutes,
+                    tuple(activity.day_indices),
+                )
+                for activity in config.activities
+            ),
+        )
+
+
 @dataclass
 class Event:
     date: date
@@ -171,23 +256,50 @@ class Event:
 
 
 class DaySchedule:
+    """Events of one day kept sorted by start, plus a minute-occupancy bitmap.
+
+    The unlabelled :class:`~modules.occupancy.DayOccupancy` answers overlap
+    tests with a single mask operation and yields the free gaps straight from
+    the bitmap, so placement never re-sorts or re-scans the day. Labels stay on the event list; :meth:`occupancy` builds a labelled
+    bitmap when one is needed.
+    """
+
     def __init__(self, day_index: int, day_date: date):
         self.day_index = day_index
         self.day_name = DAY_NAMES[day_index]
         self.date = day_date
         self._events: List[Tuple[int, int, str]] = []
+        self._starts: List[int] = []
+        self._occupancy = DayOccupancy(1440)
+
+    def copy(self, day_date: Optional[date] = None) -> "DaySchedule":
+        """Return an independent copy of the day, optionally moved to *day_date*."""
+
+        clone = DaySchedule(self.day_index, self.date if day_date is None else day_date)
+        clone._events = list(self._events)
+        clone._starts = list(self._starts)
+        clone._occupancy = self._occupancy.copy()
+        return clone
 
     def apply_micro_jitter(
         self,
         max_shift: int = 5,
         locked_activities: Optional[Sequence[str]] = None,
+        rng: Optional[random.Random] = None,
     ) -> None:
-        """Shift internal boundaries slightly to avoid rigid 15-minute grids."""
+        """Shift internal boundaries slightly to avoid rigid 15-minute grids.
+
+        Shifts are drawn from *rng*, or from the global :mod:`random` state
+        when no generator is given.
+        """
 
         if max_shift <= 0 or len(self._events) < 2:
             return
 
+        gauss = (rng or random).gauss
+
         locked = set(locked_activities or {"sleep", "work", "commute_in", "commute_out"})
+        full = self._occupancy.is_full()
         for index in range(len(self._events) - 1):
             start_a, end_a, activity_a = self._events[index]
             start_b, end_b, activity_b = self._events[index + 1]
@@ -200,7 +312,7 @@ class DaySchedule:
             if max_boundary <= min_boundary:
                 continue
 
-            shift = int(round(random.gauss(0.0, max_shift / 2)))
+            shift = int(round(gauss(0.0, max_shift / 2)))
             shift = max(-max_shift, min(max_shift, shift))
             new_boundary = end_a + shift
             new_boundary = max(min_boundary, min(max_boundary, new_boundary))
@@ -210,6 +322,11 @@ class DaySchedule:
 
             self._events[index] = (start_a, new_boundary, activity_a)
             self._events[index + 1] = (new_boundary, end_b, activity_b)
+            self._starts[index + 1] = new_boundary
+
+        if not full:
+            # Jitter before fill_free_time can close gaps between neighbours.
+            self._rebuild_occupancy()
 
     def add_event(self, start: int, end: int, activity: str) -> bool:
         """Attempt to add an event; return False if it would overlap."""
@@ -217,68 +334,60 @@ class DaySchedule:
         if start < 0 or end > 1440 or start >= end:
             raise ValueError("Invalid event boundaries")
 
-        for existing_start, existing_end, _ in self._events:
-            if not (end <= existing_start or start >= existing_end):
-                return False
+        if not self._occupancy.claim(start, end):
+            return False
 
-        self._events.append((start, end, activity))
-        self._events.sort(key=lambda item: item[0])
+        index = bisect_right(self._starts, start)
+        self._starts.insert(index, start)
+        self._events.insert(index, (start, end, activity))
         return True
 
     def find_slot(self, desired_start: int, duration: int) -> Optional[Tuple[int, int]]:
         """Find a free slot at or after *desired_start* that fits *duration*."""
 
-        free_segments = self.free_segments()
-        # Try to use a segment containing the desired start first
-        for start, end in free_segments:
-            if start <= desired_start and end - desired_start >= duration:
-                return desired_start, desired_start + duration
+        # Try to use the gap containing the desired start first
+        gap = self._occupancy.gap_at(desired_start)
+        if gap is not None and gap[1] - desired_start >= duration:
+            return desired_start, desired_start + duration
 
-        # Otherwise pick the first segment after the desired start
-        for start, end in free_segments:
-            if start >= desired_start and end - start >= duration:
-                return start, start + duration
+        # Otherwise pick the first gap after the desired start
+        gap = self._occupancy.first_fit_after(desired_start, duration)
+        if gap is not None:
+            return gap[0], gap[0] + duration
 
-        # Finally try earlier segments (place at the end of the gap)
-        for start, end in reversed(free_segments):
-            if end <= desired_start and end - start >= duration:
-                return end - duration, end
+        # Finally try earlier gaps (place at the end of the gap)
+        gap = self._occupancy.last_fit_before(desired_start, duration)
+        if gap is not None:
+            return gap[1] - duration, gap[1]
 
         return None
 
     def free_segments(self) -> List[Tuple[int, int]]:
         """Return a list of free time segments for the day."""
 
-        segments: List[Tuple[int, int]] = []
-        current = 0
-        for start, end, _ in sorted(self._events, key=lambda item: item[0]):
-            if current < start:
-                segments.append((current, start))
-            current = max(current, end)
-        if current < 1440:
-            segments.append((current, 1440))
-        return segments
+        return self._occupancy.gaps()
 
     def fill_free_time(self) -> None:
         """Fill remaining gaps with 'free time' events."""
 
-        additions = []
-        current = 0
+        for start, end in self._occupancy.gaps():
+            self.add_event(start, end, "free time")
+
+    def _rebuild_occupancy(self) -> None:
+        self._occupancy = DayOccupancy()
         for start, end, _ in self._events:
-            if current < start:
-                additions.append((current, start, "free time"))
-            current = end
-        if current < 1440:
-            additions.append((current, 1440, "free time"))
+            self._occupancy.occupy(start, end)
 
-        for start, end, activity in additions:
-            self._events.append((start, end, activity))
+    def occupancy(self) -> DayOccupancy:
+        """Return a labelled occupancy snapshot of the day's events."""
 
-        self._events.sort(key=lambda item: item[0])
+        return DayOccupancy.from_events(self._events)
 
     def validate(self) -> None:
         """Ensure that events cover the day without gaps or overlaps."""
 
+        # Check the emitted events: the bitmap is full after fill_free_time and
+        # cannot show overlaps introduced when boundaries move.
         assert_day_coverage(self.day_name, self._events)
 
     def to_events(self) -> List[Event]:
@@ -306,6 +415,40 @@ def load_character_config(data: Mapping[str, Any]) -> CharacterConfig:
     )
 
 
+_COMPILED_CACHE_SIZE = 256
+_compiled_configs: "OrderedDict[str, CompiledCharacterConfig]" = OrderedDict()
+_compiled_lock = threading.Lock()
+
+
+def compile_character_config(
+    data: Union[Mapping[str, Any], CharacterConfig, CompiledCharacterConfig],
+) -> CompiledCharacterConfig:
+    """Return the compiled form of *data*, reusing it for identical content.
+
+    Raw mappings and :class:`CharacterConfig` objects are keyed by a SHA-256
+    of their canonical JSON, so equal configurations compile once per process
+    (for the most recent :data:`_COMPILED_CACHE_SIZE` distinct contents) even
+    when they arrive as fresh dictionaries. Compiled configs pass through.
+    """
+
+    if isinstance(data, CompiledCharacterConfig):
+        return data
+    key = fingerprint(config=data)
+    with _compiled_lock:
+        cached = _compiled_configs.get(key)
+        if cached is not None:
+            _compiled_configs.move_to_end(key)
+            return cached
+    config = data if isinstance(data, CharacterConfig) else load_character_config(data)
+    compiled = CompiledCharacterConfig.from_config(config)
+    with _compiled_lock:
+        _compiled_configs[key] = compiled
+        _compiled_configs.move_to_end(key)
+        while len(_compiled_configs) > _COMPILED_CACHE_SIZE:
+            _compiled_configs.popitem(last=False)
+    return compiled
+
+
 def add_sleep(schedule: List[DaySchedule], config: SleepConfig) -> None:
     duration = config.duration_minutes
     for day_index in range(7):
@@ -349,9 +492,9 @@ def add_work(schedule: List[DaySchedule], config: Optional[WorkConfig]) -> None:
 
 def add_meals(schedule: List[DaySchedule], meals: MealConfig) -> None:
     duration = 30
+    meal_starts = meals.start_minutes()
     for day in schedule:
-        for meal_name, time_str in meals.items():
-            start = parse_time_to_minutes(time_str)
+        for meal_name, start in meal_starts:
             slot = day.find_slot(start, duration)
             if slot is None:
                 raise ValueError(f"Could not schedule {meal_name} on {day.day_name}")
@@ -372,26 +515,44 @@ def add_activities(schedule: List[DaySchedule], activities: Sequence[ActivityCon
             # Activity conflicts – skip as per MVP scope
 
 
-def finalise_schedule(schedule: List[DaySchedule]) -> None:
+def finalise_schedule(schedule: List[DaySchedule], rng: Optional[random.Random] = None) -> None:
     for day in schedule:
         day.fill_free_time()
-        day.apply_micro_jitter()
+        day.apply_micro_jitter(rng=rng)
         day.validate()
 
 
-def generate_schedule(
-    config: CharacterConfig,
-    start_date: Optional[date] = None,
-) -> Tuple[List[Event], Dict[str, float], Tuple[date, date]]:
-    start_date = start_date or get_week_start()
-    days = [DaySchedule(idx, start_date + timedelta(days=idx)) for idx in range(7)]
+def week_rng(seed: Optional[int], week: int = 0) -> Optional[random.Random]:
+    """Return the isolated jitter generator for *week* of a seeded run.
+
+    Returns ``None`` without a seed, which makes jitter fall back to the
+    global :mod:`random` state.
+    """
+
+    if seed is None:
+        return None
+    return random.Random(derive_seed(seed, "mk1-week", week))
+
+
+def build_base_week(
+    config: Union[CharacterConfig, CompiledCharacterConfig],
+    start_date: date,
+) -> List[DaySchedule]:
+    """Place every configured block and fill the remaining time, without jitter."""
 
+    days = [DaySchedule(idx, start_date + timedelta(days=idx)) for idx in range(7)]
     add_sleep(days, config.sleep)
     add_work(days, config.work)
     add_meals(days, config.meals)
     add_activities(days, config.activities)
-    finalise_schedule(days)
+    for day in days:
+        day.fill_free_time()
+    return days
 
+
+def _collect_week(
+    days: Sequence[DaySchedule],
+) -> Tuple[List[Event], Dict[str, float], Tuple[date, date]]:
     events: List[Event] = []
     totals: Dict[str, int] = {}
     for day in days:
@@ -405,25 +566,148 @@ def generate_schedule(
     return events, totals_hours, week_range
 
 
+def generate_schedule(
+    config: Union[CharacterConfig, CompiledCharacterConfig],
+    start_date: Optional[date] = None,
+    rng: Optional[random.Random] = None,
+) -> Tuple[List[Event], Dict[str, float], Tuple[date, date]]:
+    """Build one week for *config*, drawing micro jitter from *rng*.
+
+    Without *rng* the jitter uses the global :mod:`random` state.
+    """
+
+    start_date = start_date or get_week_start()
+    days = [DaySchedule(idx, start_date + timedelta(days=idx)) for idx in range(7)]
+
+    add_sleep(days, config.sleep)
+    add_work(days, config.work)
+    add_meals(days, config.meals)
+    add_activities(days, config.activities)
+    finalise_schedule(days, rng)
+
+    return _collect_week(days)
+
+
+def generate_weeks(
+    config: Union[CharacterConfig, CompiledCharacterConfig],
+    weeks: int,
+    start_date: Optional[date] = None,
+    seed: Optional[int] = None,
+) -> Iterator[Tuple[List[Event], Dict[str, float], Tuple[date, date]]]:
+    """Yield *weeks* consecutive MK1 weeks built from a single base week.
+
+    Only micro jitter differs between weeks, so the blocks are placed once
+    and every week re-dates a copy of that base and jitters it. With a
+    *seed*, week ``n`` draws from :func:`week_rng` and can be reproduced on
+    its own; without one, weeks draw from the global :mod:`random` state in
+    order. Either way the first week matches :func:`generate_schedule` with
+    the same generator.
+    """
+
+    if weeks < 0:
+        raise ValueError("weeks must not be negative")
+
+    start_date = start_date or get_week_start()
+    base = build_base_week(config, start_date)
+    for day in base:
+        day.validate()
+
+    for week in range(weeks):
+        rng = week_rng(seed, week)
+        offset = timedelta(weeks=week)
+        days = [day.copy(day.date + offset) for day in base]
+        for day in days:
+            # Jitter only moves boundaries shared by two adjacent events, so
+            # the validated base coverage carries over.
+            day.apply_micro_jitter(rng=rng)
+        yield _collect_week(days)
+
+
+_BatchJob = Tuple[CompiledCharacterConfig, date, Optional[int]]
+
+
+def _week_totals(days: Sequence[DaySchedule]) -> Dict[str, float]:
+    totals: Dict[str, int] = {}
+    for day in days:
+        for start, end, activity in day._events:
+            totals[activity] = totals.get(activity, 0) + end - start
+    return {activity: minutes / 60 for activity, minutes in totals.items()}
+
+
+def _generate_batch(jobs: Sequence[_BatchJob], include_events: bool) -> List[ScheduleOutput]:
+    """Generate one output per job, placing each distinct base week once.
+
+    Seeded jobs are fully deterministic, so repeats of the same seeded job
+    reuse its jittered week; every job still gets its own output object.
+    """
+
+    bases: Dict[Tuple[CompiledCharacterConfig, date], List[DaySchedule]] = {}
+    seeded: Dict[_BatchJob, List[DaySchedule]] = {}
+    outputs: List[ScheduleOutput] = []
+    for job in jobs:
+        config, start_date, seed = job
+        days = seeded.get(job) if seed is not None else None
+        if days is None:
+            base = bases.get((config, start_date))
+            if base is None:
+                base = bases[(config, start_date)] = build_base_week(config, start_date)
+            rng = week_rng(seed)
+            days = [day.copy() for day in base]
+            for day in days:
+                day.apply_micro_jitter(rng=rng)
+                day.validate()
+            if seed is not None:
+                seeded[job] = days
+
+        if include_events:
+            output = EngineMK1._output(config, *_collect_week(days))
+        else:
+            output = ScheduleOutput(
+                events=(),
+                totals=_week_totals(days),
+                diagnostics={
+                    "week_start": days[0].date,
+                    "week_end": days[-1].date,
+                    "character_name": config.name,
+                },
+            )
+        outputs.append(output)
+    return outputs
+
+
+def _chunked(items: Iterable[_BatchJob], size: int) -> Iterator[List[_BatchJob]]:
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
 class EngineMK1(ScheduleEngine):
-    """Schedule engine that implements the original MVP generator."""
+    """Schedule engine that implements the original MVP generator.
+
+    ``ScheduleInput.seed`` selects an isolated jitter generator per call (see
+    :func:`week_rng`), so seeded outputs are reproducible and independent of
+    other callers. Unseeded calls jitter from the global :mod:`random` state.
+    """
 
     def __init__(self, *, reference_start: Optional[date] = None):
         self._reference_start = reference_start
 
-    def generate(self, schedule_input: ScheduleInput) -> ScheduleOutput:
-        raw_constraints = schedule_input.constraints
-        if isinstance(raw_constraints, CharacterConfig):
-            config = raw_constraints
-        else:
-            config = load_character_config(raw_constraints)
-
+    def _start_date(self, schedule_input: ScheduleInput) -> Optional[date]:
         start_date: Optional[date] = schedule_input.metadata.get("start_date") if schedule_input.metadata else None
         if start_date is None:
             start_date = self._reference_start
-
-        events, totals, week_range = generate_schedule(config, start_date=start_date)
-
+        return start_date
+
+    @staticmethod
+    def _output(
+        config: CompiledCharacterConfig,
+        events: List[Event],
+        totals: Dict[str, float],
+        week_range: Tuple[date, date],
+    ) -> ScheduleOutput:
         event_payloads = [event.to_dict() for event in events]
         diagnostics: Dict[str, Any] = {
             "week_start": week_range[0],
@@ -437,3 +721,92 @@ class EngineMK1(ScheduleEngine):
             diagnostics=diagnostics,
         )
 
+    def generate(self, schedule_input: ScheduleInput) -> ScheduleOutput:
+        config = compile_character_config(schedule_input.constraints)
+        events, totals, week_range = generate_schedule(
+            config,
+            start_date=self._start_date(schedule_input),
+            rng=week_rng(schedule_input.seed),
+        )
+        return self._output(config, events, totals, week_range)
+
+    def generate_many(
+        self,
+        inputs: Iterable[ScheduleInput],
+        *,
+        workers: Optional[int] = None,
+        chunksize: int = 64,
+        max_pending: Optional[int] = None,
+        include_events: bool = True,
+    ) -> Iterator[ScheduleOutput]:
+        """Yield one output per input, in input order.
+
+        Configs are compiled through :func:`compile_character_config`, so
+        identical configs compile once, and within a chunk of *chunksize*
+        inputs each distinct (config, start date) pair places its base week
+        once; only the micro jitter is redone per input. Chunks run across a
+        :class:`ProcessPoolExecutor` with *workers* processes (defaulting to
+        the CPU count) with at most *max_pending* chunks (default
+        ``2 * workers``) in flight; ``workers=1`` generates in-process.
+
+        Seeded outputs equal :meth:`generate` for the same input regardless
+        of the worker count, and repeated seeded inputs within a chunk are
+        jittered once. With ``include_events=False`` outputs carry only totals
+        and diagnostics, skipping the per-event dictionaries entirely.
+        """
+
+        if chunksize <= 0:
+            raise ValueError("chunksize must be positive")
+
+        def jobs() -> Iterator[_BatchJob]:
+            fallback: Optional[date] = None
+            for schedule_input in inputs:
+                start_date = self._start_date(schedule_input)
+                if start_date is None:
+                    fallback = fallback or get_week_start()
+                    start_date = fallback
+                config = compile_character_config(schedule_input.constraints)
+                yield config, start_date, schedule_input.seed
+
+        worker_count = workers if workers is not None else (os.cpu_count() or 1)
+        if worker_count <= 1:
+            for chunk in _chunked(jobs(), chunksize):
+                yield from _generate_batch(chunk, include_events)
+            return
+
+        pending_limit = max_pending if max_pending is not None else worker_count * 2
+        pending_limit = max(1, pending_limit)
+
+        # Imported here so the Pyodide worker, which loads this module but has
+        # no process pools, never pulls in multiprocessing.
+        from concurrent.futures import ProcessPoolExecutor
+
+        executor: Executor = ProcessPoolExecutor(max_workers=worker_count)
+        pending: Deque[Future] = deque()
+        try:
+            for chunk in _chunked(jobs(), chunksize):
+                pending.append(executor.submit(_generate_batch, chunk, include_events))
+                if len(pending) >= pending_limit:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def generate_weeks(self, schedule_input: ScheduleInput, weeks: int) -> Iterator[ScheduleOutput]:
+        """Yield one output per week for *weeks* consecutive weeks.
+
+        The base week is placed once and reused; see :func:`generate_weeks`
+        for how ``schedule_input.seed`` drives the per-week jitter.
+        """
+
+        config = compile_character_config(schedule_input.constraints)
+        for events, totals, week_range in generate_weeks(
+            config,
+            weeks,
+            start_date=self._start_date(schedule_input),
+            seed=schedule_input.seed,
+        ):
+            yield self._output(config, events, totals, week_range)
@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
+import inspect
 import logging
 import random
+from contextlib import nullcontext
 from dataclasses import asdict, dataclass
 from datetime import date, timedelta
 from typing import (
     Any,
     Callable,
+    ContextManager,
     Dict,
     Iterable,
+    Iterator,
     List,
     Mapping,
     MutableMapping,
@@ -18,6 +22,7 @@ from typing import (
     Sequence,
     Set,
     Tuple,
+    Union,
 )
 
 from archetypes import (
@@ -28,8 +33,25 @@ from archetypes import (
     create_office_worker,
 )
 from modules.calendar_provider import CalendarProvider, default_calendar_provider
+from modules.date_context import DateContextIndex
+from .columnar import ActivityCode, CodeTable, ColumnarWeek
+from .placement import (
+    PLACEMENT_STRATEGIES,
+    TemplateSource,
+    compile_templates,
+    place_activities_in_gaps,
+)
+from .seeding import CounterStreams, RandomStreams, make_streams
 from modules.friction_model import generate_daily_friction
-from models import Activity, ActivityTemplate, Event, PersonProfile, DAY_NAMES
+from modules.instrumentation import StageHandle, StageTimer
+from models import (
+    Activity,
+    ActivityTemplate,
+    Event,
+    PersonProfile,
+    DAY_NAMES,
+    activity_prototype,
+)
 from modules.unique_events import UniqueDay, generate_unique_day_schedule
 from yearly_budget import YearlyBudget
 from modules.validation import validate_week
@@ -59,6 +81,121 @@ class DayPlan:
     target_minutes: Optional[Dict[str, int]] = None
 
 
+@dataclass(frozen=True)
+class _BudgetAllocation:
+    """Per-day minutes derived from a profile's weekly budget."""
+
+    sleep: int
+    work: int
+    social: int
+    chores: int
+    gym: int
+
+
+@dataclass
+class _WeekDraft:
+    """Scheduled week before it is rendered into an output format."""
+
+    profile: PersonProfile
+    start_date: date
+    plans: List[DayPlan]
+    day_events: List[List[Event]]
+    issues: List[Any]
+    compression: Dict[str, Dict[str, object]]
+    debug_trace: Optional[Dict[str, Any]] = None
+
+
+@dataclass
+class _EventRecord:
+    """Engine-generated event that is already in canonical form.
+
+    Records skip the alias probing of :func:`normalize_mk2_events` and are
+    rendered straight to the output shape by :func:`_serialize_event_records`.
+    """
+
+    date: date
+    day: str
+    day_index: int
+    weekday_index: int
+    start_minutes: int
+    end_minutes: int
+    activity: str
+    activity_details: Dict[str, object]
+    day_type: str
+
+    @classmethod
+    def from_event(
+        cls, event: Event, day_offset: int, event_date: date, day_type: str
+    ) -> "_EventRecord":
+        activity = event.activity
+        weekday_index = event_date.weekday()
+        return cls(
+            date=event.date,
+            day=event.day or DAY_NAMES[weekday_index],
+            day_index=day_offset,
+            weekday_index=weekday_index,
+            start_minutes=event.start_minutes,
+            end_minutes=event.end_minutes,
+            activity=activity.name,
+            activity_details={
+                "base_duration_minutes": activity.base_duration_minutes,
+                "waste_multiplier": activity.waste_multiplier,
+                "optional": activity.optional,
+                "priority": activity.priority,
+                "actual_duration": activity.actual_duration,
+            },
+            day_type=day_type,
+        )
+
+    def as_raw(self) -> Dict[str, Any]:
+        """Return the record as a raw payload for :func:`normalize_mk2_events`."""
+
+        return {
+            "date": self.date,
+            "day": self.day,
+            "day_index": self.day_index,
+            "weekday_index": self.weekday_index,
+            "start_minutes": self.start_minutes,
+            "end_minutes": self.end_minutes,
+            "duration_minutes": max(0, self.end_minutes - self.start_minutes),
+            "activity": self.activity,
+            "activity_details": self.activity_details,
+            "day_type": self.day_type,
+        }
+
+    def to_payload(self) -> Dict[str, Any]:
+        """Render a record with a positive span in the normalised event shape."""
+
+        start = self.start_minutes
+        end = self.end_minutes
+        offset = self.day_index * 1440
+        return {
+            "date": self.date.isoformat(),
+            "day": self.day,
+            "start": _format_minutes(start),
+            "end": _format_minutes(end) if end < 1440 else "00:00",
+            "activity": self.activity,
+            "duration_minutes": end - start,
+            "activity_details": self.activity_details,
+            "day_type": self.day_type,
+            "start_minutes": start,
+            "end_minutes": end,
+            "day_index": self.day_index,
+            "weekday_index": self.weekday_index,
+            "minute_range": [offset + start, offset + end],
+        }
+
+
+# Held here so the interned prototypes outlive any single week.
+_FREE_TIME = activity_prototype("free time", 1440, 1.0, optional=False, priority=5)
+_MEALS = tuple(
+    activity_prototype(meal_name, 30, 1.2, optional=False, priority=2)
+    for meal_name in ("breakfast", "lunch", "dinner")
+)
+
+# Shared sink for event counts when no stage timer is attached.
+_UNTIMED_STAGE = StageHandle()
+
 OUTDOOR_ACTIVITIES = {"outdoor_run", "bike_ride", "park_visit", "hiking", "outdoor_walk"}
 
 
@@ -73,9 +210,26 @@ def apply_special_period_effects(
 
 
 def apply_micro_jitter(
-    events: List[Event], max_shift: int = 5, locked_activities: Optional[Set[str]] = None
+    events: List[Event],
+    max_shift: int = 5,
+    locked_activities: Optional[Set[str]] = None,
+    rng: Optional[random.Random] = None,
 ) -> List[Event]:
-    return EngineMK2.apply_micro_jitter(events, max_shift=max_shift, locked_activities=locked_activities)
+    return EngineMK2.apply_micro_jitter(
+        events, max_shift=max_shift, locked_activities=locked_activities, rng=rng
+    )
+
+
+def _accepts_rng(func: Callable[..., object]) -> bool:
+    """Return True when *func* can be called with an ``rng`` keyword argument."""
+
+    try:
+        parameters = inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        return False
+    if "rng" in parameters:
+        return True
+    return any(param.kind is inspect.Parameter.VAR_KEYWORD for param in parameters.values())
 
 
 class EngineMK2:
@@ -91,6 +245,9 @@ class EngineMK2:
         ] = None,
         validator: Optional[Callable[[Dict[str, List[Activity]]], List[object]]] = None,
         engine_version: str = "mk2",
+        instrumentation: Optional[StageTimer] = None,
+        placement: str = "cursor",
+        date_context: Optional[DateContextIndex] = None,
     ) -> None:
         self._profile_factory = {
             "office": (create_office_worker, DEFAULT_TEMPLATES),
@@ -105,26 +262,94 @@ class EngineMK2:
             [PersonProfile, date, "UniqueDay"], Optional[List[Activity]]
         ]
         self._validator: Callable[[Dict[str, List[Activity]]], List[object]]
+        self._friction_accepts_rng = False
+        self._unique_accepts_rng = False
         self._engine_version = engine_version or "mk2"
+        self._instrumentation = instrumentation
+        self._date_context: Optional[DateContextIndex] = None
+        self._placement = "cursor"
+        self._placer: Callable[..., List[Event]] = self._place_activities_in_day
+        self._listeners: List[Callable[[], None]] = []
+        self.set_placement(placement)
         self.set_friction_generator(friction_generator or generate_daily_friction)
         self.set_unique_schedule_generator(
             unique_schedule_generator or generate_unique_day_schedule
         )
         self.set_validator(validator or validate_week)
+        self.set_date_context(date_context)
+
+    def __getstate__(self) -> Dict[str, object]:
+        # Listeners belong to the owning process (typically a rig's cache).
+        state = self.__dict__.copy()
+        state["_listeners"] = []
+        return state
 
     @property
     def engine_version(self) -> str:
         return self._engine_version
 
+    def add_listener(self, callback: Callable[[], None]) -> None:
+        """Call *callback* whenever a module or setting that shapes results is replaced."""
+
+        self._listeners.append(callback)
+
+    def _notify(self) -> None:
+        for callback in list(self._listeners):
+            callback()
+
+    @property
+    def calendar_provider(self) -> CalendarProvider:
+        return self._calendar_provider
+
     def set_calendar_provider(self, provider: CalendarProvider) -> None:
-        """Replace the calendar provider used by the engine."""
+        """Replace the calendar provider used by the engine.
+
+        A date context built from a different provider is dropped.
+        """
 
         self._calendar_provider = provider
+        if self._date_context is not None and self._date_context.provider is not provider:
+            self._date_context = None
+        self._notify()
+
+    @property
+    def date_context(self) -> Optional[DateContextIndex]:
+        return self._date_context
+
+    def set_date_context(self, index: Optional[DateContextIndex]) -> None:
+        """Serve calendar lookups from a precomputed *index*; ``None`` disables it.
+
+        The index must have been built from this engine's calendar provider.
+        """
+
+        if index is not None and index.provider is not self._calendar_provider:
+            raise ValueError("date context was built for a different calendar provider")
+        self._date_context = index
+
+    @property
+    def _calendar(self) -> Union[CalendarProvider, DateContextIndex]:
+        """Source for day types and seasonal/special-period lookups."""
+
+        if self._date_context is not None:
+            return self._date_context
+        return self._calendar_provider
+
+    @property
+    def friction_generator(self) -> Callable[[int, float, float], float]:
+        return self._friction_generator
 
     def set_friction_generator(
         self, generator: Optional[Callable[[int, float, float], float]]
     ) -> None:
         self._friction_generator = generator or generate_daily_friction
+        self._friction_accepts_rng = _accepts_rng(self._friction_generator)
+        self._notify()
+
+    @property
+    def unique_schedule_generator(
+        self,
+    ) -> Callable[[PersonProfile, date, "UniqueDay"], Optional[List[Activity]]]:
+        return self._unique_schedule_generator
 
     def set_unique_schedule_generator(
         self,
@@ -135,11 +360,54 @@ class EngineMK2:
         self._unique_schedule_generator = (
             generator or generate_unique_day_schedule
         )
+        self._unique_accepts_rng = _accepts_rng(self._unique_schedule_generator)
+        self._notify()
+
+    @property
+    def validator(self) -> Callable[[Dict[str, List[Activity]]], List[object]]:
+        return self._validator
 
     def set_validator(
         self, validator: Optional[Callable[[Dict[str, List[Activity]]], List[object]]]
     ) -> None:
         self._validator = validator or validate_week
+        self._notify()
+
+    @property
+    def placement(self) -> str:
+        return self._placement
+
+    def set_placement(self, strategy: str) -> None:
+        """Choose how activities are placed: ``"cursor"`` (default) or ``"gap"``.
+
+        ``gap`` uses :func:`engines.placement.place_activities_in_gaps`, which
+        puts each activity in the free gap nearest its preferred start.
+        """
+
+        if strategy not in PLACEMENT_STRATEGIES:
+            raise ValueError(
+                f"Unknown placement strategy {strategy!r}; expected one of {PLACEMENT_STRATEGIES}"
+            )
+        self._placement = strategy
+        self._placer = (
+            place_activities_in_gaps if strategy == "gap" else self._place_activities_in_day
+        )
+        self._notify()
+
+    @property
+    def instrumentation(self) -> Optional[StageTimer]:
+        return self._instrumentation
+
+    def set_instrumentation(self, timer: Optional[StageTimer]) -> None:
+        """Record per-stage timings into *timer*; ``None`` disables timing."""
+
+        self._instrumentation = timer
+
+    def _stage(self, name: str) -> ContextManager[StageHandle]:
+        timer = self._instrumentation
+        if timer is None:
+            return nullcontext(_UNTIMED_STAGE)
+        return timer.stage(name)
 
     # ------------------------------------------------------------------
     # Workforce allocation helpers
@@ -168,6 +436,17 @@ class EngineMK2:
 
         return max(1, int(round(per_day_minutes)))
 
+    @classmethod
+    def _allocate_budget(cls, profile: PersonProfile) -> _BudgetAllocation:
+        budget = profile.budget
+        return _BudgetAllocation(
+            sleep=cls._allocate_minutes(budget.sleep_hours, 7),
+            work=cls._allocate_minutes(budget.work_hours, 5),
+            social=cls._allocate_minutes(budget.social_hours, 2),
+            chores=cls._allocate_minutes(budget.chores_hours, 2),
+            gym=cls._allocate_minutes(budget.gym_hours, 3),
+        )
+
     def _generate_standard_day_schedule(
         self,
         weekday_index: int,
@@ -177,7 +456,9 @@ class EngineMK2:
         social_minutes: int,
         chores_minutes: int,
         gym_minutes: int,
+        rng: Optional[random.Random] = None,
     ) -> List[Activity]:
+        rng = rng or random
         activities: List[Activity] = []
 
         def add_activity(
@@ -192,8 +473,7 @@ class EngineMK2:
             activities.append(Activity(name, base_minutes, waste_multiplier, optional, priority))
 
         add_activity("sleep", sleep_minutes, 1.0, optional=False, priority=1)
-        for meal_name in ("breakfast", "lunch", "dinner"):
-            add_activity(meal_name, 30, 1.2, optional=False, priority=2)
+        activities.extend(meal.instantiate() for meal in _MEALS)
 
         effective_work_minutes = work_minutes if weekday_index < 5 else 0
         if day_type == "bridge_day":
@@ -201,13 +481,13 @@ class EngineMK2:
         if effective_work_minutes > 0 and weekday_index < 5:
             add_activity("work", effective_work_minutes, 1.1, optional=False, priority=2)
 
-        if gym_minutes > 0 and weekday_index in (0, 2, 4) and random.random() < 0.85:
+        if gym_minutes > 0 and weekday_index in (0, 2, 4) and rng.random() < 0.85:
             add_activity("gym", gym_minutes, 1.4, optional=True, priority=4)
 
-        if social_minutes > 0 and weekday_index >= 5 and random.random() < 0.7:
+        if social_minutes > 0 and weekday_index >= 5 and rng.random() < 0.7:
             add_activity("social", social_minutes, 1.3, optional=True, priority=4)
 
-        if chores_minutes > 0 and weekday_index in (5, 6) and random.random() < 0.6:
+        if chores_minutes > 0 and weekday_index in (5, 6) and rng.random() < 0.6:
             add_activity("chores", chores_minutes, 1.2, optional=True, priority=3)
 
         return activities
@@ -290,109 +570,138 @@ class EngineMK2:
         profile: PersonProfile,
         start_date: date,
         yearly_budget: Optional[YearlyBudget] = None,
+        rng: Optional[random.Random] = None,
+        allocation: Optional[_BudgetAllocation] = None,
+        streams: Optional[RandomStreams] = None,
     ) -> List[DayPlan]:
-        sleep_minutes = self._allocate_minutes(profile.budget.sleep_hours, 7)
-        work_minutes = self._allocate_minutes(profile.budget.work_hours, 5)
-        social_minutes = self._allocate_minutes(profile.budget.social_hours, 2)
-        chores_minutes = self._allocate_minutes(profile.budget.chores_hours, 2)
-        gym_minutes = self._allocate_minutes(profile.budget.gym_hours, 3)
+        if allocation is None:
+            allocation = self._allocate_budget(profile)
 
         week_schedule: List[DayPlan] = []
 
         for day_offset in range(7):
             current_date = start_date + timedelta(days=day_offset)
-            day_name = current_date.strftime("%A").lower()
-            weekday_index = current_date.weekday()
-            daily_friction = self._friction_generator(
-                weekday_index, profile.base_waste_factor, profile.friction_variance
+            day_rng = streams.stream(current_date, "planning") if streams is not None else rng
+            unique_day = yearly_budget.get_day_type(current_date) if yearly_budget else None
+            week_schedule.append(
+                self._plan_day(profile, current_date, allocation, unique_day, day_rng)
             )
 
-            logger.debug(
-                "[SLEEP-DEBUG] level=budget profile=%s day=%s minutes=%s weekly_hours=%s",
-                profile.name,
-                day_name,
-                sleep_minutes,
-                profile.budget.sleep_hours,
-            )
+        return week_schedule
 
-            unique_day: Optional[UniqueDay] = None
-            if yearly_budget:
-                unique_day = yearly_budget.get_day_type(current_date)
+    def _plan_day(
+        self,
+        profile: PersonProfile,
+        current_date: date,
+        allocation: _BudgetAllocation,
+        unique_day: Optional[UniqueDay],
+        rng: Optional[random.Random],
+    ) -> DayPlan:
+        day_name = current_date.strftime("%A").lower()
+        weekday_index = current_date.weekday()
+        daily_friction = self._draw_friction(
+            weekday_index, profile.base_waste_factor, profile.friction_variance, rng
+        )
 
-            if unique_day:
-                unique_schedule = self._unique_schedule_generator(
-                    profile, current_date, unique_day
+        logger.debug(
+            "[SLEEP-DEBUG] level=budget profile=%s day=%s minutes=%s weekly_hours=%s",
+            profile.name,
+            day_name,
+            allocation.sleep,
+            profile.budget.sleep_hours,
+        )
+
+        if unique_day:
+            unique_schedule = self._build_unique_schedule(
+                profile, current_date, unique_day, rng
+            )
+            activities: List[Activity]
+            day_type: str
+            if unique_schedule is not None:
+                activities = unique_schedule
+                day_type = unique_day.day_type
+            else:
+                day_type = self._calendar.classify_day(current_date, profile.country)
+                activities = self._generate_standard_day_schedule(
+                    weekday_index,
+                    day_type,
+                    allocation.sleep,
+                    allocation.work,
+                    allocation.social,
+                    allocation.chores,
+                    allocation.gym,
+                    rng=rng,
+                )
+        else:
+            day_type = self._calendar.classify_day(current_date, profile.country)
+            if day_type == "public_holiday":
+                activities = self._calendar_provider.generate_holiday_schedule(
+                    profile, current_date
                 )
-                activities: List[Activity]
-                day_type: str
-                if unique_schedule is not None:
-                    activities = unique_schedule
-                    day_type = unique_day.day_type
-                else:
-                    day_type = self._calendar_provider.classify_day(
-                        current_date, profile.country
-                    )
-                    activities = self._generate_standard_day_schedule(
-                        weekday_index,
-                        day_type,
-                        sleep_minutes,
-                        work_minutes,
-                        social_minutes,
-                        chores_minutes,
-                        gym_minutes,
-                    )
             else:
-                day_type = self._calendar_provider.classify_day(
-                    current_date, profile.country
+                activities = self._generate_standard_day_schedule(
+                    weekday_index,
+                    day_type,
+                    allocation.sleep,
+                    allocation.work,
+                    allocation.social,
+                    allocation.chores,
+                    allocation.gym,
+                    rng=rng,
                 )
-                if day_type == "public_holiday":
-                    activities = self._calendar_provider.generate_holiday_schedule(
-                        profile, current_date
-                    )
-                else:
-                    activities = self._generate_standard_day_schedule(
-                        weekday_index,
-                        day_type,
-                        sleep_minutes,
-                        work_minutes,
-                        social_minutes,
-                        chores_minutes,
-                        gym_minutes,
-                    )
-
-            seasonal = self._calendar_provider.get_seasonal_modifiers(current_date)
-            self.apply_seasonal_modifiers(activities, seasonal)
 
-            special = self._calendar_provider.get_special_period_effects(current_date)
-            activities = self.apply_special_period_effects(activities, special)
+        calendar = self._calendar
+        seasonal = calendar.get_seasonal_modifiers(current_date)
+        self.apply_seasonal_modifiers(activities, seasonal)
 
-            target_minutes: Dict[str, int] = {}
-            for activity in activities:
-                target_minutes[activity.name] = target_minutes.get(activity.name, 0) + activity.base_duration_minutes
+        special = calendar.get_special_period_effects(current_date)
+        activities = self.apply_special_period_effects(activities, special)
 
-            for activity in activities:
-                self._apply_friction(activity, daily_friction)
-                if activity.name == "sleep":
-                    logger.debug(
-                        "[SLEEP-DEBUG] level=activity profile=%s day=%s base=%s actual=%s",
-                        profile.name,
-                        day_name,
-                        activity.base_duration_minutes,
-                        activity.actual_duration,
-                    )
+        target_minutes: Dict[str, int] = {}
+        for activity in activities:
+            target_minutes[activity.name] = target_minutes.get(activity.name, 0) + activity.base_duration_minutes
 
-            week_schedule.append(
-                DayPlan(
-                    current_date,
+        for activity in activities:
+            self._apply_friction(activity, daily_friction)
+            if activity.name == "sleep":
+                logger.debug(
+                    "[SLEEP-DEBUG] level=activity profile=%s day=%s base=%s actual=%s",
+                    profile.name,
                     day_name,
-                    day_type,
-                    activities,
-                    friction=daily_friction,
-                    target_minutes=target_minutes,
+                    activity.base_duration_minutes,
+                    activity.actual_duration,
                 )
-            )
 
-        return week_schedule
+        return DayPlan(
+            current_date,
+            day_name,
+            day_type,
+            activities,
+            friction=daily_friction,
+            target_minutes=target_minutes,
+        )
+
+    def _draw_friction(
+        self,
+        weekday_index: int,
+        base_factor: float,
+        variance: float,
+        rng: Optional[random.Random],
+    ) -> float:
+        if rng is not None and self._friction_accepts_rng:
+            return self._friction_generator(weekday_index, base_factor, variance, rng=rng)
+        return self._friction_generator(weekday_index, base_factor, variance)
+
+    def _build_unique_schedule(
+        self,
+        profile: PersonProfile,
+        current_date: date,
+        unique_day: UniqueDay,
+        rng: Optional[random.Random],
+    ) -> Optional[List[Activity]]:
+        if rng is not None and self._unique_accepts_rng:
+            return self._unique_schedule_generator(profile, current_date, unique_day, rng=rng)
+        return self._unique_schedule_generator(profile, current_date, unique_day)
 
     @staticmethod
     def _compress_day_if_needed(
@@ -438,22 +747,21 @@ class EngineMK2:
         day_index: int,
         day_name: str,
         activities: List[Activity],
-        templates: Dict[str, ActivityTemplate],
+        templates: TemplateSource,
+        rng: Optional[random.Random] = None,
     ) -> List[Event]:
+        rng = rng or random
+        table = compile_templates(templates)
+        entries = table.entries
         events: List[Event] = []
         current_time = 0
-        fallback_template = ActivityTemplate("fallback", 12, 0)
-
-        sorted_activities = sorted(
-            activities,
-            key=lambda act: templates.get(act.name, fallback_template).preferred_start_hour,
-        )
 
-        for activity in sorted_activities:
-            template = templates.get(activity.name)
-            if template and (template.valid_days is None or day_index in template.valid_days):
-                jitter = random.randint(-template.flexibility_minutes, template.flexibility_minutes)
-                start = max(0, template.preferred_start_hour * 60 + jitter)
+        for activity in sorted(activities, key=lambda act: table.start_hour(act.name)):
+            entry = entries.get(activity.name)
+            if entry is not None and entry.valid_days_mask >> day_index & 1:
+                flexibility = entry.flexibility_minutes
+                jitter = rng.randint(-flexibility, flexibility)
+                start = max(0, entry.preferred_start_minutes + jitter)
             else:
                 start = current_time
 
@@ -481,7 +789,7 @@ class EngineMK2:
                     day="",
                     start_minutes=0,
                     end_minutes=1440,
-                    activity=Activity("free time", 1440, 1.0, optional=False, priority=5),
+                    activity=_FREE_TIME.instantiate(),
                 )
             ]
 
@@ -489,15 +797,13 @@ class EngineMK2:
         current = 0
         for event in sorted(events, key=lambda evt: evt.start_minutes):
             if current < event.start_minutes:
-                gap_activity = Activity(
-                    "free time", event.start_minutes - current, 1.0, optional=False, priority=5
-                )
+                gap_activity = _FREE_TIME.instantiate(event.start_minutes - current)
                 filled.append(Event(event.date, event.day, current, event.start_minutes, gap_activity))
             filled.append(event)
             current = event.end_minutes
 
         if current < 1440:
-            gap_activity = Activity("free time", 1440 - current, 1.0, optional=False, priority=5)
+            gap_activity = _FREE_TIME.instantiate(1440 - current)
             filled.append(Event(events[-1].date, events[-1].day, current, 1440, gap_activity))
 
         return filled
@@ -507,10 +813,12 @@ class EngineMK2:
         events: List[Event],
         max_shift: int = 5,
         locked_activities: Optional[Set[str]] = None,
+        rng: Optional[random.Random] = None,
     ) -> List[Event]:
         if max_shift <= 0 or len(events) < 2:
             return events
 
+        rng = rng or random
         locked = set(locked_activities or {"sleep", "work", "commute_in", "commute_out"})
         sorted_events = sorted(events, key=lambda evt: evt.start_minutes)
 
@@ -526,7 +834,7 @@ class EngineMK2:
             if max_boundary <= min_boundary:
                 continue
 
-            shift = int(round(random.gauss(0.0, max_shift / 2)))
+            shift = int(round(rng.gauss(0.0, max_shift / 2)))
             shift = max(-max_shift, min(max_shift, shift))
             new_boundary = current.end_minutes + shift
             new_boundary = max(min_boundary, min(max_boundary, new_boundary))
@@ -559,14 +867,308 @@ class EngineMK2:
         templates: Optional[Dict[str, ActivityTemplate]] = None,
         yearly_budget: Optional[YearlyBudget] = None,
         debug: bool = False,
+        *,
+        rng: Optional[random.Random] = None,
+        seeding: str = "sequential",
+        person_id: Optional[str] = None,
     ) -> Dict[str, object]:
-        random.seed(week_seed)
-        templates = templates or DEFAULT_TEMPLATES
+        """Generate a complete timed schedule for the week starting at *start_date*.
+
+        All randomness is drawn from a private :class:`random.Random` seeded with
+        *week_seed*, so concurrent calls never share state and a given seed
+        always reproduces the same week. Pass *rng* to supply the random source
+        explicitly; *week_seed* is then ignored.
+
+        With ``seeding="counter"`` every day draws from generators derived from
+        (*week_seed*, *person_id*, date, stage) instead, so a day's schedule no
+        longer depends on the days generated before it. *person_id* defaults to
+        the profile name.
+        """
+
+        streams = make_streams(seeding, week_seed, person_id or profile.name, rng)
+        return self._generate_week(
+            profile,
+            start_date,
+            streams,
+            templates or DEFAULT_TEMPLATES,
+            yearly_budget,
+            debug,
+            self._allocate_budget(profile),
+        )
+
+    def generate_range(
+        self,
+        profile: PersonProfile,
+        start_date: date,
+        end_date: date,
+        seed: int,
+        templates: Optional[Dict[str, ActivityTemplate]] = None,
+        yearly_budget: Optional[YearlyBudget] = None,
+        debug: bool = False,
+        *,
+        rng: Optional[random.Random] = None,
+        seeding: str = "sequential",
+        person_id: Optional[str] = None,
+    ) -> Iterator[Dict[str, object]]:
+        """Lazily yield consecutive week results from *start_date* through *end_date*.
+
+        Budget allocations and template resolution happen once for the whole
+        run, and a single random stream seeded with *seed* is carried from one
+        week to the next. Weeks are always generated in full, so the final week
+        may extend past *end_date*. Each yielded dict has the same shape as
+        :meth:`generate_complete_week`; *seeding* and *person_id* behave as
+        they do there.
+        """
+
+        if end_date < start_date:
+            raise ValueError("end_date must not be before start_date")
+
+        streams = make_streams(seeding, seed, person_id or profile.name, rng)
+        resolved_templates = templates or DEFAULT_TEMPLATES
+        allocation = self._allocate_budget(profile)
+
+        week_start = start_date
+        while week_start <= end_date:
+            yield self._generate_week(
+                profile,
+                week_start,
+                streams,
+                resolved_templates,
+                yearly_budget,
+                debug,
+                allocation,
+            )
+            week_start += timedelta(days=7)
+
+    def iter_events(
+        self,
+        profile: PersonProfile,
+        start_date: date,
+        days: int,
+        seed: int,
+        templates: Optional[Dict[str, ActivityTemplate]] = None,
+        yearly_budget: Optional[YearlyBudget] = None,
+        *,
+        rng: Optional[random.Random] = None,
+        seeding: str = "sequential",
+        person_id: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Lazily yield normalised events for *days* consecutive days.
+
+        Each day is planned, compressed, placed and serialised on its own and
+        only that day's plan is alive while its events are yielded, so memory
+        stays flat however long the horizon is. Validation, summaries and
+        compression metadata are skipped. ``day_index`` and ``minute_range``
+        count from *start_date*.
+
+        With ``seeding="counter"`` the events of each day match the same day
+        of a counter-seeded :meth:`generate_complete_week`. Sequential seeding
+        draws a day's planning and placement back to back, so it does not
+        reproduce the week API's stream order.
+        """
+
+        if days < 0:
+            raise ValueError("days must not be negative")
+
+        streams = make_streams(seeding, seed, person_id or profile.name, rng)
+        template_table = compile_templates(templates or DEFAULT_TEMPLATES)
+        allocation = self._allocate_budget(profile)
+
+        for day_offset in range(days):
+            current_date = start_date + timedelta(days=day_offset)
+            unique_day = yearly_budget.get_day_type(current_date) if yearly_budget else None
+            with self._stage("planning") as stage:
+                plan = self._plan_day(
+                    profile,
+                    current_date,
+                    allocation,
+                    unique_day,
+                    streams.stream(current_date, "planning"),
+                )
+                stage.events = len(plan.activities)
+            with self._stage("compression") as stage:
+                plan.activities, _ = self._compress_day_if_needed(plan.activities)
+                stage.events = len(plan.activities)
+            events = self._schedule_day(plan, template_table, streams)
+            with self._stage("normalization") as stage:
+                day_payload = _serialize_event_records(
+                    _EventRecord.from_event(event, day_offset, current_date, plan.day_type)
+                    for event in events
+                )
+                stage.events = len(day_payload)
+            del plan, events
+            yield from day_payload
+
+    def generate_columnar_week(
+        self,
+        profile: PersonProfile,
+        start_date: date,
+        week_seed: int,
+        templates: Optional[Dict[str, ActivityTemplate]] = None,
+        yearly_budget: Optional[YearlyBudget] = None,
+        *,
+        activities: Optional[CodeTable[ActivityCode]] = None,
+        day_types: Optional[CodeTable[str]] = None,
+        rng: Optional[random.Random] = None,
+        seeding: str = "sequential",
+        person_id: Optional[str] = None,
+    ) -> ColumnarWeek:
+        """Generate a week like :meth:`generate_complete_week` in columnar form.
+
+        The same seed draws the same schedule; only the output representation
+        differs. Pass shared *activities* and *day_types* code tables to intern
+        activity identities once across many weeks.
+        """
+
+        streams = make_streams(seeding, week_seed, person_id or profile.name, rng)
+        draft = self._draft_week(
+            profile,
+            start_date,
+            streams,
+            templates or DEFAULT_TEMPLATES,
+            yearly_budget,
+            False,
+            self._allocate_budget(profile),
+        )
+        with self._stage("columnar") as stage:
+            week = self._finish_columnar(
+                draft,
+                activities if activities is not None else CodeTable(),
+                day_types if day_types is not None else CodeTable(),
+            )
+            stage.events = len(week)
+        return week
+
+    def regenerate_day(
+        self,
+        result: Mapping[str, Any],
+        profile: PersonProfile,
+        day: date,
+        seed: int,
+        templates: Optional[Dict[str, ActivityTemplate]] = None,
+        yearly_budget: Optional[YearlyBudget] = None,
+        *,
+        unique_day: Optional[UniqueDay] = None,
+        person_id: Optional[str] = None,
+    ) -> Dict[str, object]:
+        """Return a copy of week *result* with only *day* regenerated.
+
+        Planning, validation, compression, placement and jitter run for *day*
+        alone; the events and issues of the other days are carried over. The
+        day draws from counter-seeded streams, so it matches the same day of a
+        ``seeding="counter"`` week with the same *seed* and *person_id*.
+
+        *unique_day* overrides the *yearly_budget* entry for *day*. Week-level
+        issues are kept as they were and any ``debug_trace`` is dropped.
+        """
+
+        week_start = date.fromisoformat(str(result["week_start"]))
+        day_offset = (day - week_start).days
+        if not 0 <= day_offset < 7:
+            raise ValueError(
+                f"{day.isoformat()} is outside the week starting {week_start.isoformat()}"
+            )
+        if unique_day is None and yearly_budget:
+            unique_day = yearly_budget.get_day_type(day)
+
+        streams = CounterStreams(seed, person_id or profile.name)
+        with self._stage("planning") as stage:
+            plan = self._plan_day(
+                profile,
+                day,
+                self._allocate_budget(profile),
+                unique_day,
+                streams.stream(day, "planning"),
+            )
+            stage.events = len(plan.activities)
+        label = f"{plan.day_name} ({day.isoformat()})"
+        with self._stage("validation") as stage:
+            day_issues = [
+                asdict(issue)
+                for issue in self._validator({label: plan.activities})
+                if issue.day == label
+            ]
+            stage.events = len(day_issues)
+        with self._stage("compression") as stage:
+            plan.activities, compression = self._compress_day_if_needed(plan.activities)
+            stage.events = len(plan.activities)
+
+        events = self._schedule_day(plan, templates or DEFAULT_TEMPLATES, streams)
+        with self._stage("normalization") as stage:
+            day_payload = _serialize_event_records(
+                _EventRecord.from_event(event, day_offset, day, plan.day_type)
+                for event in events
+            )
+            stage.events = len(day_payload)
+
+        day_iso = day.isoformat()
+        events_payload = [
+            event for event in result.get("events", []) if event.get("date") != day_iso
+        ]
+        events_payload.extend(day_payload)
+        events_payload.sort(key=_event_sort_key)
 
-        week_plans = self._generate_week_activities(profile, start_date, yearly_budget)
-        issues = self._validator(
-            {f"{plan.day_name} ({plan.date.isoformat()})": plan.activities for plan in week_plans}
+        issues = [issue for issue in result.get("issues", []) if issue.get("day") != label]
+        position = next(
+            (index for index, issue in enumerate(issues) if _issue_follows(issue, day)),
+            len(issues),
         )
+        issues[position:position] = day_issues
+
+        metadata: Dict[str, Any] = dict(result.get("metadata", {}))
+        with self._stage("summary") as stage:
+            metadata["summary_hours"] = self._generate_summary(events_payload)
+            stage.events = len(events_payload)
+        metadata["total_events"] = len(events_payload)
+        metadata["issue_count"] = len(issues)
+        metadata["compression"] = {**metadata.get("compression", {}), day_iso: compression}
+        metadata["day_types"] = {**metadata.get("day_types", {}), day_iso: plan.day_type}
+
+        patched: Dict[str, Any] = dict(result)
+        patched.pop("debug_trace", None)
+        patched["events"] = events_payload
+        patched["issues"] = issues
+        patched["metadata"] = metadata
+        return patched
+
+    def _generate_week(
+        self,
+        profile: PersonProfile,
+        start_date: date,
+        streams: RandomStreams,
+        templates: Dict[str, ActivityTemplate],
+        yearly_budget: Optional[YearlyBudget],
+        debug: bool,
+        allocation: _BudgetAllocation,
+    ) -> Dict[str, object]:
+        draft = self._draft_week(
+            profile, start_date, streams, templates, yearly_budget, debug, allocation
+        )
+        return self._finish_week(draft)
+
+    def _draft_week(
+        self,
+        profile: PersonProfile,
+        start_date: date,
+        streams: RandomStreams,
+        templates: Dict[str, ActivityTemplate],
+        yearly_budget: Optional[YearlyBudget],
+        debug: bool,
+        allocation: _BudgetAllocation,
+    ) -> _WeekDraft:
+        with self._stage("planning") as stage:
+            week_plans = self._generate_week_activities(
+                profile, start_date, yearly_budget, allocation=allocation, streams=streams
+            )
+            stage.events = sum(len(plan.activities) for plan in week_plans)
+        with self._stage("validation") as stage:
+            issues = self._validator(
+                {
+                    f"{plan.day_name} ({plan.date.isoformat()})": plan.activities
+                    for plan in week_plans
+                }
+            )
+            stage.events = len(issues)
 
         debug_trace: Optional[Dict[str, Any]] = None
         debug_days: Dict[str, Dict[str, Any]] = {}
@@ -596,7 +1198,9 @@ class EngineMK2:
 
         compression_metadata: Dict[str, Dict[str, object]] = {}
         for plan in week_plans:
-            compressed, metadata = self._compress_day_if_needed(plan.activities)
+            with self._stage("compression") as stage:
+                compressed, metadata = self._compress_day_if_needed(plan.activities)
+                stage.events = len(compressed)
             plan.activities = compressed
             compression_metadata[plan.date.isoformat()] = metadata
             if debug:
@@ -613,14 +1217,10 @@ class EngineMK2:
                         for activity in plan.activities
                     ]
 
-        normalized_inputs: List[Dict[str, Any]] = []
+        template_table = compile_templates(templates)
+        day_events: List[List[Event]] = []
         for plan in week_plans:
-            events = self._place_activities_in_day(plan.date.weekday(), plan.day_name, plan.activities, templates)
-            for event in events:
-                event.date = plan.date
-                event.day = plan.day_name
-            events = self.fill_free_time(events)
-            events = self.apply_micro_jitter(events)
+            events = self._schedule_day(plan, template_table, streams)
             if debug:
                 day_debug = debug_days.get(plan.day_name)
                 if day_debug is not None:
@@ -635,31 +1235,65 @@ class EngineMK2:
                         }
                         for event in events
                     ]
-            day_offset = (plan.date - start_date).days
-            weekday_index = plan.date.weekday()
+            day_events.append(events)
+
+        return _WeekDraft(
+            profile=profile,
+            start_date=start_date,
+            plans=week_plans,
+            day_events=day_events,
+            issues=issues,
+            compression=compression_metadata,
+            debug_trace=debug_trace,
+        )
+
+    def _schedule_day(
+        self,
+        plan: DayPlan,
+        templates: TemplateSource,
+        streams: RandomStreams,
+    ) -> List[Event]:
+        """Place, gap-fill and jitter the activities of a single planned day."""
+
+        with self._stage("placement") as stage:
+            events = self._placer(
+                plan.date.weekday(),
+                plan.day_name,
+                plan.activities,
+                templates,
+                rng=streams.stream(plan.date, "placement"),
+            )
             for event in events:
-                normalized_inputs.append(
-                    {
-                        "date": event.date,
-                        "day": event.day,
-                        "day_index": day_offset,
-                        "weekday_index": weekday_index,
-                        "start_minutes": event.start_minutes,
-                        "end_minutes": event.end_minutes,
-                        "duration_minutes": max(0, event.end_minutes - event.start_minutes),
-                        "activity": event.activity.name,
-                        "activity_details": {
-                            "base_duration_minutes": event.activity.base_duration_minutes,
-                            "waste_multiplier": event.activity.waste_multiplier,
-                            "optional": event.activity.optional,
-                            "priority": event.activity.priority,
-                            "actual_duration": event.activity.actual_duration,
-                        },
-                        "day_type": plan.day_type,
-                    }
-                )
+                event.date = plan.date
+                event.day = plan.day_name
+            stage.events = len(events)
+        with self._stage("free_time") as stage:
+            events = self.fill_free_time(events)
+            stage.events = len(events)
+        with self._stage("jitter") as stage:
+            events = self.apply_micro_jitter(events, rng=streams.stream(plan.date, "jitter"))
+            stage.events = len(events)
+        return events
 
-        events_payload = normalize_mk2_events(normalized_inputs, week_start=start_date)
+    def _finish_week(self, draft: _WeekDraft) -> Dict[str, object]:
+        profile = draft.profile
+        start_date = draft.start_date
+        week_plans = draft.plans
+        issues = draft.issues
+        compression_metadata = draft.compression
+        debug_trace = draft.debug_trace
+        debug = debug_trace is not None
+
+        with self._stage("normalization") as stage:
+            records: List[_EventRecord] = []
+            for plan, events in zip(week_plans, draft.day_events):
+                day_offset = (plan.date - start_date).days
+                records.extend(
+                    _EventRecord.from_event(event, day_offset, plan.date, plan.day_type)
+                    for event in events
+                )
+            events_payload = _serialize_event_records(records)
+            stage.events = len(events_payload)
         sleep_totals: Dict[str, int] = {}
         total_sleep_minutes = 0
         for event in events_payload:
@@ -683,7 +1317,9 @@ class EngineMK2:
                 profile.name,
                 sleep_totals,
             )
-        summary_hours = self._generate_summary(events_payload)
+        with self._stage("summary") as stage:
+            summary_hours = self._generate_summary(events_payload)
+            stage.events = len(events_payload)
 
         weekly_totals_minutes: Dict[str, int] = {}
         if debug:
@@ -718,6 +1354,44 @@ class EngineMK2:
 
         return result
 
+    def _finish_columnar(
+        self,
+        draft: _WeekDraft,
+        activities: CodeTable[ActivityCode],
+        day_types: CodeTable[str],
+    ) -> ColumnarWeek:
+        week = ColumnarWeek(
+            person=draft.profile.name,
+            week_start=draft.start_date,
+            engine_version=self._engine_version,
+            activities=activities,
+            day_types=day_types,
+            issues=[asdict(issue) for issue in draft.issues],
+            compression=draft.compression,
+        )
+        for plan, events in zip(draft.plans, draft.day_events):
+            day_offset = (plan.date - draft.start_date).days
+            week.day_type_codes.append(day_types.code(plan.day_type))
+            for event in sorted(events, key=lambda evt: evt.start_minutes % 1440):
+                activity = event.activity
+                week.day_index.append(day_offset)
+                week.start_minutes.append(event.start_minutes)
+                week.end_minutes.append(event.end_minutes)
+                week.duration_minutes.append(max(0, event.end_minutes - event.start_minutes))
+                week.activity_code.append(
+                    activities.code(
+                        ActivityCode(
+                            activity.name,
+                            activity.waste_multiplier,
+                            activity.optional,
+                            activity.priority,
+                        )
+                    )
+                )
+                week.base_minutes.append(activity.base_duration_minutes)
+                week.actual_minutes.append(activity.actual_duration)
+        return week
+
     def select_profile(self, archetype: str) -> Tuple[PersonProfile, Dict[str, ActivityTemplate]]:
         archetype = archetype.lower()
         if archetype not in self._profile_factory:
@@ -738,6 +1412,9 @@ class EngineMK21(EngineMK2):
             Callable[[PersonProfile, date, "UniqueDay"], Optional[List[Activity]]]
         ] = None,
         validator: Optional[Callable[[Dict[str, List[Activity]]], List[object]]] = None,
+        instrumentation: Optional[StageTimer] = None,
+        placement: str = "cursor",
+        date_context: Optional[DateContextIndex] = None,
     ) -> None:
         super().__init__(
             calendar_provider=calendar_provider,
@@ -745,6 +1422,9 @@ class EngineMK21(EngineMK2):
             unique_schedule_generator=unique_schedule_generator,
             validator=validator,
             engine_version="mk2_1",
+            instrumentation=instrumentation,
+            placement=placement,
+            date_context=date_context,
         )
 
 
@@ -763,6 +1443,35 @@ def normalize_mk2_events(
     return normalized
 
 
+def _issue_follows(issue: Mapping[str, Any], day: date) -> bool:
+    """Whether *issue* sorts after the issues of *day* (week-level issues come last)."""
+
+    label = str(issue.get("day") or "")
+    if "(" in label and label.endswith(")"):
+        try:
+            return date.fromisoformat(label[label.rindex("(") + 1 : -1]) > day
+        except ValueError:
+            pass
+    return True
+
+
+def _serialize_event_records(records: Iterable[_EventRecord]) -> List[Dict[str, Any]]:
+    """Render engine-native records exactly as :func:`normalize_mk2_events` would."""
+
+    payload: List[Dict[str, Any]] = []
+    for record in records:
+        if record.end_minutes > record.start_minutes:
+            payload.append(record.to_payload())
+            continue
+        # Empty or inverted spans need the normaliser's roll-over rules.
+        normalized = _normalize_single_event(record.as_raw(), week_start=None)
+        if normalized is not None:
+            payload.append(normalized)
+
+    payload.sort(key=_event_sort_key)
+    return payload
+
+
 def _normalize_single_event(
     raw: Mapping[str, object], *, week_start: Optional[date]
 ) -> Optional[Dict[str, Any]]:
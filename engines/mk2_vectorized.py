@@ -0,0 +1,818 @@
+"""NumPy-vectorised population kernel for Engine MK2.
+
+The kernel evaluates the stochastic parts of MK2 (daily friction, optional
+activity draws, template start jitter and boundary micro-jitter) as arrays
+over many people at once instead of one Python call per person per day. It
+mirrors the scheduling rules of :class:`~engines.engine_mk2.EngineMK2` for
+profiles without yearly budgets and uses the built-in friction model and
+validation rules.
+
+Random draws are laid out as one stream per person and kind, consumed in the
+same order the scalar engine would consume them. Feeding those streams to the
+scalar engine therefore reproduces the kernel output exactly, which is how
+the two implementations are kept in step.
+
+NumPy is an optional dependency; the rest of the engine does not need it.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+from datetime import date, timedelta
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+try:  # pragma: no cover - optional dependency
+    import numpy as np
+except ModuleNotFoundError:  # pragma: no cover - exercised without numpy
+    np = None  # type: ignore[assignment]
+
+from archetypes import DEFAULT_TEMPLATES
+from models import ActivityTemplate, DAY_NAMES, PersonProfile, ScheduleIssue
+from modules.friction_model import (
+    WEEKDAY_FATIGUE_STEP,
+    WEEKEND_RECOVERY,
+    generate_daily_friction,
+)
+from modules.validation import validate_week
+
+from .engine_mk2 import (
+    OUTDOOR_ACTIVITIES,
+    EngineMK2,
+    _EventRecord,
+    _serialize_event_records,
+)
+
+__all__ = ["VectorizedEngineMK2", "VectorizedWeekBatch"]
+
+_MAX_SLOTS = 16
+"""Upper bound on distinct activities planned for a single day."""
+
+_OPTIONAL_DRAWS = 7 * 3
+_PLACEMENT_DRAWS = 7 * _MAX_SLOTS
+_JITTER_DRAWS = 7 * 2 * _MAX_SLOTS
+
+_MIN_FRICTION = 0.9
+_MAX_FRICTION = 1.8
+_FREE_TIME = "free time"
+_LOCKED_ACTIVITIES = frozenset({"sleep", "work", "commute_in", "commute_out"})
+_MAX_SHIFT = 5
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ModuleNotFoundError("numpy is required for the vectorized MK2 kernel")
+
+
+@dataclass
+class _BlockDraws:
+    """Per-person random streams for one block of the population."""
+
+    friction: Any
+    optional: Any
+    placement: Any
+    jitter: Any
+
+
+def _draw_block(seed: int, block_index: int, size: int) -> _BlockDraws:
+    generator = np.random.default_rng([seed, block_index])
+    return _BlockDraws(
+        friction=generator.standard_normal((size, 7)),
+        optional=generator.random((size, _OPTIONAL_DRAWS)),
+        placement=generator.random((size, _PLACEMENT_DRAWS)),
+        jitter=generator.standard_normal((size, _JITTER_DRAWS)),
+    )
+
+
+@dataclass
+class _Slot:
+    """One candidate activity for a day, expressed column-wise over people."""
+
+    name: str
+    base: Any
+    waste: float
+    optional: bool
+    priority: int
+    present: Any
+    actual: Any = None
+
+
+class _NameTable:
+    def __init__(self) -> None:
+        self.names: List[str] = []
+        self._codes: Dict[str, int] = {}
+        self.code(_FREE_TIME)
+
+    def code(self, name: str) -> int:
+        code = self._codes.get(name)
+        if code is None:
+            code = len(self.names)
+            self._codes[name] = code
+            self.names.append(name)
+        return code
+
+
+@dataclass
+class VectorizedWeekBatch:
+    """Columnar results for one week generated for many people.
+
+    Events are stored person-major, then by day, then by start time. The
+    slice for person ``i`` is ``person_offsets[i]:person_offsets[i + 1]``.
+    Use :meth:`result` or :meth:`to_results` to obtain the dictionaries that
+    :meth:`EngineMK2.generate_complete_week` returns.
+    """
+
+    profiles: List[PersonProfile]
+    start_date: date
+    engine_version: str
+    activity_names: List[str]
+    day_types: List[List[str]]
+    friction: Any
+    person_offsets: Any
+    event_day: Any
+    event_start: Any
+    event_end: Any
+    event_code: Any
+    detail_base: Any
+    detail_actual: Any
+    detail_waste: Any
+    detail_optional: Any
+    detail_priority: Any
+    planned_minutes: Any
+    sleep_minutes: Any
+    has_sleep: Any
+    compressions: Dict[Tuple[int, int], List[str]] = field(default_factory=dict)
+    final_overflow: Dict[Tuple[int, int], int] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.profiles)
+
+    @property
+    def dates(self) -> List[date]:
+        return [self.start_date + timedelta(days=offset) for offset in range(7)]
+
+    def total_minutes(self, activity: str) -> Any:
+        """Return the weekly minutes spent on *activity* for every person."""
+
+        totals = np.zeros(len(self.profiles), dtype=np.int64)
+        if activity not in self.activity_names:
+            return totals
+        code = self.activity_names.index(activity)
+        mask = self.event_code == code
+        counts = np.diff(self.person_offsets)
+        person = np.repeat(np.arange(len(self.profiles)), counts)
+        np.add.at(totals, person[mask], (self.event_end - self.event_start)[mask])
+        return totals
+
+    def result(self, index: int) -> Dict[str, object]:
+        """Materialise the week for person *index* in the MK2 result shape."""
+
+        profile = self.profiles[index]
+        dates = self.dates
+        labels = [f"{DAY_NAMES[day.weekday()]} ({day.isoformat()})" for day in dates]
+        start, stop = int(self.person_offsets[index]), int(self.person_offsets[index + 1])
+
+        records: List[_EventRecord] = []
+        for position in range(start, stop):
+            day_offset = int(self.event_day[position])
+            event_date = dates[day_offset]
+            records.append(
+                _EventRecord(
+                    date=event_date,
+                    day=DAY_NAMES[event_date.weekday()],
+                    day_index=day_offset,
+                    weekday_index=event_date.weekday(),
+                    start_minutes=int(self.event_start[position]),
+                    end_minutes=int(self.event_end[position]),
+                    activity=self.activity_names[int(self.event_code[position])],
+                    activity_details={
+                        "base_duration_minutes": int(self.detail_base[position]),
+                        "waste_multiplier": float(self.detail_waste[position]),
+                        "optional": bool(self.detail_optional[position]),
+                        "priority": int(self.detail_priority[position]),
+                        "actual_duration": int(self.detail_actual[position]),
+                    },
+                    day_type=self.day_types[index][day_offset],
+                )
+            )
+
+        events_payload = _serialize_event_records(records)
+        issues = self._issues(index, labels)
+
+        compression: Dict[str, Dict[str, object]] = {}
+        for day_offset, day in enumerate(dates):
+            entry: Dict[str, object] = {
+                "original_total": int(self.planned_minutes[index, day_offset]),
+                "compressions": list(self.compressions.get((index, day_offset), [])),
+            }
+            overflow = self.final_overflow.get((index, day_offset))
+            if overflow:
+                entry["final_overflow"] = overflow
+            compression[day.isoformat()] = entry
+
+        metadata: Dict[str, Any] = {
+            "total_events": len(events_payload),
+            "issue_count": len(issues),
+            "summary_hours": EngineMK2._generate_summary(events_payload),
+            "compression": compression,
+            "day_types": {
+                day.isoformat(): self.day_types[index][offset] for offset, day in enumerate(dates)
+            },
+        }
+        metadata["engine_version"] = self.engine_version
+
+        return {
+            "person": profile.name,
+            "week_start": self.start_date.isoformat(),
+            "events": events_payload,
+            "issues": [asdict(issue) for issue in issues],
+            "metadata": metadata,
+        }
+
+    def to_results(self) -> List[Dict[str, object]]:
+        """Materialise every person's week."""
+
+        return [self.result(index) for index in range(len(self.profiles))]
+
+    def _issues(self, index: int, labels: Sequence[str]) -> List[ScheduleIssue]:
+        issues: List[ScheduleIssue] = []
+        per_day_sleep: Dict[str, int] = {}
+        for day_offset, label in enumerate(labels):
+            planned = int(self.planned_minutes[index, day_offset])
+            if planned > 1440:
+                issues.append(
+                    ScheduleIssue(
+                        day=label,
+                        issue_type="overflow",
+                        severity="warning",
+                        details=f"Day exceeds 24h by {planned - 1440} minutes",
+                    )
+                )
+            sleep = int(self.sleep_minutes[index, day_offset])
+            if self.has_sleep[index, day_offset] and sleep < 240:
+                issues.append(
+                    ScheduleIssue(
+                        day=label,
+                        issue_type="insufficient_sleep",
+                        severity="error",
+                        details="Sleep duration fell below 4 hours",
+                    )
+                )
+            per_day_sleep[label] = sleep
+
+        total_sleep = sum(per_day_sleep.values())
+        if total_sleep < 14 * 60:
+            hours = round(total_sleep / 60.0, 1)
+            issues.append(
+                ScheduleIssue(
+                    day="week",
+                    issue_type="insufficient_sleep_week",
+                    severity="warning",
+                    details=f"Weekly sleep dropped to {hours} hours",
+                )
+            )
+        short_days = {day: minutes for day, minutes in per_day_sleep.items() if 0 < minutes < 180}
+        if short_days:
+            formatted = ", ".join(f"{day} ({minutes}m)" for day, minutes in sorted(short_days.items()))
+            issues.append(
+                ScheduleIssue(
+                    day="week",
+                    issue_type="insufficient_sleep_day",
+                    severity="warning",
+                    details=f"Sleep below 3h on: {formatted}",
+                )
+            )
+        return issues
+
+
+class VectorizedEngineMK2:
+    """Generate MK2 weeks for many people at once using NumPy arrays.
+
+    The kernel reads calendar context from the wrapped engine's calendar
+    provider (or its date context, when one is set) and reports the wrapped
+    engine's version. Engines with custom friction or validation hooks, or
+    with gap placement, are rejected because the kernel re-implements the
+    default modules column-wise. The unique-day hook is never consulted:
+    batches carry no yearly budgets, so no day is a unique day.
+    """
+
+    def __init__(self, engine: Optional[EngineMK2] = None, *, block_size: int = 4096) -> None:
+        _require_numpy()
+        if block_size <= 0:
+            raise ValueError("block_size must be positive")
+        self._engine = engine or EngineMK2()
+        self._block_size = block_size
+
+    @property
+    def engine(self) -> EngineMK2:
+        return self._engine
+
+    @property
+    def block_size(self) -> int:
+        return self._block_size
+
+    def generate_archetype_batch(
+        self, archetype: str, count: int, start_date: date, seed: int
+    ) -> VectorizedWeekBatch:
+        """Generate *count* people of one archetype using its default templates."""
+
+        profile, templates = self._engine.select_profile(archetype)
+        return self.generate_week_batch([profile] * count, start_date, seed, templates)
+
+    def generate_week_batch(
+        self,
+        profiles: Sequence[PersonProfile],
+        start_date: date,
+        seed: int,
+        templates: Optional[Mapping[str, ActivityTemplate]] = None,
+    ) -> VectorizedWeekBatch:
+        """Generate the week starting at *start_date* for every profile.
+
+        Results are reproducible for a given *seed* (a non-negative integer),
+        block size and position of each profile in *profiles*.
+        """
+
+        self._check_hooks()
+        if seed < 0:
+            raise ValueError("seed must be non-negative")
+
+        profiles = list(profiles)
+        templates = templates or DEFAULT_TEMPLATES
+        dates = [start_date + timedelta(days=offset) for offset in range(7)]
+        names = _NameTable()
+        count = len(profiles)
+        calendar = self._engine._calendar
+
+        friction = np.zeros((count, 7), dtype=np.float64)
+        planned = np.zeros((count, 7), dtype=np.int64)
+        sleep = np.zeros((count, 7), dtype=np.int64)
+        has_sleep = np.zeros((count, 7), dtype=bool)
+        day_types: List[List[str]] = [[""] * 7 for _ in range(count)]
+        compressions: Dict[Tuple[int, int], List[str]] = {}
+        final_overflow: Dict[Tuple[int, int], int] = {}
+        day_counts = np.zeros((count, 7), dtype=np.int64)
+        chunks: List[Dict[str, Any]] = []
+
+        for block_index, block_start in enumerate(range(0, count, self._block_size)):
+            block_rows = np.arange(block_start, min(count, block_start + self._block_size))
+            draws = _draw_block(seed, block_index, len(block_rows))
+
+            groups: Dict[str, List[int]] = {}
+            for local, row in enumerate(block_rows):
+                groups.setdefault(profiles[row].country, []).append(local)
+
+            for country, members in groups.items():
+                local = np.asarray(members, dtype=np.int64)
+                rows = block_rows[local]
+                group = _GroupState(
+                    [profiles[row] for row in rows],
+                    _BlockDraws(
+                        friction=draws.friction[local],
+                        optional=draws.optional[local],
+                        placement=draws.placement[local],
+                        jitter=draws.jitter[local],
+                    ),
+                )
+                for day_offset, current_date in enumerate(dates):
+                    day_type = calendar.classify_day(current_date, country)
+                    for row in rows:
+                        day_types[row][day_offset] = day_type
+                    outcome = self._simulate_day(
+                        group, day_offset, current_date, day_type, templates, names
+                    )
+                    friction[rows, day_offset] = outcome["friction"]
+                    planned[rows, day_offset] = outcome["planned"]
+                    sleep[rows, day_offset] = outcome["sleep"]
+                    has_sleep[rows, day_offset] = outcome["has_sleep"]
+                    day_counts[rows, day_offset] = outcome["counts"]
+                    for local_row, messages in outcome["compressions"].items():
+                        compressions[(int(rows[local_row]), day_offset)] = messages
+                    for local_row, overflow in outcome["final_overflow"].items():
+                        final_overflow[(int(rows[local_row]), day_offset)] = overflow
+                    outcome["rows"] = rows
+                    outcome["day_offset"] = day_offset
+                    chunks.append(outcome)
+
+        flat_counts = day_counts.reshape(-1)
+        offsets = np.zeros(flat_counts.size + 1, dtype=np.int64)
+        np.cumsum(flat_counts, out=offsets[1:])
+        total = int(offsets[-1])
+
+        event_day = np.zeros(total, dtype=np.int8)
+        event_start = np.zeros(total, dtype=np.int32)
+        event_end = np.zeros(total, dtype=np.int32)
+        event_code = np.zeros(total, dtype=np.int16)
+        detail_base = np.zeros(total, dtype=np.int32)
+        detail_actual = np.zeros(total, dtype=np.int32)
+        detail_waste = np.zeros(total, dtype=np.float64)
+        detail_optional = np.zeros(total, dtype=bool)
+        detail_priority = np.zeros(total, dtype=np.int8)
+
+        for chunk in chunks:
+            rows = chunk["rows"]
+            width = chunk["start"].shape[1]
+            valid = np.arange(width)[None, :] < chunk["counts"][:, None]
+            positions = offsets[rows * 7 + chunk["day_offset"]][:, None] + np.arange(width)[None, :]
+            target = positions[valid]
+            event_day[target] = chunk["day_offset"]
+            event_start[target] = chunk["start"][valid]
+            event_end[target] = chunk["end"][valid]
+            event_code[target] = chunk["code"][valid]
+            detail_base[target] = chunk["base"][valid]
+            detail_actual[target] = chunk["actual"][valid]
+            detail_waste[target] = chunk["waste"][valid]
+            detail_optional[target] = chunk["optional"][valid]
+            detail_priority[target] = chunk["priority"][valid]
+
+        return VectorizedWeekBatch(
+            profiles=profiles,
+            start_date=start_date,
+            engine_version=self._engine.engine_version,
+            activity_names=list(names.names),
+            day_types=day_types,
+            friction=friction,
+            person_offsets=offsets[::7].copy(),
+            event_day=event_day,
+            event_start=event_start,
+            event_end=event_end,
+            event_code=event_code,
+            detail_base=detail_base,
+            detail_actual=detail_actual,
+            detail_waste=detail_waste,
+            detail_optional=detail_optional,
+            detail_priority=detail_priority,
+            planned_minutes=planned,
+            sleep_minutes=sleep,
+            has_sleep=has_sleep,
+            compressions=compressions,
+            final_overflow=final_overflow,
+        )
+
+    # ------------------------------------------------------------------
+    # Kernel internals
+    # ------------------------------------------------------------------
+    def _check_hooks(self) -> None:
+        engine = self._engine
+        if engine.friction_generator is not generate_daily_friction:
+            raise ValueError("The vectorized kernel only supports the default friction model")
+        if engine.validator is not validate_week:
+            raise ValueError("The vectorized kernel only supports the default validator")
+        if engine.placement != "cursor":
+            raise ValueError("The vectorized kernel only supports cursor placement")
+
+    def _simulate_day(
+        self,
+        group: "_GroupState",
+        day_offset: int,
+        current_date: date,
+        day_type: str,
+        templates: Mapping[str, ActivityTemplate],
+        names: _NameTable,
+    ) -> Dict[str, Any]:
+        weekday_index = current_date.weekday()
+        size = group.size
+        provider = self._engine._calendar_provider
+        calendar = self._engine._calendar
+
+        week_fatigue = 1.0
+        if weekday_index < 5:
+            week_fatigue += weekday_index * WEEKDAY_FATIGUE_STEP
+        else:
+            week_fatigue += WEEKEND_RECOVERY
+        noise = group.variance * group.draws.friction[:, day_offset]
+        friction = np.clip(group.base_waste * week_fatigue * (1 + noise), _MIN_FRICTION, _MAX_FRICTION)
+
+        if day_type == "public_holiday":
+            slots = [
+                _Slot(
+                    activity.name,
+                    np.full(size, activity.base_duration_minutes, dtype=np.int64),
+                    activity.waste_multiplier,
+                    activity.optional,
+                    activity.priority,
+                    np.ones(size, dtype=bool),
+                )
+                for activity in provider.generate_holiday_schedule(group.profiles[0], current_date)
+            ]
+        else:
+            slots = self._standard_slots(group, weekday_index, day_type)
+
+        _apply_seasonal_modifiers(slots, calendar.get_seasonal_modifiers(current_date))
+        slots = _apply_special_period_effects(slots, calendar.get_special_period_effects(current_date), size)
+        if len(slots) > _MAX_SLOTS:
+            raise ValueError(f"Too many activities planned for {current_date.isoformat()}")
+
+        for slot in slots:
+            scaled = np.maximum(1, (slot.base * slot.waste * friction).astype(np.int64))
+            slot.actual = np.where(slot.present, scaled, 0)
+
+        planned = np.zeros(size, dtype=np.int64)
+        for slot in slots:
+            planned += slot.actual
+        sleep = np.zeros(size, dtype=np.int64)
+        has_sleep = np.zeros(size, dtype=bool)
+        for slot in slots:
+            if slot.name == "sleep":
+                sleep += slot.actual
+                has_sleep |= slot.present
+
+        compressions, final_overflow = _compress(slots, planned)
+        events = self._place_and_fill(group, slots, weekday_index, templates, names)
+        _micro_jitter(group, events, names)
+
+        return {
+            "friction": friction,
+            "planned": planned,
+            "sleep": sleep,
+            "has_sleep": has_sleep,
+            "compressions": compressions,
+            "final_overflow": final_overflow,
+            **events,
+        }
+
+    @staticmethod
+    def _standard_slots(group: "_GroupState", weekday_index: int, day_type: str) -> List[_Slot]:
+        size = group.size
+        slots: List[_Slot] = []
+
+        def add(name: str, base: Any, waste: float, optional: bool, priority: int, present: Any = None) -> None:
+            mask = base > 0 if present is None else present & (base > 0)
+            slots.append(_Slot(name, np.where(mask, base, 0), waste, optional, priority, mask))
+
+        add("sleep", group.sleep, 1.0, False, 1)
+        for meal_name in ("breakfast", "lunch", "dinner"):
+            add(meal_name, np.full(size, 30, dtype=np.int64), 1.2, False, 2)
+
+        if weekday_index < 5:
+            work = group.work
+            if day_type == "bridge_day":
+                work = (work * 0.6).astype(np.int64)
+            add("work", work, 1.1, False, 2)
+
+        if weekday_index in (0, 2, 4):
+            consumes = group.gym > 0
+            add("gym", group.gym, 1.4, True, 4, consumes & (group.take("optional", consumes) < 0.85))
+
+        if weekday_index >= 5:
+            consumes = group.social > 0
+            add("social", group.social, 1.3, True, 4, consumes & (group.take("optional", consumes) < 0.7))
+
+        if weekday_index in (5, 6):
+            consumes = group.chores > 0
+            add("chores", group.chores, 1.2, True, 3, consumes & (group.take("optional", consumes) < 0.6))
+
+        return slots
+
+    @staticmethod
+    def _place_and_fill(
+        group: "_GroupState",
+        slots: List[_Slot],
+        weekday_index: int,
+        templates: Mapping[str, ActivityTemplate],
+        names: _NameTable,
+    ) -> Dict[str, Any]:
+        size = group.size
+        width = 2 * len(slots) + 1
+        start = np.zeros((size, width), dtype=np.int64)
+        end = np.zeros((size, width), dtype=np.int64)
+        code = np.zeros((size, width), dtype=np.int64)
+        base = np.zeros((size, width), dtype=np.int64)
+        actual = np.zeros((size, width), dtype=np.int64)
+        waste = np.ones((size, width), dtype=np.float64)
+        optional = np.zeros((size, width), dtype=bool)
+        priority = np.full((size, width), 5, dtype=np.int64)
+        valid = np.zeros((size, width), dtype=bool)
+
+        def fallback_hour(slot: _Slot) -> int:
+            template = templates.get(slot.name)
+            return template.preferred_start_hour if template is not None else 12
+
+        ordered = sorted(slots, key=fallback_hour)
+        cursor = np.zeros(size, dtype=np.int64)
+        for position, slot in enumerate(ordered):
+            template = templates.get(slot.name)
+            if template and (template.valid_days is None or weekday_index in template.valid_days):
+                uniform = group.take("placement", slot.present)
+                flexibility = template.flexibility_minutes
+                jitter = np.floor(uniform * (2 * flexibility + 1)).astype(np.int64) - flexibility
+                slot_start = np.maximum(0, template.preferred_start_hour * 60 + jitter)
+            else:
+                slot_start = cursor
+            slot_start = np.maximum(slot_start, cursor)
+            slot_end = slot_start + slot.actual
+
+            gap_column = 2 * position
+            gap = slot.present & (cursor < slot_start)
+            valid[:, gap_column] = gap
+            start[:, gap_column] = cursor
+            end[:, gap_column] = slot_start
+            base[:, gap_column] = slot_start - cursor
+            actual[:, gap_column] = slot_start - cursor
+
+            event_column = gap_column + 1
+            valid[:, event_column] = slot.present
+            start[:, event_column] = slot_start
+            end[:, event_column] = slot_end
+            code[:, event_column] = names.code(slot.name)
+            base[:, event_column] = slot.base
+            actual[:, event_column] = slot.actual
+            waste[:, event_column] = slot.waste
+            optional[:, event_column] = slot.optional
+            priority[:, event_column] = slot.priority
+
+            cursor = np.where(slot.present, slot_end, cursor)
+
+        tail = width - 1
+        valid[:, tail] = cursor < 1440
+        start[:, tail] = cursor
+        end[:, tail] = 1440
+        base[:, tail] = 1440 - cursor
+        actual[:, tail] = 1440 - cursor
+
+        order = np.argsort(~valid, axis=1, kind="stable")
+        columns = {
+            "start": start,
+            "end": end,
+            "code": code,
+            "base": base,
+            "actual": actual,
+            "waste": waste,
+            "optional": optional,
+            "priority": priority,
+        }
+        compacted = {key: np.take_along_axis(value, order, axis=1) for key, value in columns.items()}
+        compacted["counts"] = valid.sum(axis=1)
+        return compacted
+
+
+class _GroupState:
+    """Per-person arrays and random stream cursors for one country group."""
+
+    def __init__(self, profiles: List[PersonProfile], draws: _BlockDraws) -> None:
+        self.profiles = profiles
+        self.size = len(profiles)
+        self.draws = draws
+        self.base_waste = np.array([profile.base_waste_factor for profile in profiles], dtype=np.float64)
+        self.variance = np.array([profile.friction_variance for profile in profiles], dtype=np.float64)
+
+        cache: Dict[int, Tuple[int, ...]] = {}
+        allocations = []
+        for profile in profiles:
+            key = id(profile.budget)
+            if key not in cache:
+                allocation = EngineMK2._allocate_budget(profile)
+                cache[key] = (
+                    allocation.sleep,
+                    allocation.work,
+                    allocation.social,
+                    allocation.chores,
+                    allocation.gym,
+                )
+            allocations.append(cache[key])
+        columns = np.array(allocations, dtype=np.int64).reshape(self.size, 5)
+        self.sleep, self.work, self.social, self.chores, self.gym = (
+            columns[:, index] for index in range(5)
+        )
+
+        self._cursors = {
+            "optional": np.zeros(self.size, dtype=np.int64),
+            "placement": np.zeros(self.size, dtype=np.int64),
+            "jitter": np.zeros(self.size, dtype=np.int64),
+        }
+        self._rows = np.arange(self.size)
+
+    def take(self, stream: str, consumes: Any) -> Any:
+        """Return the next draw of *stream* per person, advancing where *consumes*."""
+
+        cursor = self._cursors[stream]
+        values = getattr(self.draws, stream)
+        drawn = values[self._rows, cursor]
+        cursor += consumes
+        return drawn
+
+
+def _apply_seasonal_modifiers(slots: List[_Slot], seasonal: Optional[Mapping[str, object]]) -> None:
+    if not seasonal:
+        return
+
+    multiplier = seasonal.get("outdoor_activity_multiplier")
+    if multiplier and isinstance(multiplier, (int, float)):
+        for slot in slots:
+            if slot.name in OUTDOOR_ACTIVITIES:
+                slot.base = (slot.base * multiplier).astype(np.int64)
+
+    energy_level = seasonal.get("energy_level")
+    if isinstance(energy_level, (int, float)):
+        if energy_level < 1.0:
+            for slot in slots:
+                if slot.name == "gym":
+                    slot.base = (slot.base * energy_level).astype(np.int64)
+        elif energy_level > 1.05:
+            for slot in slots:
+                if slot.name == "social":
+                    slot.base = (slot.base * min(1.5, energy_level)).astype(np.int64)
+
+
+def _apply_special_period_effects(
+    slots: List[_Slot], special: Optional[Mapping[str, object]], size: int
+) -> List[_Slot]:
+    if not special:
+        return slots
+
+    updated = list(slots)
+    if special.get("work_minimal"):
+        updated = [slot for slot in updated if slot.name != "work"]
+    elif special.get("work_reduced"):
+        for slot in updated:
+            if slot.name == "work":
+                slot.base = (slot.base * 0.6).astype(np.int64)
+
+    if special.get("shops_closed"):
+        updated = [slot for slot in updated if slot.name != "chores"]
+
+    if special.get("social_family_focused"):
+        updated.append(
+            _Slot("family_time", np.full(size, 180, dtype=np.int64), 1.2, False, 2, np.ones(size, dtype=bool))
+        )
+
+    if special.get("energy_low"):
+        for slot in updated:
+            if slot.name in {"gym", "social"}:
+                slot.base = (slot.base * 0.75).astype(np.int64)
+
+    if special.get("study_hours_increased"):
+        extra_minutes = int(special.get("extra_study_minutes", 240))
+        updated.append(
+            _Slot(
+                "exam_study",
+                np.full(size, extra_minutes, dtype=np.int64),
+                1.2,
+                False,
+                2,
+                np.ones(size, dtype=bool),
+            )
+        )
+
+    return updated
+
+
+def _compress(
+    slots: List[_Slot], planned: Any
+) -> Tuple[Dict[int, List[str]], Dict[int, int]]:
+    overflow = planned - 1440
+    if not (overflow > 0).any():
+        return {}, {}
+
+    log: List[Tuple[str, Any, Any]] = []
+    adjustable = sorted((slot for slot in slots if slot.waste > 1.0), key=lambda slot: slot.priority, reverse=True)
+    for slot in adjustable:
+        reduction = np.minimum((slot.actual * 0.1).astype(np.int64), overflow)
+        applied = slot.present & (overflow > 0) & (reduction > 0)
+        slot.actual = np.where(applied, slot.actual - reduction, slot.actual)
+        overflow = np.where(applied, overflow - reduction, overflow)
+        log.append((f"Compressed {slot.name} by {{}}m", applied, reduction))
+
+    optional = sorted((slot for slot in slots if slot.optional), key=lambda slot: slot.priority, reverse=True)
+    for slot in optional:
+        skipped = slot.present & (overflow > 0)
+        overflow = np.where(skipped, overflow - slot.actual, overflow)
+        slot.present = slot.present & ~skipped
+        slot.actual = np.where(skipped, 0, slot.actual)
+        log.append((f"Skipped {slot.name}", skipped, None))
+
+    messages: Dict[int, List[str]] = {}
+    for row in np.nonzero(planned > 1440)[0]:
+        row_messages = []
+        for template, mask, amounts in log:
+            if mask[row]:
+                row_messages.append(template.format(int(amounts[row])) if amounts is not None else template)
+        messages[int(row)] = row_messages
+
+    final_overflow = {int(row): int(overflow[row]) for row in np.nonzero(overflow > 0)[0]}
+    return messages, final_overflow
+
+
+def _micro_jitter(group: _GroupState, events: Dict[str, Any], names: _NameTable) -> None:
+    start = events["start"]
+    end = events["end"]
+    counts = events["counts"]
+    locked_codes = np.array([name in _LOCKED_ACTIVITIES for name in names.names])
+    locked = locked_codes[events["code"]]
+
+    for index in range(start.shape[1] - 1):
+        active = index < counts - 1
+        if not active.any():
+            break
+        min_boundary = start[:, index] + 1
+        max_boundary = end[:, index + 1] - 1
+        eligible = (
+            active
+            & ~locked[:, index]
+            & ~locked[:, index + 1]
+            & (max_boundary > min_boundary)
+        )
+        normals = group.take("jitter", eligible)
+        shift = np.clip(np.rint(normals * (_MAX_SHIFT / 2)), -_MAX_SHIFT, _MAX_SHIFT).astype(np.int64)
+        boundary = np.clip(end[:, index] + shift, min_boundary, max_boundary)
+        moved = eligible & (boundary != end[:, index])
+        end[:, index] = np.where(moved, boundary, end[:, index])
+        start[:, index + 1] = np.where(moved, boundary, start[:, index + 1])
@@ -0,0 +1,418 @@
+"""Activity placement strategies for the MK2 engine family.
+
+The default ``cursor`` strategy lives on :class:`~engines.engine_mk2.EngineMK2`
+and lays activities out back to back behind a moving cursor. The ``gap``
+strategy in this module keeps a sorted list of the free gaps in the day and
+puts each activity in the feasible gap nearest its preferred start, so a late
+or long activity no longer shifts every activity placed after it.
+
+:class:`GapIndex` switches to a max segment tree of gap lengths keyed by
+start minute once a day splits into more than a few dozen gaps, so
+nearest-fit queries cost O(log minutes) on days carrying hundreds of
+activities. It answers the same gap queries as the minute bitmap in
+:mod:`modules.occupancy`, with the same results as its linear
+:func:`~modules.occupancy.nearest_fit` search.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from datetime import date
+from types import MappingProxyType
+from typing import Dict, List, Mapping, NamedTuple, Optional, Tuple, Union
+
+from models import Activity, ActivityTemplate, Event
+from modules.occupancy import nearest_fit
+
+__all__ = [
+    "PLACEMENT_STRATEGIES",
+    "CompiledTemplates",
+    "GapIndex",
+    "TemplateEntry",
+    "compile_templates",
+    "place_activities_in_gaps",
+]
+
+PLACEMENT_STRATEGIES = ("cursor", "gap")
+
+MINUTES_PER_DAY = 1440
+ALL_DAYS_MASK = 0b1111111
+# Gap count above which GapIndex switches from scanning to its segment tree.
+_TREE_MIN_GAPS = 32
+FALLBACK_START_HOUR = 12
+
+
+class TemplateEntry(NamedTuple):
+    """Placement data for one activity, precomputed from an ActivityTemplate."""
+
+    preferred_start_hour: int
+    preferred_start_minutes: int
+    flexibility_minutes: int
+    valid_days_mask: int
+
+    def applies_to(self, day_index: int) -> bool:
+        return bool(self.valid_days_mask >> day_index & 1)
+
+
+class CompiledTemplates:
+    """Immutable lookup table built from a templates dict by :func:`compile_templates`."""
+
+    __slots__ = ("entries",)
+
+    def __init__(self, templates: Mapping[str, ActivityTemplate]) -> None:
+        entries: Dict[str, TemplateEntry] = {}
+        for name, template in templates.items():
+            if template.valid_days is None:
+                mask = ALL_DAYS_MASK
+            else:
+                mask = 0
+                for day in template.valid_days:
+                    if 0 <= day < 7:
+                        mask |= 1 << day
+            entries[name] = TemplateEntry(
+                template.preferred_start_hour,
+                template.preferred_start_hour * 60,
+                template.flexibility_minutes,
+                mask,
+            )
+        self.entries: Mapping[str, TemplateEntry] = MappingProxyType(entries)
+
+    def start_hour(self, activity_name: str) -> int:
+        """Sort key used by placement; unknown activities sort at midday."""
+
+        entry = self.entries.get(activity_name)
+        return FALLBACK_START_HOUR if entry is None else entry.preferred_start_hour
+
+
+TemplateSource = Union[Mapping[str, ActivityTemplate], CompiledTemplates]
+
+_COMPILED_CACHE_SIZE = 64
+_TemplateKey = Tuple[Tuple[str, int, int, Optional[Tuple[int, ...]]], ...]
+_compiled: "OrderedDict[_TemplateKey, CompiledTemplates]" = OrderedDict()
+_compiled_lock = threading.Lock()
+
+
+def _template_key(templates: Mapping[str, ActivityTemplate]) -> _TemplateKey:
+    return tuple(
+        (
+            name,
+            template.preferred_start_hour,
+            template.flexibility_minutes,
+            None if template.valid_days is None else tuple(template.valid_days),
+        )
+        for name, template in templates.items()
+    )
+
+
+def compile_templates(templates: TemplateSource) -> CompiledTemplates:
+    """Return the compiled table for *templates*, reusing it for identical content.
+
+    Tables are cached by an immutable snapshot of the templates' fields (for
+    the most recent :data:`_COMPILED_CACHE_SIZE` distinct contents), so
+    templates edited after use are recompiled and equal dicts share a table.
+    Already compiled tables are returned unchanged.
+    """
+
+    if isinstance(templates, CompiledTemplates):
+        return templates
+    key = _template_key(templates)
+    with _compiled_lock:
+        cached = _compiled.get(key)
+        if cached is not None:
+            _compiled.move_to_end(key)
+            return cached
+    table = CompiledTemplates(templates)
+    with _compiled_lock:
+        _compiled[key] = table
+        _compiled.move_to_end(key)
+        while len(_compiled) > _COMPILED_CACHE_SIZE:
+            _compiled.popitem(last=False)
+    return table
+
+
+class GapIndex:
+    """Sorted list of the free ``[start, end)`` gaps in a span of minutes.
+
+    Once the span splits into more than :data:`_TREE_MIN_GAPS` gaps, a max
+    segment tree over its minutes holds each gap's length at its start minute.
+    Fit queries then descend that tree to the nearest large-enough gap on
+    either side, so :meth:`find`, :meth:`first_fit_after` and
+    :meth:`last_fit_before` take O(log minutes) on days carrying hundreds of
+    activities. Below that, scanning the few gaps is cheaper than keeping the
+    tree up to date.
+    """
+
+    def __init__(self, start: int = 0, end: int = MINUTES_PER_DAY) -> None:
+        self._origin = start
+        self._size = 1 << max(end - start - 1, 0).bit_length()
+        self._tree: Optional[List[int]] = None
+        self._starts: List[int] = [start] if end > start else []
+        self._ends: List[int] = [end] if end > start else []
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def gaps(self) -> List[Tuple[int, int]]:
+        return list(zip(self._starts, self._ends))
+
+    def _indexed(self) -> bool:
+        """Build the segment tree once the gap count warrants it."""
+
+        if self._tree is None:
+            if len(self._starts) <= _TREE_MIN_GAPS:
+                return False
+            size = self._size
+            tree = [0] * (2 * size)
+            for start, end in zip(self._starts, self._ends):
+                tree[start - self._origin + size] = end - start
+            for node in range(size - 1, 0, -1):
+                left, right = tree[2 * node], tree[2 * node + 1]
+                tree[node] = left if left > right else right
+            self._tree = tree
+        return True
+
+    def _set(self, start: int, length: int) -> None:
+        tree = self._tree
+        if tree is None:
+            return
+        node = start - self._origin + self._size
+        tree[node] = length
+        while node > 1:
+            sibling = tree[node ^ 1]
+            if sibling > length:
+                length = sibling
+            node >>= 1
+            if tree[node] == length:
+                break
+            tree[node] = length
+
+    def _leftmost(self, minute: int, duration: int) -> Optional[int]:
+        """Return the first gap start at or after *minute* whose gap fits *duration*."""
+
+        tree, size = self._tree, self._size
+        assert tree is not None
+        position = max(minute - self._origin, 0)
+        if position >= size or tree[1] < duration:
+            return None
+        node = position + size
+        while tree[node] < duration:
+            while node & 1:
+                node >>= 1
+            if not node:
+                return None
+            node += 1
+        while node < size:
+            node *= 2
+            if tree[node] < duration:
+                node += 1
+        return node - size + self._origin
+
+    def _rightmost(self, minute: int, duration: int) -> Optional[int]:
+        """Return the last gap start before *minute* whose gap fits *duration*."""
+
+        tree, size = self._tree, self._size
+        assert tree is not None
+        position = min(minute - self._origin, size)
+        if position <= 0 or tree[1] < duration:
+            return None
+        node = position - 1 + size
+        while tree[node] < duration:
+            while not node & 1:
+                node >>= 1
+            if node == 1:
+                return None
+            node -= 1
+        while node < size:
+            node = 2 * node + 1
+            if tree[node] < duration:
+                node -= 1
+        return node - size + self._origin
+
+    def gap_at(self, minute: int) -> Optional[Tuple[int, int]]:
+        """Return the gap containing *minute*, if that minute is free."""
+
+        index = bisect_right(self._starts, minute) - 1
+        if index >= 0 and minute < self._ends[index]:
+            return self._starts[index], self._ends[index]
+        return None
+
+    def first_fit_after(self, minute: int, duration: int) -> Optional[Tuple[int, int]]:
+        """Return the earliest gap starting at or after *minute* that fits *duration*."""
+
+        starts, ends = self._starts, self._ends
+        if not self._indexed():
+            for index in range(bisect_left(starts, minute), len(starts)):
+                if ends[index] - starts[index] >= duration:
+                    return starts[index], ends[index]
+            return None
+        start = self._leftmost(minute, max(duration, 1))
+        if start is None:
+            return None
+        return start, ends[bisect_left(starts, start)]
+
+    def last_fit_before(self, minute: int, duration: int) -> Optional[Tuple[int, int]]:
+        """Return the latest gap ending at or before *minute* that fits *duration*."""
+
+        starts, ends = self._starts, self._ends
+        if not self._indexed():
+            for index in range(bisect_right(ends, minute) - 1, -1, -1):
+                if ends[index] - starts[index] >= duration:
+                    return starts[index], ends[index]
+            return None
+        # Gaps ending by *minute* are exactly those starting before the first
+        # gap that ends after it.
+        bound = bisect_right(ends, minute)
+        limit = starts[bound] if bound < len(starts) else self._origin + self._size
+        start = self._rightmost(limit, max(duration, 1))
+        if start is None:
+            return None
+        return start, ends[bisect_left(starts, start)]
+
+    def find(self, preferred: int, duration: int) -> Optional[int]:
+        """Return the start closest to *preferred* where *duration* minutes are free.
+
+        Small indexes use :func:`modules.occupancy.nearest_fit` directly; the
+        tree search returns the same start, ties included: of two equally close fits, the one fewer gaps
+        away from *preferred* wins, and the earlier one when that is equal too.
+        """
+
+        starts, ends = self._starts, self._ends
+        if not self._indexed():
+            return nearest_fit(starts, ends, preferred, duration)
+        need = max(duration, 1)
+        pivot = bisect_right(starts, preferred) - 1
+
+        left: Optional[int] = None
+        if pivot >= 0:
+            if ends[pivot] - starts[pivot] >= duration:
+                left = pivot
+            else:
+                start = self._rightmost(starts[pivot], need)
+                if start is not None:
+                    left = bisect_left(starts, start)
+        right: Optional[int] = None
+        start = self._leftmost(preferred + 1, need)
+        if start is not None:
+            right = bisect_left(starts, start)
+
+        if left is None and right is None:
+            return None
+        if right is None:
+            return min(preferred, ends[left] - duration)  # type: ignore[index]
+        if left is None:
+            return starts[right]
+        left_fit = min(preferred, ends[left] - duration)
+        left_distance = preferred - left_fit
+        right_distance = starts[right] - preferred
+        if left_distance < right_distance or (
+            left_distance == right_distance and pivot - left <= right - pivot - 1
+        ):
+            return left_fit
+        return starts[right]
+
+    def discard(self, start: int, end: int) -> None:
+        """Mark every free minute of ``[start, end)`` as occupied.
+
+        Unlike :meth:`reserve`, the span may cross gaps, occupied minutes or
+        the ends of the index.
+        """
+
+        if end <= start:
+            return
+        starts, ends = self._starts, self._ends
+        index = bisect_right(ends, start)
+        while index < len(starts) and starts[index] < end:
+            gap_start, gap_end = starts[index], ends[index]
+            del starts[index], ends[index]
+            self._set(gap_start, start - gap_start if gap_start < start else 0)
+            if end < gap_end:
+                starts.insert(index, end)
+                ends.insert(index, gap_end)
+                self._set(end, gap_end - end)
+            if gap_start < start:
+                starts.insert(index, gap_start)
+                ends.insert(index, start)
+                index += 1
+            if end < gap_end:
+                break
+
+    def reserve(self, start: int, end: int) -> None:
+        """Mark ``[start, end)`` as occupied; it must lie inside a single gap."""
+
+        if end <= start:
+            return
+        index = bisect_right(self._starts, start) - 1
+        if index < 0 or self._ends[index] < end:
+            raise ValueError(f"[{start}, {end}) is not free")
+        gap_start, gap_end = self._starts[index], self._ends[index]
+        del self._starts[index], self._ends[index]
+        self._set(gap_start, start - gap_start if gap_start < start else 0)
+        if end < gap_end:
+            self._starts.insert(index, end)
+            self._ends.insert(index, gap_end)
+            self._set(end, gap_end - end)
+        if gap_start < start:
+            self._starts.insert(index, gap_start)
+            self._ends.insert(index, start)
+
+
+def place_activities_in_gaps(
+    day_index: int,
+    day_name: str,
+    activities: List[Activity],
+    templates: TemplateSource,
+    rng: Optional[random.Random] = None,
+) -> List[Event]:
+    """Place *activities* in the free gap nearest to each preferred start.
+
+    Activities are visited in the same order, and draw the same jitter, as the
+    cursor strategy. Activities without a usable template prefer the end of
+    the previously placed activity. When no gap is large enough the activity
+    is appended after the latest placed event, as the cursor strategy does.
+    """
+
+    rng = rng or random
+    # Late activities such as sleep may run past midnight, as with the cursor
+    # strategy, so the index also covers the following night.
+    gaps = GapIndex(0, 2 * MINUTES_PER_DAY)
+    table = compile_templates(templates)
+    entries = table.entries
+    events: List[Event] = []
+    cursor = 0
+    latest_end = 0
+
+    for activity in sorted(activities, key=lambda act: table.start_hour(act.name)):
+        entry = entries.get(activity.name)
+        if entry is not None and entry.valid_days_mask >> day_index & 1:
+            flexibility = entry.flexibility_minutes
+            jitter = rng.randint(-flexibility, flexibility)
+            preferred = max(0, entry.preferred_start_minutes + jitter)
+        else:
+            preferred = cursor
+
+        duration = max(0, activity.actual_duration)
+        start = gaps.find(preferred, duration)
+        if start is None:
+            start = max(preferred, latest_end)
+            # The overflow still occupies whatever part of the index it covers.
+            gaps.discard(start, start + duration)
+        else:
+            gaps.reserve(start, start + duration)
+        end = start + duration
+        events.append(
+            Event(
+                date=date.min,
+                day=day_name,
+                start_minutes=start,
+                end_minutes=end,
+                activity=activity,
+            )
+        )
+        cursor = end
+        latest_end = max(latest_end, end)
+
+    events.sort(key=lambda event: event.start_minutes)
+    return events
@@ -0,0 +1,135 @@
+"""Population-scale generation helpers for the MK2 engine family."""
+
+from __future__ import annotations
+
+import os
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import date
+from itertools import islice
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Union
+
+from models import ActivityTemplate, PersonProfile
+from yearly_budget import YearlyBudget
+
+from .engine_mk2 import EngineMK2
+
+__all__ = ["PopulationSpec", "generate_population"]
+
+
+@dataclass(frozen=True)
+class PopulationSpec:
+    """Inputs for one person-week in a population run.
+
+    ``profile`` is either a :class:`PersonProfile` or an archetype key that is
+    resolved through :meth:`EngineMK2.select_profile`. When an archetype key is
+    used and ``templates`` is omitted, the archetype's templates are applied.
+    ``seeding`` and ``person_id`` are passed to
+    :meth:`EngineMK2.generate_complete_week`.
+    """
+
+    profile: Union[PersonProfile, str]
+    seed: int
+    start_date: date
+    templates: Optional[Dict[str, ActivityTemplate]] = None
+    yearly_budget: Optional[YearlyBudget] = None
+    seeding: str = "sequential"
+    person_id: Optional[str] = None
+
+
+_WORKER_ENGINE: Optional[EngineMK2] = None
+
+
+def _init_worker(engine: EngineMK2) -> None:
+    global _WORKER_ENGINE
+    _WORKER_ENGINE = engine
+
+
+def _generate_one(engine: EngineMK2, spec: PopulationSpec) -> Dict[str, object]:
+    profile = spec.profile
+    templates = spec.templates
+    if isinstance(profile, str):
+        profile, archetype_templates = engine.select_profile(profile)
+        templates = templates or archetype_templates
+    return engine.generate_complete_week(
+        profile,
+        spec.start_date,
+        spec.seed,
+        templates,
+        spec.yearly_budget,
+        seeding=spec.seeding,
+        person_id=spec.person_id,
+    )
+
+
+def _generate_chunk(specs: List[PopulationSpec]) -> List[Dict[str, object]]:
+    engine = _WORKER_ENGINE
+    if engine is None:  # pragma: no cover - initializer always runs first
+        raise RuntimeError("Population worker was not initialised")
+    return [_generate_one(engine, spec) for spec in specs]
+
+
+def _chunked(specs: Iterable[PopulationSpec], size: int) -> Iterator[List[PopulationSpec]]:
+    iterator = iter(specs)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def generate_population(
+    specs: Iterable[PopulationSpec],
+    *,
+    engine: Optional[EngineMK2] = None,
+    workers: Optional[int] = None,
+    chunksize: int = 64,
+    max_pending: Optional[int] = None,
+) -> Iterator[Dict[str, object]]:
+    """Yield one week result per spec, in input order.
+
+    Specs are sharded into chunks of *chunksize* and generated across a
+    :class:`ProcessPoolExecutor` with *workers* processes (defaulting to the
+    CPU count). Every spec is seeded independently, so results do not depend
+    on the worker count or chunk size. ``workers=1`` generates in-process.
+
+    At most *max_pending* chunks (default ``2 * workers``) are in flight at a
+    time, keeping memory bounded when *specs* is a long or lazy iterable. The
+    *engine* (default :class:`EngineMK2`) is pickled once into each worker, so
+    any custom hooks it carries must be importable module-level callables.
+    Give it a :class:`~modules.date_context.DateContextIndex` covering the
+    run's dates so calendar lookups are computed once per date rather than
+    once per person.
+    """
+
+    if chunksize <= 0:
+        raise ValueError("chunksize must be positive")
+
+    engine = engine or EngineMK2()
+    worker_count = workers if workers is not None else (os.cpu_count() or 1)
+    if worker_count <= 1:
+        for spec in specs:
+            yield _generate_one(engine, spec)
+        return
+
+    pending_limit = max_pending if max_pending is not None else worker_count * 2
+    pending_limit = max(1, pending_limit)
+
+    executor: Executor = ProcessPoolExecutor(
+        max_workers=worker_count,
+        initializer=_init_worker,
+        initargs=(engine,),
+    )
+    pending: Deque[Future] = deque()
+    try:
+        for chunk in _chunked(specs, chunksize):
+            pending.append(executor.submit(_generate_chunk, chunk))
+            if len(pending) >= pending_limit:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True, cancel_futures=True)
@@ -7,8 +7,9 @@ from datetime import date
 from typing import Any, Dict, Iterable, Mapping, MutableMapping, Optional
 
 from engines.base import ScheduleInput
-from engines.engine_mk1 import EngineMK1
+from engines.engine_mk1 import EngineMK1, compile_character_config
 from engines.engine_mk2 import EngineMK2, EngineMK21
+from modules.result_cache import WeekResultCache
 from modules.unique_events import UniqueDay
 from rigs.simple_rig import SimpleRig
 from rigs.workforce_rig import WorkforceRig
@@ -234,6 +235,16 @@ def _build_yearly_budget(data: Optional[Mapping[str, Any]]) -> Optional[YearlyBu
     return budget
 
 
+def _budget_metadata(budget: YearlyBudget) -> Dict[str, Any]:
+    return {
+        "person_id": budget.person_id,
+        "year": budget.year,
+        "vacation_days": budget.vacation_days,
+        "sick_days_taken": budget.sick_days_taken,
+        "unique_days": [asdict(day) for day in budget.unique_days],
+    }
+
+
 def _convert_events(events: Iterable[Mapping[str, Any]]) -> Iterable[Dict[str, Any]]:
     return [dict(event) for event in events]
 
@@ -242,22 +253,25 @@ def _convert_events(events: Iterable[Mapping[str, Any]]) -> Iterable[Dict[str, A
 # Public adapter functions ---------------------------------------------------
 # ---------------------------------------------------------------------------
 
+_MK1_COMPILED = {key: compile_character_config(config) for key, config in _MK1_CONFIGS.items()}
 _MK1_ENGINE = EngineMK1()
 _MK1_RIG = SimpleRig(engine=_MK1_ENGINE)
 
 _MK2_ENGINE = EngineMK2()
-_MK2_RIG = WorkforceRig(engine=_MK2_ENGINE)
+_MK2_RIG = WorkforceRig(engine=_MK2_ENGINE, cache=WeekResultCache(max_entries=64))
 _MK2_1_ENGINE = EngineMK21()
-_MK2_1_RIG = WorkforceRig(engine=_MK2_1_ENGINE)
+_MK2_1_RIG = WorkforceRig(engine=_MK2_1_ENGINE, cache=WeekResultCache(max_entries=64))
 
 
 def mk1_run_web(archetype: str, week_start: Optional[str], seed: Any) -> SchemaPayload:
     archetype_key = str(archetype or "office").strip().lower()
-    config = _MK1_CONFIGS.get(archetype_key, _MK1_CONFIGS["office"])
+    if archetype_key not in _MK1_COMPILED:
+        archetype_key = "office"
+    config = _MK1_CONFIGS[archetype_key]
     start_date = _coerce_start_date(week_start)
     seed_value = _coerce_seed(seed)
 
-    schedule_input = ScheduleInput(constraints=config, seed=seed_value)
+    schedule_input = ScheduleInput(constraints=_MK1_COMPILED[archetype_key], seed=seed_value)
     if start_date is not None:
         schedule_input = schedule_input.with_metadata(start_date=start_date)
 
@@ -303,6 +317,7 @@ def _run_mk2_variant(
     rig_label: str,
     yearly_budget: Optional[Mapping[str, Any]] = None,
     debug: bool = False,
+    seeding: str = "sequential",
 ) -> SchemaPayload:
     archetype_key = str(archetype or "office").strip().lower()
     seed_value = _coerce_seed(seed)
@@ -312,7 +327,13 @@ def _run_mk2_variant(
     budget = _build_yearly_budget(yearly_budget) if yearly_budget is not None else None
 
     result = rig_instance.generate_complete_week(
-        profile, start_date, seed_value, templates, budget, debug=debug
+        profile,
+        start_date,
+        seed_value,
+        templates,
+        budget,
+        debug=debug,
+        seeding=seeding,
     )
 
     payload: MutableMapping[str, Any] = dict(result)
@@ -323,14 +344,9 @@ def _run_mk2_variant(
     metadata = dict(payload.get("metadata", {}))
     metadata["profile"] = profile.name
     metadata["engine_version"] = engine_version
+    metadata["seeding"] = seeding
     if budget is not None:
-        metadata["yearly_budget"] = {
-            "person_id": budget.person_id,
-            "year": budget.year,
-            "vacation_days": budget.vacation_days,
-            "sick_days_taken": budget.sick_days_taken,
-            "unique_days": [asdict(day) for day in budget.unique_days],
-        }
+        metadata["yearly_budget"] = _budget_metadata(budget)
     payload["metadata"] = metadata
 
     return _ensure_schema(
@@ -342,8 +358,48 @@ def _run_mk2_variant(
     )
 
 
+def _regenerate_mk2_day(
+    rig_instance: WorkforceRig,
+    payload: Mapping[str, Any],
+    archetype: str,
+    day: Any,
+    seed: Any,
+    yearly_budget: Optional[Mapping[str, Any]] = None,
+) -> SchemaPayload:
+    archetype_key = str(archetype or "office").strip().lower()
+    seed_value = _coerce_seed(seed)
+    day_value = _coerce_start_date(day)
+    if day_value is None:
+        raise ValueError("day must be an ISO date string")
+    metadata = payload.get("metadata") or {}
+    if metadata.get("seeding") != "counter":
+        # Days of sequentially seeded weeks depend on every earlier day's draws.
+        raise ValueError("only weeks generated with seeding='counter' can be patched by day")
+
+    profile, templates = rig_instance.select_profile(archetype_key)
+    budget = _build_yearly_budget(yearly_budget) if yearly_budget is not None else None
+
+    result = rig_instance.regenerate_day(payload, profile, day_value, seed_value, templates, budget)
+    if budget is not None:
+        result_metadata = dict(result.get("metadata", {}))
+        result_metadata["yearly_budget"] = _budget_metadata(budget)
+        result["metadata"] = result_metadata
+
+    return _ensure_schema(
+        result,
+        rig=str(metadata.get("rig") or "workforce"),
+        seed=seed_value,
+        archetype=archetype_key,
+        engine_version=metadata.get("engine_version"),
+    )
+
+
 def mk2_run_calendar_web(
-    archetype: str, week_start: Optional[str], seed: Any, debug: bool = False
+    archetype: str,
+    week_start: Optional[str],
+    seed: Any,
+    debug: bool = False,
+    seeding: str = "sequential",
 ) -> SchemaPayload:
     return _run_mk2_variant(
         _MK2_RIG,
@@ -354,6 +410,7 @@ def mk2_run_calendar_web(
         rig_label="calendar",
         yearly_budget=None,
         debug=debug,
+        seeding=seeding,
     )
 
 
@@ -363,6 +420,7 @@ def mk2_run_workforce_web(
     seed: Any,
     yearly_budget: Optional[Mapping[str, Any]],
     debug: bool = False,
+    seeding: str = "sequential",
 ) -> SchemaPayload:
     return _run_mk2_variant(
         _MK2_RIG,
@@ -373,11 +431,16 @@ def mk2_run_workforce_web(
         rig_label="workforce",
         yearly_budget=yearly_budget,
         debug=debug,
+        seeding=seeding,
     )
 
 
 def mk2_1_run_calendar_web(
-    archetype: str, week_start: Optional[str], seed: Any, debug: bool = False
+    archetype: str,
+    week_start: Optional[str],
+    seed: Any,
+    debug: bool = False,
+    seeding: str = "sequential",
 ) -> SchemaPayload:
     return _run_mk2_variant(
         _MK2_1_RIG,
@@ -388,6 +451,7 @@ def mk2_1_run_calendar_web(
         rig_label="calendar",
         yearly_budget=None,
         debug=debug,
+        seeding=seeding,
     )
 
 
@@ -397,6 +461,7 @@ def mk2_1_run_workforce_web(
     seed: Any,
     yearly_budget: Optional[Mapping[str, Any]],
     debug: bool = False,
+    seeding: str = "sequential",
 ) -> SchemaPayload:
     return _run_mk2_variant(
         _MK2_1_RIG,
@@ -407,13 +472,44 @@ def mk2_1_run_workforce_web(
         rig_label="workforce",
         yearly_budget=yearly_budget,
         debug=debug,
+        seeding=seeding,
     )
 
 
+def mk2_regenerate_day_web(
+    payload: Mapping[str, Any],
+    archetype: str,
+    day: Any,
+    seed: Any,
+    yearly_budget: Optional[Mapping[str, Any]] = None,
+) -> SchemaPayload:
+    """Patch one day of an MK2 workforce payload instead of regenerating the week.
+
+    Only payloads generated with ``seeding="counter"`` can be patched; others
+    raise :class:`ValueError`.
+    """
+
+    return _regenerate_mk2_day(_MK2_RIG, payload, archetype, day, seed, yearly_budget)
+
+
+def mk2_1_regenerate_day_web(
+    payload: Mapping[str, Any],
+    archetype: str,
+    day: Any,
+    seed: Any,
+    yearly_budget: Optional[Mapping[str, Any]] = None,
+) -> SchemaPayload:
+    """MK2.1 counterpart of :func:`mk2_regenerate_day_web`."""
+
+    return _regenerate_mk2_day(_MK2_1_RIG, payload, archetype, day, seed, yearly_budget)
+
+
 __all__ = [
     "mk1_run_web",
     "mk2_run_calendar_web",
     "mk2_run_workforce_web",
     "mk2_1_run_calendar_web",
     "mk2_1_run_workforce_web",
+    "mk2_regenerate_day_web",
+    "mk2_1_regenerate_day_web",
 ]
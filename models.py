@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import threading
+import weakref
+from dataclasses import dataclass
 from datetime import date
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 DAY_NAMES: List[str] = [
     "monday",
@@ -17,19 +19,201 @@ DAY_NAMES: List[str] = [
 ]
 
 
-@dataclass
-class Activity:
-    """Represents an activity template before it is placed on the calendar."""
+@dataclass(frozen=True, slots=True, weakref_slot=True)
+class ActivityPrototype:
+    """Immutable settings shared by every placement of a recurring activity.
+
+    Obtain instances through :func:`activity_prototype` so equal settings are
+    one object, and call :meth:`instantiate` for a placed :class:`Activity`.
+    """
 
     name: str
     base_duration_minutes: int
     waste_multiplier: float = 1.0
     optional: bool = True
     priority: int = 5
-    actual_duration: int = field(init=False)
 
-    def __post_init__(self) -> None:
-        self.actual_duration = int(self.base_duration_minutes * self.waste_multiplier)
+    def instantiate(
+        self,
+        base_duration_minutes: Optional[int] = None,
+        waste_multiplier: Optional[float] = None,
+    ) -> "Activity":
+        """Return a placed :class:`Activity` that overrides only what differs."""
+
+        return Activity._placed(self, base_duration_minutes, waste_multiplier)
+
+
+# Weak values: a prototype lives only as long as some activity or caller uses it.
+_PROTOTYPES: "weakref.WeakValueDictionary[Tuple[str, int, float, bool, int], ActivityPrototype]"
+_PROTOTYPES = weakref.WeakValueDictionary()
+_PROTOTYPES_LOCK = threading.Lock()
+
+
+def activity_prototype(
+    name: str,
+    base_duration_minutes: int,
+    waste_multiplier: float = 1.0,
+    optional: bool = True,
+    priority: int = 5,
+) -> ActivityPrototype:
+    """Return the interned :class:`ActivityPrototype` for the given settings."""
+
+    key = (name, base_duration_minutes, waste_multiplier, optional, priority)
+    prototype = _PROTOTYPES.get(key)
+    if prototype is None:
+        with _PROTOTYPES_LOCK:
+            prototype = _PROTOTYPES.get(key)
+            if prototype is None:
+                prototype = ActivityPrototype(*key)
+                _PROTOTYPES[key] = prototype
+    return prototype
+
+
+class Activity:
+    """Represents an activity template before it is placed on the calendar.
+
+    The name, priority and defaults live on a shared :class:`ActivityPrototype`;
+    each placement stores only its ``actual_duration`` and any base duration or
+    waste multiplier that friction and modifiers changed. Assigning ``name``,
+    ``optional`` or ``priority`` switches to the matching prototype.
+    """
+
+    __slots__ = ("_prototype", "_base_duration_minutes", "_waste_multiplier", "actual_duration")
+
+    def __init__(
+        self,
+        name: str,
+        base_duration_minutes: int,
+        waste_multiplier: float = 1.0,
+        optional: bool = True,
+        priority: int = 5,
+    ) -> None:
+        self._prototype = activity_prototype(
+            name, base_duration_minutes, waste_multiplier, optional, priority
+        )
+        self._base_duration_minutes: Optional[int] = None
+        self._waste_multiplier: Optional[float] = None
+        self.actual_duration = int(base_duration_minutes * waste_multiplier)
+
+    @classmethod
+    def _placed(
+        cls,
+        prototype: ActivityPrototype,
+        base_duration_minutes: Optional[int],
+        waste_multiplier: Optional[float],
+    ) -> "Activity":
+        activity = cls.__new__(cls)
+        activity._prototype = prototype
+        activity._base_duration_minutes = base_duration_minutes
+        activity._waste_multiplier = waste_multiplier
+        activity.actual_duration = int(activity.base_duration_minutes * activity.waste_multiplier)
+        return activity
+
+    @property
+    def prototype(self) -> ActivityPrototype:
+        return self._prototype
+
+    @property
+    def name(self) -> str:
+        return self._prototype.name
+
+    @name.setter
+    def name(self, value: str) -> None:
+        self._rebase(name=value)
+
+    @property
+    def base_duration_minutes(self) -> int:
+        override = self._base_duration_minutes
+        return self._prototype.base_duration_minutes if override is None else override
+
+    @base_duration_minutes.setter
+    def base_duration_minutes(self, value: int) -> None:
+        self._base_duration_minutes = value
+
+    @property
+    def waste_multiplier(self) -> float:
+        override = self._waste_multiplier
+        return self._prototype.waste_multiplier if override is None else override
+
+    @waste_multiplier.setter
+    def waste_multiplier(self, value: float) -> None:
+        self._waste_multiplier = value
+
+    @property
+    def optional(self) -> bool:
+        return self._prototype.optional
+
+    @optional.setter
+    def optional(self, value: bool) -> None:
+        self._rebase(optional=value)
+
+    @property
+    def priority(self) -> int:
+        return self._prototype.priority
+
+    @priority.setter
+    def priority(self, value: int) -> None:
+        self._rebase(priority=value)
+
+    def _rebase(self, **changes: object) -> None:
+        prototype = self._prototype
+        settings = {
+            "name": prototype.name,
+            "base_duration_minutes": prototype.base_duration_minutes,
+            "waste_multiplier": prototype.waste_multiplier,
+            "optional": prototype.optional,
+            "priority": prototype.priority,
+        }
+        settings.update(changes)
+        self._prototype = activity_prototype(**settings)  # type: ignore[arg-type]
+
+    def _fields(self) -> Tuple[str, int, float, bool, int, int]:
+        return (
+            self.name,
+            self.base_duration_minutes,
+            self.waste_multiplier,
+            self.optional,
+            self.priority,
+            self.actual_duration,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._fields() == other._fields()  # type: ignore[attr-defined]
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return (
+            f"Activity(name={self.name!r}, base_duration_minutes={self.base_duration_minutes!r}, "
+            f"waste_multiplier={self.waste_multiplier!r}, optional={self.optional!r}, "
+            f"priority={self.priority!r}, actual_duration={self.actual_duration!r})"
+        )
+
+    def __getstate__(self) -> Tuple[ActivityPrototype, Optional[int], Optional[float], int]:
+        return (
+            self._prototype,
+            self._base_duration_minutes,
+            self._waste_multiplier,
+            self.actual_duration,
+        )
+
+    def __setstate__(
+        self, state: Tuple[ActivityPrototype, Optional[int], Optional[float], int]
+    ) -> None:
+        prototype, base, waste, actual = state
+        # Re-intern so unpickled activities share prototypes in this process too.
+        self._prototype = activity_prototype(
+            prototype.name,
+            prototype.base_duration_minutes,
+            prototype.waste_multiplier,
+            prototype.optional,
+            prototype.priority,
+        )
+        self._base_duration_minutes = base
+        self._waste_multiplier = waste
+        self.actual_duration = actual
 
 
 @dataclass
@@ -65,7 +249,7 @@ class ActivityTemplate:
     valid_days: Optional[List[int]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """A scheduled event on a specific day."""
 
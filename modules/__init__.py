@@ -2,7 +2,12 @@
 
 __all__ = [
     "calendar_provider",
+    "date_context",
     "friction_model",
+    "instrumentation",
+    "json_stream",
+    "occupancy",
+    "result_cache",
     "unique_events",
     "validation",
 ]
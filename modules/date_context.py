@@ -0,0 +1,82 @@
+"""Precomputed per-date calendar context shared across many people."""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+from typing import Dict, Iterable, Optional, Tuple
+
+from modules.calendar_provider import CalendarProvider, default_calendar_provider
+
+__all__ = ["DateContextIndex"]
+
+
+class DateContextIndex:
+    """Day types, seasonal modifiers and special-period effects for a date range.
+
+    Calendar lookups only depend on (country, date), so a population sharing
+    the same weeks can compute them once instead of once per person. The
+    index answers the same ``classify_day``, ``get_seasonal_modifiers`` and
+    ``get_special_period_effects`` calls as its *provider*; dates or countries
+    outside the precomputed range fall through to the provider. Modifier
+    dictionaries are shared between callers and must not be mutated.
+    """
+
+    def __init__(
+        self,
+        start_date: date,
+        end_date: date,
+        countries: Iterable[str] = ("NL",),
+        provider: Optional[CalendarProvider] = None,
+    ) -> None:
+        if end_date < start_date:
+            raise ValueError("end_date must not be before start_date")
+
+        self._provider = provider or default_calendar_provider
+        self._start_date = start_date
+        self._end_date = end_date
+        self._day_types: Dict[Tuple[str, date], str] = {}
+        self._seasonal: Dict[date, Dict[str, object]] = {}
+        self._special: Dict[date, Optional[Dict[str, object]]] = {}
+
+        days = (end_date - start_date).days + 1
+        dates = [start_date + timedelta(days=offset) for offset in range(days)]
+        for current_date in dates:
+            self._seasonal[current_date] = self._provider.get_seasonal_modifiers(current_date)
+            self._special[current_date] = self._provider.get_special_period_effects(current_date)
+        for country in dict.fromkeys(countries):
+            for current_date in dates:
+                self._day_types[(country, current_date)] = self._provider.classify_day(
+                    current_date, country
+                )
+
+    @property
+    def provider(self) -> CalendarProvider:
+        return self._provider
+
+    @property
+    def start_date(self) -> date:
+        return self._start_date
+
+    @property
+    def end_date(self) -> date:
+        return self._end_date
+
+    def __len__(self) -> int:
+        return len(self._seasonal)
+
+    def classify_day(self, day: date, country: str = "NL") -> str:
+        day_type = self._day_types.get((country, day))
+        if day_type is None:
+            return self._provider.classify_day(day, country)
+        return day_type
+
+    def get_seasonal_modifiers(self, day: date) -> Dict[str, object]:
+        seasonal = self._seasonal.get(day)
+        if seasonal is None:
+            return self._provider.get_seasonal_modifiers(day)
+        return seasonal
+
+    def get_special_period_effects(self, day: date) -> Optional[Dict[str, object]]:
+        if day in self._special:
+            return self._special[day]
+        return self._provider.get_special_period_effects(day)
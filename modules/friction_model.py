@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import random
-from typing import Final
+from typing import Final, Optional
 
 WEEKDAY_FATIGUE_STEP: Final[float] = 0.03
 WEEKEND_RECOVERY: Final[float] = -0.05
@@ -18,8 +18,17 @@ __all__ = [
 ]
 
 
-def generate_daily_friction(day_of_week: int, base_factor: float, variance: float) -> float:
-    """Return a friction multiplier for the supplied day."""
+def generate_daily_friction(
+    day_of_week: int,
+    base_factor: float,
+    variance: float,
+    rng: Optional[random.Random] = None,
+) -> float:
+    """Return a friction multiplier for the supplied day.
+
+    Draws come from *rng* when supplied so callers can keep generation
+    isolated from the process-wide :mod:`random` state.
+    """
 
     week_fatigue = 1.0
     if day_of_week < 5:
@@ -27,7 +36,7 @@ def generate_daily_friction(day_of_week: int, base_factor: float, variance: floa
     else:
         week_fatigue += WEEKEND_RECOVERY
 
-    daily_noise = random.gauss(0, variance)
+    daily_noise = (rng or random).gauss(0, variance)
     friction = base_factor * week_fatigue * (1 + daily_noise)
     return max(_MIN_FRICTION, min(friction, _MAX_FRICTION))
 
@@ -0,0 +1,124 @@
+"""Lightweight stage timing for engine runs."""
+
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional
+
+__all__ = ["StageHandle", "StageStats", "StageTimer"]
+
+
+@dataclass
+class StageStats:
+    """Aggregated cost of one named stage."""
+
+    calls: int = 0
+    seconds: float = 0.0
+    max_seconds: float = 0.0
+    events: int = 0
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.seconds / self.calls if self.calls else 0.0
+
+
+class StageHandle:
+    """Mutable handle yielded by :meth:`StageTimer.stage` to report event counts."""
+
+    __slots__ = ("events",)
+
+    def __init__(self) -> None:
+        self.events = 0
+
+
+class StageTimer:
+    """Accumulate wall time, call counts and event counts per stage.
+
+    One timer can be shared by many engines and threads; updates are guarded
+    by a lock. Pass it to :class:`~engines.engine_mk2.EngineMK2` (or a rig) as
+    ``instrumentation`` to time each generation stage across many weeks.
+    """
+
+    def __init__(self, clock: Optional[Callable[[], float]] = None) -> None:
+        self._clock = clock or time.perf_counter
+        self._stats: Dict[str, StageStats] = {}
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> Dict[str, object]:
+        with self._lock:
+            return {"clock": self._clock, "stats": dict(self._stats)}
+
+    def __setstate__(self, state: Dict[str, object]) -> None:
+        self._clock = state["clock"]  # type: ignore[assignment]
+        self._stats = state["stats"]  # type: ignore[assignment]
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[StageHandle]:
+        """Time the enclosed block as one call of stage *name*."""
+
+        handle = StageHandle()
+        started = self._clock()
+        try:
+            yield handle
+        finally:
+            self.record(name, self._clock() - started, handle.events)
+
+    def record(self, name: str, seconds: float, events: int = 0) -> None:
+        """Add one call of *name* that took *seconds* and touched *events* items."""
+
+        with self._lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = StageStats()
+            stats.calls += 1
+            stats.seconds += seconds
+            stats.events += events
+            if seconds > stats.max_seconds:
+                stats.max_seconds = seconds
+
+    def merge(self, other: "StageTimer") -> None:
+        """Fold the totals of *other* (e.g. from a worker process) into this timer."""
+
+        for name, stats in other.snapshot().items():
+            with self._lock:
+                target = self._stats.get(name)
+                if target is None:
+                    target = self._stats[name] = StageStats()
+                target.calls += stats.calls
+                target.seconds += stats.seconds
+                target.events += stats.events
+                target.max_seconds = max(target.max_seconds, stats.max_seconds)
+
+    def snapshot(self) -> Dict[str, StageStats]:
+        """Return a copy of the per-stage totals, in first-seen order."""
+
+        with self._lock:
+            return {
+                name: StageStats(stats.calls, stats.seconds, stats.max_seconds, stats.events)
+                for name, stats in self._stats.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    def report(self) -> List[Dict[str, object]]:
+        """Return JSON-friendly rows sorted by total time, slowest first."""
+
+        rows = [
+            {
+                "stage": name,
+                "calls": stats.calls,
+                "total_ms": round(stats.seconds * 1000, 3),
+                "mean_ms": round(stats.mean_seconds * 1000, 3),
+                "max_ms": round(stats.max_seconds * 1000, 3),
+                "events": stats.events,
+            }
+            for name, stats in self.snapshot().items()
+        ]
+        rows.sort(key=lambda row: row["total_ms"], reverse=True)
+        return rows
@@ -0,0 +1,182 @@
+"""Incremental JSON writer for schedule results."""
+
+from __future__ import annotations
+
+import gzip
+import io
+import json
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Any, Iterable, Optional, Union
+
+__all__ = ["dump_json", "open_output", "write_json"]
+
+# Sequences at or below this length are encoded in a single ``json.dumps``
+# call together with their parent; longer ones are streamed item by item.
+_INLINE_LIMIT = 16
+
+_PRETTY_INDENT = 2
+_COMPACT = (",", ":")
+
+
+def _is_sequence(value: Any) -> bool:
+    return isinstance(value, (list, tuple)) or isinstance(value, Iterator)
+
+
+def _should_stream(value: Any) -> bool:
+    if isinstance(value, (dict, Mapping)):
+        children: Iterable[Any] = value.values()
+    elif isinstance(value, (list, tuple)):
+        if len(value) > _INLINE_LIMIT:
+            return True
+        children = value
+    else:
+        return isinstance(value, Iterator)
+    for child in children:
+        if isinstance(child, (str, int, float)) or child is None:
+            continue
+        if _should_stream(child):
+            return True
+    return False
+
+
+def _key(key: Any) -> str:
+    if isinstance(key, str):
+        return key
+    # Mirror ``json.dumps`` coercion of non-string mapping keys.
+    if key is True:
+        return "true"
+    if key is False:
+        return "false"
+    if key is None:
+        return "null"
+    if isinstance(key, (int, float)):
+        return json.dumps(key)
+    raise TypeError(f"keys must be str, int, float, bool or None, not {type(key).__name__}")
+
+
+class _Writer:
+    def __init__(self, handle: IO[str], indent: Optional[int]) -> None:
+        self._write = handle.write
+        self._indent = indent
+        self._key_sep = ":" if indent is None else ": "
+        if indent is None:
+            self._encode = json.JSONEncoder(separators=_COMPACT).encode
+        else:
+            self._encode = json.JSONEncoder(indent=indent).encode
+
+    def _leaf(self, value: Any, level: int) -> str:
+        text = self._encode(value)
+        if self._indent is None:
+            return text
+        if level and "\n" in text:
+            # JSON strings never contain raw newlines, so this only shifts
+            # structural lines to the current nesting depth.
+            text = text.replace("\n", "\n" + " " * (self._indent * level))
+        return text
+
+    def write(self, value: Any, level: int = 0) -> None:
+        if isinstance(value, (dict, Mapping)):
+            if not _should_stream(value):
+                self._write(self._leaf(value, level))
+            else:
+                self._mapping(value, level)
+        elif _is_sequence(value):
+            if not _should_stream(value):
+                self._write(self._leaf(list(value), level))
+            else:
+                self._sequence(value, level)
+        else:
+            self._write(self._leaf(value, level))
+
+    def _open(self, bracket: str, level: int) -> str:
+        if self._indent is None:
+            return bracket
+        return bracket + "\n" + " " * (self._indent * (level + 1))
+
+    def _separator(self, level: int) -> str:
+        if self._indent is None:
+            return ","
+        return ",\n" + " " * (self._indent * (level + 1))
+
+    def _close(self, bracket: str, level: int) -> str:
+        if self._indent is None:
+            return bracket
+        return "\n" + " " * (self._indent * level) + bracket
+
+    def _mapping(self, value: Mapping[Any, Any], level: int) -> None:
+        write = self._write
+        separator = self._separator(level)
+        key_sep = self._key_sep
+        first = True
+        for key, item in value.items():
+            write(self._open("{", level) if first else separator)
+            first = False
+            write(json.dumps(_key(key)))
+            write(key_sep)
+            self.write(item, level + 1)
+        write("{}" if first else self._close("}", level))
+
+    def _sequence(self, value: Iterable[Any], level: int) -> None:
+        write = self._write
+        separator = self._separator(level)
+        first = True
+        for item in value:
+            write(self._open("[", level) if first else separator)
+            first = False
+            self.write(item, level + 1)
+        write("[]" if first else self._close("]", level))
+
+
+def write_json(value: Any, handle: IO[str], *, compact: bool = False) -> None:
+    """Write *value* as JSON to the text *handle* without building the full string.
+
+    Mappings and long sequences are walked structurally and written piece by
+    piece; iterators (for example event generators) are consumed lazily and
+    emitted as JSON arrays. Small leaves such as single events are encoded in
+    one ``json.dumps`` call each. Pretty output is byte-identical to
+    ``json.dumps(value, indent=2)``; *compact* output matches
+    ``separators=(",", ":")``.
+    """
+
+    _Writer(handle, None if compact else _PRETTY_INDENT).write(value)
+
+
+@contextmanager
+def open_output(path: Union[str, Path], *, gzip_output: Optional[bool] = None):
+    """Open *path* for text output, gzip-compressed when requested.
+
+    ``gzip_output=None`` compresses when the path ends in ``.gz``. Compressed
+    files are written with a zeroed header timestamp so identical results
+    produce identical bytes.
+    """
+
+    path = Path(path)
+    if gzip_output is None:
+        gzip_output = path.suffix == ".gz"
+    with open(path, "wb") as raw:
+        if gzip_output:
+            with gzip.GzipFile(fileobj=raw, mode="wb", mtime=0) as compressed:
+                with io.TextIOWrapper(compressed, encoding="utf-8") as handle:
+                    yield handle
+        else:
+            with io.TextIOWrapper(raw, encoding="utf-8") as handle:
+                yield handle
+
+
+def dump_json(
+    value: Any,
+    path: Union[str, Path],
+    *,
+    compact: bool = False,
+    gzip_output: Optional[bool] = None,
+) -> None:
+    """Stream *value* as JSON into the file at *path*.
+
+    See :func:`write_json` for the encoding rules and :func:`open_output` for
+    how *gzip_output* is resolved.
+    """
+
+    with open_output(path, gzip_output=gzip_output) as handle:
+        write_json(value, handle, compact=compact)
@@ -0,0 +1,295 @@
+"""Minute-occupancy bitmaps for day schedules."""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+__all__ = ["DayOccupancy", "nearest_fit"]
+
+MINUTES_PER_DAY = 1440
+
+# Label codes are stored one byte per minute; code 0 marks unlabelled minutes.
+_MAX_LABELS = 255
+
+
+def nearest_fit(
+    starts: Sequence[int],
+    ends: Sequence[int],
+    preferred: int,
+    duration: int,
+) -> Optional[int]:
+    """Return the start closest to *preferred* inside the sorted gaps ``starts``/``ends``.
+
+    The search starts at the gap around *preferred* (located by bisection)
+    and walks outwards, stopping once the remaining gaps are further away
+    than the best fit found so far. The walk is linear in the number of gaps
+    in the worst case.
+    """
+
+    def fit(index: int) -> Optional[int]:
+        gap_start, gap_end = starts[index], ends[index]
+        if gap_end - gap_start < duration:
+            return None
+        return min(max(preferred, gap_start), gap_end - duration)
+
+    pivot = bisect_right(starts, preferred) - 1
+    best: Optional[int] = None
+    best_distance = 0
+
+    left, right = pivot, pivot + 1
+    while left >= 0 or right < len(starts):
+        if left >= 0:
+            if best is not None and preferred - ends[left] + duration > best_distance:
+                left = -1
+            else:
+                candidate = fit(left)
+                if candidate is not None and (
+                    best is None or abs(candidate - preferred) < best_distance
+                ):
+                    best, best_distance = candidate, abs(candidate - preferred)
+                left -= 1
+        if right < len(starts):
+            if best is not None and starts[right] - preferred > best_distance:
+                right = len(starts)
+            else:
+                candidate = fit(right)
+                if candidate is not None and (
+                    best is None or abs(candidate - preferred) < best_distance
+                ):
+                    best, best_distance = candidate, abs(candidate - preferred)
+                right += 1
+    return best
+
+
+def _span(start: int, end: int) -> int:
+    return ((1 << (end - start)) - 1) << start
+
+
+class DayOccupancy:
+    """Occupied minutes of a day as one integer bitmap plus a label code per minute.
+
+    Bit ``m`` of :attr:`bits` is set when minute ``m`` is taken, so overlap
+    tests and reservations are a single mask operation, and free gaps are
+    read off the bitmap run by run instead of re-sorting event tuples. Labels
+    are interned into small integer codes kept in a ``bytearray``.
+
+    The gap queries (``gaps``, ``gap_at``, ``first_fit_after``,
+    ``last_fit_before``, ``find`` and ``reserve``) match
+    :class:`~engines.placement.GapIndex`, so either can back a placer.
+    """
+
+    __slots__ = ("_minutes", "_full", "_bits", "_codes", "_labels", "_label_codes")
+
+    def __init__(self, minutes: int = MINUTES_PER_DAY) -> None:
+        if minutes < 0:
+            raise ValueError("minutes must not be negative")
+        self._minutes = minutes
+        self._full = (1 << minutes) - 1
+        self._bits = 0
+        self._codes = bytearray(minutes)
+        self._labels: List[Optional[str]] = [None]
+        self._label_codes: Dict[str, int] = {}
+
+    @classmethod
+    def from_events(
+        cls,
+        events: Iterable[Tuple[int, int, str]],
+        minutes: int = MINUTES_PER_DAY,
+    ) -> "DayOccupancy":
+        """Build an occupancy from ``(start, end, label)`` tuples; overlaps raise."""
+
+        occupancy = cls(minutes)
+        for start, end, label in events:
+            occupancy.occupy(start, end, label)
+        return occupancy
+
+    def copy(self) -> "DayOccupancy":
+        clone = DayOccupancy.__new__(DayOccupancy)
+        clone._minutes = self._minutes
+        clone._full = self._full
+        clone._bits = self._bits
+        clone._codes = bytearray(self._codes)
+        clone._labels = list(self._labels)
+        clone._label_codes = dict(self._label_codes)
+        return clone
+
+    @property
+    def minutes(self) -> int:
+        return self._minutes
+
+    @property
+    def bits(self) -> int:
+        return self._bits
+
+    def __len__(self) -> int:
+        """Return the number of free gaps."""
+
+        free = ~self._bits & self._full
+        # Every gap contributes one rising edge.
+        return (free & ~(free << 1)).bit_count()
+
+    def is_full(self) -> bool:
+        return self._bits == self._full
+
+    def free_minutes(self) -> int:
+        return self._minutes - self._bits.bit_count()
+
+    def _check(self, start: int, end: int) -> None:
+        if start < 0 or end > self._minutes or start > end:
+            raise ValueError(f"[{start}, {end}) is outside the day")
+
+    def is_free(self, start: int, end: int) -> bool:
+        self._check(start, end)
+        return not self._bits & _span(start, end)
+
+    def _code(self, label: Optional[str]) -> int:
+        if label is None:
+            return 0
+        code = self._label_codes.get(label)
+        if code is None:
+            code = len(self._labels)
+            if code > _MAX_LABELS:
+                raise ValueError(f"More than {_MAX_LABELS} distinct labels in one day")
+            self._labels.append(label)
+            self._label_codes[label] = code
+        return code
+
+    def occupy(self, start: int, end: int, label: Optional[str] = None) -> None:
+        """Mark ``[start, end)`` as taken by *label*; the minutes must be free."""
+
+        if end <= start:
+            return
+        self._check(start, end)
+        mask = _span(start, end)
+        if self._bits & mask:
+            raise ValueError(f"[{start}, {end}) is not free")
+        self._bits |= mask
+        code = self._code(label)
+        if code:
+            self._codes[start:end] = bytes((code,)) * (end - start)
+
+    def claim(self, start: int, end: int, label: Optional[str] = None) -> bool:
+        """Occupy ``[start, end)`` if it is entirely free; return whether it was."""
+
+        if start < 0 or end > self._minutes or start >= end:
+            raise ValueError(f"[{start}, {end}) is outside the day")
+        mask = ((1 << (end - start)) - 1) << start
+        if self._bits & mask:
+            return False
+        self._bits |= mask
+        if label is not None:
+            self._codes[start:end] = bytes((self._code(label),)) * (end - start)
+        return True
+
+    def reserve(self, start: int, end: int) -> None:
+        """Mark ``[start, end)`` as occupied without a label."""
+
+        self.occupy(start, end)
+
+    def release(self, start: int, end: int) -> None:
+        """Free ``[start, end)`` regardless of its current state."""
+
+        if end <= start:
+            return
+        self._check(start, end)
+        self._bits &= ~_span(start, end)
+        self._codes[start:end] = bytes(end - start)
+
+    def relabel(self, start: int, end: int, label: Optional[str]) -> None:
+        """Change the label of the occupied minutes ``[start, end)``."""
+
+        if end <= start:
+            return
+        self._check(start, end)
+        mask = _span(start, end)
+        if self._bits & mask != mask:
+            raise ValueError(f"[{start}, {end}) is not occupied")
+        self._codes[start:end] = bytes((self._code(label),)) * (end - start)
+
+    def label_at(self, minute: int) -> Optional[str]:
+        if not self._bits >> minute & 1:
+            return None
+        return self._labels[self._codes[minute]]
+
+    def gaps(self) -> List[Tuple[int, int]]:
+        """Return the free ``[start, end)`` gaps in order."""
+
+        result: List[Tuple[int, int]] = []
+        free = ~self._bits & self._full
+        while free:
+            low = free & -free
+            start = low.bit_length() - 1
+            # Adding the lowest bit carries through the run of free minutes.
+            carried = free + low
+            end = (carried & -carried).bit_length() - 1
+            result.append((start, end))
+            free = carried & ~(1 << end)
+        return result
+
+    def first_gap(self) -> Optional[Tuple[int, int]]:
+        free = ~self._bits & self._full
+        if not free:
+            return None
+        low = free & -free
+        carried = free + low
+        return low.bit_length() - 1, (carried & -carried).bit_length() - 1
+
+    def gap_at(self, minute: int) -> Optional[Tuple[int, int]]:
+        """Return the gap containing *minute*, if that minute is free."""
+
+        if minute < 0 or minute >= self._minutes or self._bits >> minute & 1:
+            return None
+        below = self._bits & ((1 << minute) - 1)
+        above = self._bits >> minute
+        end = minute + ((above & -above).bit_length() - 1 if above else self._minutes - minute)
+        return below.bit_length(), end
+
+    def first_fit_after(self, minute: int, duration: int) -> Optional[Tuple[int, int]]:
+        """Return the earliest gap starting at or after *minute* that fits *duration*."""
+
+        for gap in self.gaps():
+            if gap[0] >= minute and gap[1] - gap[0] >= duration:
+                return gap
+        return None
+
+    def last_fit_before(self, minute: int, duration: int) -> Optional[Tuple[int, int]]:
+        """Return the latest gap ending at or before *minute* that fits *duration*."""
+
+        for gap in reversed(self.gaps()):
+            if gap[1] <= minute and gap[1] - gap[0] >= duration:
+                return gap
+        return None
+
+    def find(self, preferred: int, duration: int) -> Optional[int]:
+        """Return the start closest to *preferred* where *duration* minutes are free."""
+
+        gaps = self.gaps()
+        return nearest_fit([gap[0] for gap in gaps], [gap[1] for gap in gaps], preferred, duration)
+
+    def segments(self) -> List[Tuple[int, int, Optional[str]]]:
+        """Return maximal runs of occupied minutes sharing a label, in order."""
+
+        result: List[Tuple[int, int, Optional[str]]] = []
+        codes = self._codes
+        for start, end in self._occupied_runs():
+            minute = start
+            while minute < end:
+                code = codes[minute]
+                rest = codes[minute:end].lstrip(bytes((code,)))
+                run_end = end - len(rest)
+                result.append((minute, run_end, self._labels[code]))
+                minute = run_end
+        return result
+
+    def _occupied_runs(self) -> List[Tuple[int, int]]:
+        runs: List[Tuple[int, int]] = []
+        taken = self._bits
+        while taken:
+            low = taken & -taken
+            start = low.bit_length() - 1
+            carried = taken + low
+            end = (carried & -carried).bit_length() - 1
+            runs.append((start, end))
+            taken = carried & ~(1 << end)
+        return runs
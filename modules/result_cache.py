@@ -0,0 +1,208 @@
+"""Fingerprinted result cache for generated weeks."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import marshal
+import os
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, is_dataclass
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+__all__ = ["CacheStats", "WeekResultCache", "fingerprint"]
+
+
+def _qualified_name(value: Any) -> Optional[str]:
+    """Return ``module.qualname`` when it resolves back to *value* itself.
+
+    Lambdas, closures, partials, bound methods and callable instances share
+    names across distinct behaviours, so they yield ``None``.
+    """
+
+    module = getattr(value, "__module__", None)
+    qualname = getattr(value, "__qualname__", None)
+    if not isinstance(module, str) or not isinstance(qualname, str) or "<" in qualname:
+        return None
+    target: Any = sys.modules.get(module)
+    for part in qualname.split("."):
+        target = getattr(target, part, None)
+    return f"{module}.{qualname}" if target is value else None
+
+
+def _canonical(value: Any) -> Any:
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=repr)
+    if callable(value):
+        name = _qualified_name(value)
+        if name is None:
+            raise TypeError(f"cannot fingerprint {value!r}: it has no importable name")
+        return name
+    state = getattr(value, "__dict__", None)
+    if state is not None:
+        # Configured objects such as calendar providers key on their settings.
+        kind = type(value)
+        return {"type": f"{kind.__module__}.{kind.__qualname__}", "state": state}
+    return repr(value)
+
+
+def fingerprint(**parts: Any) -> str:
+    """Return a stable SHA-256 hex digest of the keyword *parts*.
+
+    Dataclasses, dates, mappings and sequences are reduced to canonical JSON
+    (sorted keys), so equal inputs always produce the same key across runs.
+    Other objects are reduced to their type and instance ``__dict__``.
+    Callables are keyed by their importable name; lambdas, closures, partials
+    and other callables without one raise :class:`TypeError`, since two of
+    them can share a name while behaving differently.
+    """
+
+    text = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=_canonical)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CacheStats:
+    """Counters describing cache effectiveness."""
+
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+
+class WeekResultCache:
+    """Thread-safe LRU cache of JSON-serialisable results.
+
+    Entries are stored serialised (:mod:`marshal` in memory, JSON on disk), so
+    every :meth:`get` returns a fresh copy that callers may mutate. The
+    in-memory tier holds at most *max_entries* results and, when *max_bytes*
+    is set, at most that many serialised bytes. With a *directory*, results
+    are also written there and read back on an in-memory miss, so they
+    survive restarts. :meth:`invalidate` clears both tiers; rigs call it
+    whenever a module that shapes results is replaced.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        *,
+        max_bytes: Optional[int] = None,
+        directory: Optional[Union[str, Path]] = None,
+    ) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._directory = Path(directory) if directory is not None else None
+        if self._directory is not None:
+            self._directory.mkdir(parents=True, exist_ok=True)
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._bytes = 0
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached result for *key*, or ``None`` on a miss."""
+
+        with self._lock:
+            blob = self._entries.get(key)
+            if blob is not None:
+                self._entries.move_to_end(key)
+                self._stats.hits += 1
+        if blob is not None:
+            return marshal.loads(blob)
+
+        text = self._read_disk(key)
+        if text is None:
+            with self._lock:
+                self._stats.misses += 1
+            return None
+        result = json.loads(text)
+        with self._lock:
+            self._stats.disk_hits += 1
+            self._store(key, marshal.dumps(result))
+        return result
+
+    def put(self, key: str, result: Dict[str, Any]) -> None:
+        """Store *result* under *key* in memory and, if configured, on disk."""
+
+        blob = marshal.dumps(result)
+        with self._lock:
+            self._store(key, blob)
+        if self._directory is not None:
+            self._write_disk(key, json.dumps(result, separators=(",", ":")))
+
+    def invalidate(self) -> None:
+        """Drop every cached result from memory and disk."""
+
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._stats.invalidations += 1
+            if self._directory is not None:
+                for path in self._directory.glob("*.json"):
+                    path.unlink(missing_ok=True)
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            stats = CacheStats(**asdict(self._stats))
+            stats.entries = len(self._entries)
+            stats.bytes = self._bytes
+            return stats
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _store(self, key: str, blob: bytes) -> None:
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= len(previous)
+        self._entries[key] = blob
+        self._bytes += len(blob)
+        while len(self._entries) > self._max_entries or (
+            self._max_bytes is not None
+            and self._bytes > self._max_bytes
+            and len(self._entries) > 1
+        ):
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= len(evicted)
+            self._stats.evictions += 1
+
+    def _path(self, key: str) -> Optional[Path]:
+        if self._directory is None:
+            return None
+        return self._directory / f"{key}.json"
+
+    def _read_disk(self, key: str) -> Optional[str]:
+        path = self._path(key)
+        if path is None:
+            return None
+        try:
+            return path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+
+    def _write_disk(self, key: str, text: str) -> None:
+        path = self._path(key)
+        if path is None:
+            return
+        handle, temp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(handle, "w", encoding="utf-8") as temp_file:
+            temp_file.write(text)
+        os.replace(temp_name, path)
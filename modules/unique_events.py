@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import random
 from dataclasses import dataclass, field
 from datetime import date
 from typing import Callable, Dict, List, Optional
@@ -29,9 +30,15 @@ def generate_unique_day_schedule(
     profile: PersonProfile,
     day: date,
     unique_day: UniqueDay,
+    rng: Optional[random.Random] = None,
 ) -> Optional[List[Activity]]:
-    """Dispatch to the correct generator for the supplied unique day."""
+    """Dispatch to the correct generator for the supplied unique day.
 
+    The built-in generators are deterministic; *rng* is accepted so the engine
+    can hand every unique-day hook the same per-week random source.
+    """
+
+    del rng  # built-in generators do not draw random numbers
     generator = _UNIQUE_DAY_GENERATORS.get(unique_day.day_type.lower())
     if generator:
         return generator(profile, unique_day.rules)
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-from typing import Dict, Iterable, List, Sequence, Tuple
+from typing import Dict, Iterable, List, Sequence, Tuple, Union
 
 from models import Activity, ScheduleIssue
 
+from modules.occupancy import DayOccupancy
+
 __all__ = [
     "assert_day_coverage",
     "validate_day",
@@ -16,8 +18,16 @@ __all__ = [
 EventTuple = Tuple[int, int, str]
 
 
-def assert_day_coverage(day_name: str, events: Sequence[EventTuple]) -> None:
-    """Ensure an ordered list of events covers the full day without gaps."""
+def assert_day_coverage(day_name: str, events: Union[Sequence[EventTuple], DayOccupancy]) -> None:
+    """Ensure an ordered list of events covers the full day without gaps.
+
+    A :class:`~modules.occupancy.DayOccupancy` is checked against its bitmap
+    directly; it cannot hold overlaps, so only gaps need to be looked for.
+    """
+
+    if isinstance(events, DayOccupancy):
+        _assert_occupancy_coverage(day_name, events)
+        return
 
     if not events:
         raise ValueError("Day has no events")
@@ -34,6 +44,17 @@ def assert_day_coverage(day_name: str, events: Sequence[EventTuple]) -> None:
         raise ValueError(f"Day {day_name} does not cover full 24 hours")
 
 
+def _assert_occupancy_coverage(day_name: str, occupancy: DayOccupancy) -> None:
+    if occupancy.is_full():
+        return
+    if not occupancy.bits:
+        raise ValueError("Day has no events")
+    gap_start, gap_end = occupancy.first_gap()
+    if gap_end == occupancy.minutes and gap_start > 0:
+        raise ValueError(f"Day {day_name} does not cover full 24 hours")
+    raise ValueError(f"Gap detected in {day_name}")
+
+
 def _detect_overflow(day_name: str, total_minutes: int) -> List[ScheduleIssue]:
     if total_minutes <= 1440:
         return []
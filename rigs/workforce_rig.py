@@ -2,21 +2,73 @@
 
 from __future__ import annotations
 
+import asyncio
+import random
+import threading
+import weakref
+from concurrent.futures import Executor, ThreadPoolExecutor
 from datetime import date
-from typing import Callable, Dict, List, Optional, Tuple
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
 
+from engines.columnar import ActivityCode, CodeTable, ColumnarWeek
+from archetypes import DEFAULT_TEMPLATES
 from engines.engine_mk2 import EngineMK2
 from models import Activity, ActivityTemplate, PersonProfile, ScheduleIssue
 from modules.calendar_provider import CalendarProvider
 from modules.friction_model import generate_daily_friction
+from modules.instrumentation import StageTimer
+from modules.result_cache import WeekResultCache, fingerprint
 from modules.unique_events import UniqueDay, generate_unique_day_schedule
 from modules.validation import validate_week
 from yearly_budget import YearlyBudget
 
 from .calendar_rig import CalendarRig
 
+if TYPE_CHECKING:
+    # Only used in annotations; engines.population needs process pools and is
+    # not mirrored into the Pyodide worker (see PY_MANIFEST).
+    from engines.population import PopulationSpec
+
 __all__ = ["WorkforceRig"]
 
+_shared_executor: Optional[ThreadPoolExecutor] = None
+_shared_executor_lock = threading.Lock()
+
+
+def _default_executor() -> ThreadPoolExecutor:
+    """Return the thread pool used by async calls on rigs without an executor."""
+
+    global _shared_executor
+    with _shared_executor_lock:
+        if _shared_executor is None:
+            _shared_executor = ThreadPoolExecutor(thread_name_prefix="wyrd-rig")
+        return _shared_executor
+
+
+def _cache_invalidator(rig: "WorkforceRig") -> Callable[[], None]:
+    """Return an engine listener that clears *rig*'s cache without keeping it alive."""
+
+    rig_ref = weakref.ref(rig)
+
+    def invalidate() -> None:
+        target = rig_ref()
+        if target is not None:
+            target.invalidate_cache()
+
+    return invalidate
+
 
 class WorkforceRig(CalendarRig):
     """Composition layer for MK2 that injects calendar and validation modules."""
@@ -33,8 +85,18 @@ class WorkforceRig(CalendarRig):
         validator: Optional[
             Callable[[Dict[str, List[Activity]]], List[ScheduleIssue]]
         ] = None,
+        instrumentation: Optional[StageTimer] = None,
+        cache: Optional[WeekResultCache] = None,
+        executor: Optional[Executor] = None,
+        max_concurrency: Optional[int] = None,
     ) -> None:
         super().__init__(calendar_provider=calendar_provider)
+        self._cache = cache
+        self._executor = executor
+        self._max_concurrency: Optional[int] = None
+        self._limits: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]"
+        self._limits = weakref.WeakKeyDictionary()
+        self.set_max_concurrency(max_concurrency)
 
         self._friction_generator = friction_generator or generate_daily_friction
         self._unique_schedule_generator = (
@@ -48,6 +110,7 @@ class WorkforceRig(CalendarRig):
                 friction_generator=self._friction_generator,
                 unique_schedule_generator=self._unique_schedule_generator,
                 validator=self._validator,
+                instrumentation=instrumentation,
             )
         else:
             self._engine = engine
@@ -55,6 +118,9 @@ class WorkforceRig(CalendarRig):
             self._engine.set_friction_generator(self._friction_generator)
             self._engine.set_unique_schedule_generator(self._unique_schedule_generator)
             self._engine.set_validator(self._validator)
+            if instrumentation is not None:
+                self._engine.set_instrumentation(instrumentation)
+        self._engine.add_listener(_cache_invalidator(self))
 
     @property
     def engine(self) -> EngineMK2:
@@ -62,7 +128,42 @@ class WorkforceRig(CalendarRig):
 
         return self._engine
 
-    def _on_calendar_provider_updated(self, provider: CalendarProvider) -> None:  # pragma: no cover - trivial
+    @property
+    def cache(self) -> Optional[WeekResultCache]:
+        return self._cache
+
+    def set_cache(self, cache: Optional[WeekResultCache]) -> None:
+        self._cache = cache
+
+    @property
+    def executor(self) -> Optional[Executor]:
+        return self._executor
+
+    def set_executor(self, executor: Optional[Executor]) -> None:
+        """Run async generation on *executor*; ``None`` uses a shared thread pool."""
+
+        self._executor = executor
+
+    @property
+    def max_concurrency(self) -> Optional[int]:
+        return self._max_concurrency
+
+    def set_max_concurrency(self, limit: Optional[int]) -> None:
+        """Cap in-flight async generations per event loop; ``None`` removes the cap."""
+
+        if limit is not None and limit <= 0:
+            raise ValueError("max_concurrency must be positive")
+        self._max_concurrency = limit
+        self._limits = weakref.WeakKeyDictionary()
+
+    def invalidate_cache(self) -> None:
+        """Drop cached weeks; the engine calls this whenever a result-shaping
+        module is replaced, including through ``rig.engine.set_*``."""
+
+        if self._cache is not None:
+            self._cache.invalidate()
+
+    def _on_calendar_provider_updated(self, provider: CalendarProvider) -> None:
         self._engine.set_calendar_provider(provider)
 
     def set_friction_generator(
@@ -89,6 +190,9 @@ class WorkforceRig(CalendarRig):
         self._validator = validator or validate_week
         self._engine.set_validator(self._validator)
 
+    def set_instrumentation(self, timer: Optional[StageTimer]) -> None:
+        self._engine.set_instrumentation(timer)
+
     def select_profile(self, archetype: str) -> Tuple[PersonProfile, Dict[str, ActivityTemplate]]:
         """Proxy to the underlying engine for archetype lookup."""
 
@@ -102,9 +206,299 @@ class WorkforceRig(CalendarRig):
         templates: Optional[Dict[str, ActivityTemplate]] = None,
         yearly_budget: Optional[YearlyBudget] = None,
         debug: bool = False,
+        *,
+        rng: Optional[random.Random] = None,
+        seeding: str = "sequential",
+        person_id: Optional[str] = None,
+    ) -> Dict[str, object]:
+        """Delegate generation to the configured engine.
+
+        Each call uses its own random source (seeded from *week_seed* unless
+        *rng* is given), so the rig can be shared across threads. With a
+        cache configured, seeded calls are served from it when the same inputs
+        were generated before; calls with an explicit *rng*, or on a rig with
+        lambda, closure or partial hooks, always generate.
+        """
+
+        key: Optional[str] = None
+        if self._cache is not None and rng is None:
+            key = self._cache_key(
+                profile,
+                start_date,
+                week_seed,
+                templates,
+                yearly_budget,
+                debug=debug,
+                seeding=seeding,
+                person_id=person_id,
+            )
+        if key is not None and self._cache is not None:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+
+        result = self._engine.generate_complete_week(
+            profile,
+            start_date,
+            week_seed,
+            templates,
+            yearly_budget,
+            debug=debug,
+            rng=rng,
+            seeding=seeding,
+            person_id=person_id,
+        )
+        if key is not None and self._cache is not None:
+            self._cache.put(key, result)
+        return result
+
+    def _cache_key(
+        self,
+        profile: PersonProfile,
+        start_date: date,
+        week_seed: int,
+        templates: Optional[Dict[str, ActivityTemplate]],
+        yearly_budget: Optional[YearlyBudget],
+        **options: object,
+    ) -> Optional[str]:
+        """Return the cache key for a week, or ``None`` when it cannot be keyed.
+
+        Hooks without an importable name (lambdas, closures, partials) make
+        the inputs unkeyable, so such weeks are generated without the cache.
+        """
+
+        engine = self._engine
+        try:
+            return fingerprint(
+                engine_version=engine.engine_version,
+                engine=type(engine),
+                placement=engine.placement,
+                calendar_provider=engine.calendar_provider,
+                friction_generator=engine.friction_generator,
+                unique_schedule_generator=engine.unique_schedule_generator,
+                validator=engine.validator,
+                profile=profile,
+                templates=templates or DEFAULT_TEMPLATES,
+                yearly_budget=yearly_budget,
+                seed=week_seed,
+                start_date=start_date,
+                options=options,
+            )
+        except TypeError:
+            return None
+
+    def generate_range(
+        self,
+        profile: PersonProfile,
+        start_date: date,
+        end_date: date,
+        seed: int,
+        templates: Optional[Dict[str, ActivityTemplate]] = None,
+        yearly_budget: Optional[YearlyBudget] = None,
+        debug: bool = False,
+        *,
+        rng: Optional[random.Random] = None,
+        seeding: str = "sequential",
+        person_id: Optional[str] = None,
+    ) -> Iterator[Dict[str, object]]:
+        """Yield consecutive weeks from the configured engine."""
+
+        return self._engine.generate_range(
+            profile,
+            start_date,
+            end_date,
+            seed,
+            templates,
+            yearly_budget,
+            debug=debug,
+            rng=rng,
+            seeding=seeding,
+            person_id=person_id,
+        )
+
+    def generate_columnar_week(
+        self,
+        profile: PersonProfile,
+        start_date: date,
+        week_seed: int,
+        templates: Optional[Dict[str, ActivityTemplate]] = None,
+        yearly_budget: Optional[YearlyBudget] = None,
+        *,
+        activities: Optional[CodeTable[ActivityCode]] = None,
+        day_types: Optional[CodeTable[str]] = None,
+        rng: Optional[random.Random] = None,
+        seeding: str = "sequential",
+        person_id: Optional[str] = None,
+    ) -> ColumnarWeek:
+        """Delegate columnar week generation to the configured engine."""
+
+        return self._engine.generate_columnar_week(
+            profile,
+            start_date,
+            week_seed,
+            templates,
+            yearly_budget,
+            activities=activities,
+            day_types=day_types,
+            rng=rng,
+            seeding=seeding,
+            person_id=person_id,
+        )
+
+    def regenerate_day(
+        self,
+        result: Mapping[str, Any],
+        profile: PersonProfile,
+        day: date,
+        seed: int,
+        templates: Optional[Dict[str, ActivityTemplate]] = None,
+        yearly_budget: Optional[YearlyBudget] = None,
+        *,
+        unique_day: Optional[UniqueDay] = None,
+        person_id: Optional[str] = None,
+    ) -> Dict[str, object]:
+        """Regenerate a single day of an existing week result."""
+
+        return self._engine.regenerate_day(
+            result,
+            profile,
+            day,
+            seed,
+            templates,
+            yearly_budget,
+            unique_day=unique_day,
+            person_id=person_id,
+        )
+
+    # ------------------------------------------------------------------
+    # Async API
+    # ------------------------------------------------------------------
+    async def agenerate_complete_week(
+        self,
+        profile: PersonProfile,
+        start_date: date,
+        week_seed: int,
+        templates: Optional[Dict[str, ActivityTemplate]] = None,
+        yearly_budget: Optional[YearlyBudget] = None,
+        debug: bool = False,
+        *,
+        seeding: str = "sequential",
+        person_id: Optional[str] = None,
     ) -> Dict[str, object]:
-        """Delegate generation to the configured engine."""
+        """Generate a week like :meth:`generate_complete_week` without blocking the loop.
+
+        The engine runs on the rig's executor, with at most ``max_concurrency``
+        generations in flight per event loop. Every request is seeded from its
+        own *week_seed*, so results do not depend on scheduling order. Cache
+        lookups happen on the loop; only misses are offloaded.
+
+        Cancelling the awaiting task cancels work that has not started yet.
+        Work already running finishes in the background and still counts
+        against the concurrency limit until it does. With a process pool the
+        engine and its hooks must be picklable.
+        """
+
+        key: Optional[str] = None
+        if self._cache is not None:
+            key = self._cache_key(
+                profile,
+                start_date,
+                week_seed,
+                templates,
+                yearly_budget,
+                debug=debug,
+                seeding=seeding,
+                person_id=person_id,
+            )
+        if key is not None and self._cache is not None:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
 
-        return self._engine.generate_complete_week(
-            profile, start_date, week_seed, templates, yearly_budget, debug=debug
+        result = await self._offload(
+            partial(
+                self._engine.generate_complete_week,
+                profile,
+                start_date,
+                week_seed,
+                templates,
+                yearly_budget,
+                debug=debug,
+                seeding=seeding,
+                person_id=person_id,
+            )
         )
+        if key is not None and self._cache is not None:
+            self._cache.put(key, result)
+        return result
+
+    async def agenerate_many(
+        self,
+        specs: Iterable[PopulationSpec],
+        *,
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """Generate one week per spec concurrently and return results in input order.
+
+        Archetype keys in ``spec.profile`` are resolved through
+        :meth:`select_profile`. When a generation fails, the remaining ones are
+        cancelled and the error is raised, unless *return_exceptions* is set,
+        in which case exceptions are returned in place of their results.
+        """
+
+        tasks = [asyncio.ensure_future(self._agenerate_spec(spec)) for spec in specs]
+        try:
+            return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    async def _agenerate_spec(self, spec: PopulationSpec) -> Dict[str, object]:
+        profile = spec.profile
+        templates = spec.templates
+        if isinstance(profile, str):
+            profile, archetype_templates = self.select_profile(profile)
+            templates = templates or archetype_templates
+        return await self.agenerate_complete_week(
+            profile,
+            spec.start_date,
+            spec.seed,
+            templates,
+            spec.yearly_budget,
+            seeding=spec.seeding,
+            person_id=spec.person_id,
+        )
+
+    def _limit(self, loop: asyncio.AbstractEventLoop) -> Optional[asyncio.Semaphore]:
+        if self._max_concurrency is None:
+            return None
+        semaphore = self._limits.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self._max_concurrency)
+            self._limits[loop] = semaphore
+        return semaphore
+
+    async def _offload(self, call: Callable[[], Dict[str, object]]) -> Dict[str, object]:
+        loop = asyncio.get_running_loop()
+        semaphore = self._limit(loop)
+        if semaphore is not None:
+            await semaphore.acquire()
+        try:
+            future = (self._executor or _default_executor()).submit(call)
+        except BaseException:
+            if semaphore is not None:
+                semaphore.release()
+            raise
+        if semaphore is not None:
+            # Release only once the worker is done, even if the caller was
+            # cancelled while the job was already running.
+            def release(_: object) -> None:
+                try:
+                    loop.call_soon_threadsafe(semaphore.release)
+                except RuntimeError:  # the loop has already been closed
+                    pass
+
+            future.add_done_callback(release)
+        return await asyncio.wrap_future(future, loop=loop)
@@ -20,7 +20,7 @@ from archetypes import (
     create_night_owl_freelancer,
     create_office_worker,
 )
-from engines.engine_mk2 import EngineMK2
+from engines.population import PopulationSpec, generate_population
 from models import PersonProfile
 
 ARCHETYPE_FACTORIES: Dict[str, Callable[[], PersonProfile]] = {
@@ -99,25 +99,25 @@ def main() -> None:
     parser.add_argument(
         "--seed", type=int, default=42, help="Seed for sampling the population and weekly schedules"
     )
+    parser.add_argument(
+        "--workers", type=int, default=1, help="Worker processes used to generate the population"
+    )
     args = parser.parse_args()
 
     rng = random.Random(args.seed)
-    engine = EngineMK2()
 
     sleep_totals: List[float] = []
     work_totals: List[float] = []
     free_totals: List[float] = []
 
+    specs: List[PopulationSpec] = []
     for index in range(args.samples):
         archetype = pick_archetype(args.archetypes, rng)
         profile = build_profile(archetype)
         week_seed = rng.randint(0, 10_000_000)
-        result = engine.generate_complete_week(
-            profile=profile,
-            start_date=date(2024, 1, 1),
-            week_seed=week_seed,
-        )
+        specs.append(PopulationSpec(profile=profile, seed=week_seed, start_date=date(2024, 1, 1)))
 
+    for result in generate_population(specs, workers=args.workers):
         summary = summarise_events(result["events"])
         sleep_totals.append(summary.get("sleep", 0.0))
         work_totals.append(summary.get("work", 0.0))
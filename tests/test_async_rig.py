@@ -0,0 +1,99 @@
+"""Tests for the asyncio API on WorkforceRig."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+import pytest
+
+from engines.population import PopulationSpec
+from modules.result_cache import WeekResultCache
+from rigs.workforce_rig import WorkforceRig
+
+WEEK_START = date(2025, 3, 3)
+SPECS = tuple(
+    PopulationSpec(profile=archetype, seed=seed, start_date=WEEK_START)
+    for seed, archetype in enumerate(["office", "parent", "freelancer"] * 2)
+)
+
+
+def test_async_week_matches_blocking_call() -> None:
+    rig = WorkforceRig()
+    profile, templates = rig.select_profile("office")
+
+    result = asyncio.run(rig.agenerate_complete_week(profile, WEEK_START, 11, templates))
+
+    assert result == rig.generate_complete_week(profile, WEEK_START, 11, templates)
+
+
+def test_agenerate_many_is_ordered_and_deterministic() -> None:
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        rig = WorkforceRig(executor=executor, max_concurrency=2, cache=WeekResultCache())
+        results = asyncio.run(rig.agenerate_many(SPECS))
+
+    expected = []
+    for spec in SPECS:
+        profile, templates = WorkforceRig().select_profile(spec.profile)
+        expected.append(WorkforceRig().generate_complete_week(profile, WEEK_START, spec.seed, templates))
+    assert results == expected
+
+
+def test_concurrency_limit_is_respected() -> None:
+    rig = WorkforceRig(max_concurrency=2)
+    lock = threading.Lock()
+    active = peak = 0
+    generate = rig.engine.generate_complete_week
+
+    def tracked(*args, **kwargs):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        try:
+            return generate(*args, **kwargs)
+        finally:
+            with lock:
+                active -= 1
+
+    rig.engine.generate_complete_week = tracked
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        rig.set_executor(executor)
+        asyncio.run(rig.agenerate_many(SPECS * 2))
+
+    assert peak <= 2
+
+
+def test_failure_cancels_remaining_requests() -> None:
+    started = threading.Event()
+    release = threading.Event()
+    rig = WorkforceRig(max_concurrency=1)
+    generate = rig.engine.generate_complete_week
+
+    def blocking(profile, *args, **kwargs):
+        if profile.name == "Office Worker":
+            started.set()
+            release.wait(5)
+            raise RuntimeError("boom")
+        return generate(profile, *args, **kwargs)
+
+    rig.engine.generate_complete_week = blocking
+
+    async def run() -> None:
+        batch = asyncio.ensure_future(rig.agenerate_many(SPECS))
+        await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+        release.set()
+        await batch
+
+    with pytest.raises(RuntimeError, match="boom"):
+        asyncio.run(run())
+
+    returned = asyncio.run(rig.agenerate_many(SPECS[1:3], return_exceptions=True))
+    assert all(isinstance(result, dict) for result in returned)
+
+
+def test_max_concurrency_must_be_positive() -> None:
+    with pytest.raises(ValueError):
+        WorkforceRig(max_concurrency=0)
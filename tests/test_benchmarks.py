@@ -0,0 +1,39 @@
+"""Smoke tests for the benchmark suite."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from benchmarks.cases import CASES
+from benchmarks.runner import DEFAULT_BASELINE, compare, main, run_suite
+
+
+def test_every_case_runs_and_baseline_covers_it() -> None:
+    results = run_suite(repeats=1, scale=0.01)
+
+    assert set(results) == {case.name for case in CASES}
+    assert all(row["weeks"] > 0 and row["events"] > 0 for row in results.values())
+    assert set(json.loads(DEFAULT_BASELINE.read_text())["cases"]) == set(results)
+
+
+def test_compare_flags_throughput_and_memory_regressions() -> None:
+    baseline = {"case": {"weeks_per_sec": 100.0, "events_per_sec": 1000.0, "peak_kib": 100.0}}
+
+    within = {"case": {"weeks_per_sec": 80.0, "events_per_sec": 800.0, "peak_kib": 120.0}}
+    assert compare(within, baseline, tolerance=0.25) == []
+
+    slower = {"case": {"weeks_per_sec": 70.0, "events_per_sec": 700.0, "peak_kib": 200.0}}
+    messages = compare(slower, baseline, tolerance=0.25)
+    assert len(messages) == 3
+    assert compare({"other": slower["case"]}, baseline) == []
+
+
+def test_update_then_compare_round_trips(tmp_path: Path, capsys) -> None:
+    baseline = tmp_path / "baseline.json"
+    argv = ["--baseline", str(baseline), "--only", "validate_week", "--repeats", "1", "--scale", "0.01"]
+
+    assert main([*argv, "--update"]) == 0
+    assert list(json.loads(baseline.read_text())["cases"]) == ["validate_week"]
+    assert main([*argv, "--tolerance", "1.0"]) == 0
+    capsys.readouterr()
@@ -0,0 +1,94 @@
+"""Tests for the ``cli.py profile`` mode."""
+
+from __future__ import annotations
+
+import io
+import json
+from contextlib import redirect_stdout
+from pathlib import Path
+
+import pytest
+
+import cli
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_profile_reports_stages_functions_and_memory(tmp_path: Path) -> None:
+    report_path = tmp_path / "profile.json"
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        cli.main(
+            [
+                "profile",
+                "--engine",
+                "mk2",
+                "--rig",
+                "workforce",
+                "--seeds",
+                "2",
+                "--weeks",
+                "2",
+                "--top",
+                "5",
+                "--json",
+                str(report_path),
+            ]
+        )
+
+    report = json.loads(report_path.read_text())
+    assert report["weeks_generated"] == 4
+    assert report["events"] > 0
+    assert {row["stage"] for row in report["stages"]} >= {"planning", "placement"}
+    assert sum(row["calls"] for row in report["stages"] if row["stage"] == "planning") == 4
+    assert len(report["hot_functions"]) == 5
+    assert report["memory"]["peak_kib"] > 0
+    assert "Hottest functions" in buffer.getvalue()
+
+
+def test_profile_supports_mk1_simple_rig() -> None:
+    args = cli.parse_args(
+        [
+            "profile",
+            "--engine",
+            "mk1",
+            "--rig",
+            "simple",
+            "--config",
+            str(ROOT / "tests/fixtures/deterministic_sample_config.json"),
+            "--seeds",
+            "2",
+        ]
+    )
+    report = cli.profile_generation(args)
+
+    assert args.weeks == 1
+    assert report["weeks_generated"] == 2
+    assert report["stage_timing"] is False
+    assert report["stages"] == []
+    assert report["memory"]["retained_bytes_per_event"] > 0
+
+
+def test_profile_is_a_subcommand_that_accepts_global_options(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    with pytest.raises(SystemExit):
+        cli.main(["--help"])
+    assert "profile" in capsys.readouterr().out
+
+    args = cli.parse_args(
+        ["--engine", "mk2", "--rig", "workforce", "--seed", "7", "profile", "--seeds", "2"]
+    )
+    assert (args.command, args.engine, args.rig, args.seed, args.seeds) == (
+        "profile",
+        "mk2",
+        "workforce",
+        7,
+        2,
+    )
+    assert args.weeks == cli.PROFILE_WEEKS
+
+
+def test_profile_rejects_mismatched_engine() -> None:
+    with pytest.raises(SystemExit), redirect_stdout(io.StringIO()):
+        cli.main(["profile", "--engine", "mk1", "--rig", "workforce"])
@@ -0,0 +1,44 @@
+"""Tests for the columnar MK2 week representation."""
+
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+from engines.columnar import CodeTable
+from engines.engine_mk2 import EngineMK2
+
+
+@pytest.mark.parametrize("archetype", ["office", "parent", "freelancer"])
+@pytest.mark.parametrize("start", [date(2025, 1, 6), date(2025, 12, 22)])
+def test_columnar_week_round_trips_to_dict_result(archetype: str, start: date) -> None:
+    engine = EngineMK2()
+    profile, templates = engine.select_profile(archetype)
+
+    week = engine.generate_columnar_week(profile, start, 7, templates)
+    expected = engine.generate_complete_week(profile, start, 7, templates)
+
+    assert week.to_result() == expected
+    assert len(week) == len(expected["events"])
+
+
+def test_code_tables_are_shared_across_weeks() -> None:
+    engine = EngineMK2()
+    activities: CodeTable = CodeTable()
+    day_types: CodeTable = CodeTable()
+
+    weeks = [
+        engine.generate_columnar_week(
+            profile, date(2025, 3, 3), seed, templates, activities=activities, day_types=day_types
+        )
+        for seed, (profile, templates) in enumerate(
+            engine.select_profile(name) for name in ("office", "parent", "freelancer")
+        )
+    ]
+
+    names = {activities[code].name for week in weeks for code in week.activity_code}
+    assert "sleep" in names
+    assert len(activities) == len(set(activities[i] for i in range(len(activities))))
+    assert all(week.activities is activities for week in weeks)
+    assert weeks[0].summary_minutes()["sleep"] > 0
@@ -0,0 +1,222 @@
+"""Tests for the deterministic MK1 engine."""
+
+from __future__ import annotations
+
+import random
+from datetime import date
+
+import pytest
+
+from engines.base import ScheduleInput
+from engines.engine_mk1 import (
+    CompiledCharacterConfig,
+    DaySchedule,
+    EngineMK1,
+    compile_character_config,
+    load_character_config,
+)
+
+DAY = date(2025, 1, 6)
+
+
+def test_day_schedule_rejects_overlaps_and_tracks_gaps() -> None:
+    day = DaySchedule(0, DAY)
+    assert day.add_event(600, 660, "work")
+    assert day.add_event(0, 420, "sleep")
+    assert not day.add_event(650, 700, "lunch")
+    assert not day.add_event(600, 660, "gym")
+    assert not day.add_event(300, 1000, "gym")
+    assert day.add_event(660, 690, "lunch")
+
+    assert day.free_segments() == [(420, 600), (690, 1440)]
+    assert [event.activity for event in day.to_events()] == ["sleep", "work", "lunch"]
+
+
+def test_find_slot_prefers_desired_then_later_then_earlier_gaps() -> None:
+    day = DaySchedule(0, DAY)
+    day.add_event(0, 420, "sleep")
+    day.add_event(450, 1000, "work")
+    day.add_event(1030, 1440, "sleep")
+
+    assert day.find_slot(425, 20) == (425, 445)
+    assert day.find_slot(425, 30) == (1000, 1030)
+    assert day.find_slot(1100, 30) == (1000, 1030)
+    assert day.find_slot(0, 45) is None
+
+
+def test_fill_free_time_covers_the_day() -> None:
+    day = DaySchedule(2, DAY)
+    for start in range(0, 1440, 90):
+        day.add_event(start, start + 30, f"block{start}")
+    day.fill_free_time()
+
+    assert day.free_segments() == []
+    day.validate()
+    assert sum(event.duration_minutes for event in day.to_events()) == 1440
+
+
+def test_validate_checks_the_emitted_events() -> None:
+    day = DaySchedule(2, DAY)
+    day.add_event(0, 720, "sleep")
+    day.fill_free_time()
+    day.validate()
+
+    # The bitmap stays full, but the event list now overlaps.
+    day._events[0] = (0, 800, "sleep")
+    with pytest.raises(ValueError):
+        day.validate()
+
+
+CONFIG = {
+    "name": "Compiled",
+    "sleep": {"bedtime": "23:00", "duration_hours": 8},
+    "work": {"start": "09:00", "duration_hours": 8, "days": ["monday", "tuesday", "wednesday", "thursday", "friday"]},
+    "meals": {"breakfast": "07:30", "lunch": "12:30", "dinner": "18:30"},
+    "activities": [{"name": "gym", "time": "19:30", "duration_minutes": 60, "days": ["tuesday", "saturday"]}],
+}
+
+
+def test_compiled_config_is_cached_by_content_and_precomputed() -> None:
+    compiled = compile_character_config(CONFIG)
+    assert isinstance(compiled, CompiledCharacterConfig)
+    assert compile_character_config(dict(CONFIG)) is compiled
+    assert compile_character_config(compiled) is compiled
+
+    assert compiled.sleep.start_minutes == 23 * 60
+    assert compiled.work is not None and compiled.work.day_indices == (0, 1, 2, 3, 4)
+    assert compiled.meals.start_minutes() == (("breakfast", 450), ("lunch", 750), ("dinner", 1110))
+    assert compiled.activities[0].day_indices == (1, 5)
+    with pytest.raises(AttributeError):
+        compiled.name = "changed"  # type: ignore[misc]
+
+
+def test_compiled_config_matches_parsed_config_output() -> None:
+    engine = EngineMK1(reference_start=DAY)
+    outputs = []
+    for constraints in (CONFIG, load_character_config(CONFIG), compile_character_config(CONFIG)):
+        random.seed(7)
+        outputs.append(engine.generate(ScheduleInput(constraints=constraints)))
+    assert outputs[0] == outputs[1] == outputs[2]
+
+
+def test_generate_weeks_reuses_base_week_and_redates_events() -> None:
+    engine = EngineMK1(reference_start=DAY)
+    schedule_input = ScheduleInput(constraints=CONFIG)
+
+    random.seed(11)
+    single = engine.generate(schedule_input)
+    random.seed(11)
+    weeks = list(engine.generate_weeks(schedule_input, 3))
+
+    assert len(weeks) == 3
+    assert weeks[0] == single
+    assert weeks[2].diagnostics["week_start"] == date(2025, 1, 20)
+    assert weeks[2].events[0]["date"] == "2025-01-20"
+    assert [event["activity"] for event in weeks[2].events] == [
+        event["activity"] for event in single.events
+    ]
+    assert weeks[2].totals["work"] == single.totals["work"]
+
+
+def test_generate_weeks_jitter_is_reproducible_per_week_seed() -> None:
+    engine = EngineMK1(reference_start=DAY)
+    schedule_input = ScheduleInput(constraints=CONFIG, seed=5)
+
+    first = list(engine.generate_weeks(schedule_input, 4))
+    second = list(engine.generate_weeks(schedule_input, 2))
+
+    assert first[:2] == second
+    spans = [[(event["start"], event["end"]) for event in week.events] for week in first]
+    assert spans[0] != spans[1]
+
+
+def _batch_inputs() -> list:
+    other = dict(CONFIG, name="Other", activities=[])
+    return [
+        ScheduleInput(constraints=config).with_metadata(start_date=start)
+        for config in (CONFIG, other, dict(CONFIG))
+        for start in (DAY, date(2025, 2, 3))
+    ]
+
+
+def test_generate_many_matches_generate_in_input_order() -> None:
+    engine = EngineMK1()
+    inputs = _batch_inputs()
+
+    random.seed(3)
+    expected = [engine.generate(schedule_input) for schedule_input in inputs]
+    random.seed(3)
+    batched = list(engine.generate_many(inputs, workers=1, chunksize=4))
+
+    assert batched == expected
+
+
+def test_generate_many_parallel_totals_only() -> None:
+    engine = EngineMK1()
+    inputs = _batch_inputs()
+
+    outputs = list(engine.generate_many(inputs, workers=2, chunksize=2, include_events=False))
+
+    assert [output.diagnostics["week_start"] for output in outputs] == [
+        schedule_input.metadata["start_date"] for schedule_input in inputs
+    ]
+    assert [output.diagnostics["character_name"] for output in outputs][:4] == [
+        "Compiled",
+        "Compiled",
+        "Other",
+        "Other",
+    ]
+    for output in outputs:
+        assert output.events == ()
+        assert sum(output.totals.values()) == pytest.approx(7 * 24)
+    assert "gym" not in outputs[2].totals
+
+
+def test_seed_gives_isolated_reproducible_jitter() -> None:
+    engine = EngineMK1(reference_start=DAY)
+    seeded = ScheduleInput(constraints=CONFIG, seed=21)
+
+    random.seed(1)
+    state = random.getstate()
+    first = engine.generate(seeded)
+    assert random.getstate() == state
+
+    random.seed(99)
+    assert engine.generate(seeded) == first
+    assert engine.generate(ScheduleInput(constraints=CONFIG, seed=22)) != first
+    assert list(engine.generate_weeks(seeded, 1)) == [first]
+
+
+def test_generate_many_seeded_matches_generate_across_workers() -> None:
+    engine = EngineMK1(reference_start=DAY)
+    inputs = [ScheduleInput(constraints=CONFIG, seed=seed) for seed in (1, 2, 1, 3)]
+
+    expected = [engine.generate(schedule_input) for schedule_input in inputs]
+    parallel = list(engine.generate_many(inputs, workers=2, chunksize=2))
+    serial = list(engine.generate_many(inputs, workers=1))
+
+    assert parallel == expected
+    assert serial == expected
+    assert serial[0] is not serial[2]
+    serial[0].events[0]["activity"] = "changed"
+    serial[0].totals["sleep"] = 0
+    assert serial[2] == expected[2]
+
+
+def test_day_schedule_occupancy_snapshot_is_labelled() -> None:
+    day = DaySchedule(0, DAY)
+    day.add_event(0, 420, "sleep")
+    day.add_event(600, 660, "work")
+    day.fill_free_time()
+    day.validate()
+
+    occupancy = day.occupancy()
+    assert occupancy.is_full()
+    assert occupancy.label_at(0) == "sleep"
+    assert occupancy.label_at(500) == "free time"
+    assert [segment[2] for segment in occupancy.segments()] == [
+        "sleep",
+        "free time",
+        "work",
+        "free time",
+    ]
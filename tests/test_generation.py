@@ -2,12 +2,23 @@
 
 from __future__ import annotations
 
+import gc
+import pickle
+import random
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 
+import models
 from archetypes import create_office_worker
 from calendar_gen_v2 import generate_complete_week
-from models import PersonProfile, WeeklyBudget
+from engines.engine_mk2 import (
+    EngineMK2,
+    _EventRecord,
+    _serialize_event_records,
+    normalize_mk2_events,
+)
+from models import Activity, Event, PersonProfile, WeeklyBudget, activity_prototype
 
 
 class TestGeneration(unittest.TestCase):
@@ -44,6 +55,134 @@ class TestGeneration(unittest.TestCase):
         overflow_issues = [issue for issue in result["issues"] if issue["issue_type"] == "overflow"]
         self.assertTrue(overflow_issues)
 
+    def test_generation_leaves_global_random_untouched(self) -> None:
+        random.seed(123)
+        expected = random.random()
+
+        random.seed(123)
+        generate_complete_week(create_office_worker(), date(2025, 1, 6), week_seed=7)
+        self.assertEqual(random.random(), expected)
+
+    def test_concurrent_weeks_match_sequential_output(self) -> None:
+        engine = EngineMK2()
+        profile, templates = engine.select_profile("parent")
+        seeds = list(range(16))
+
+        def run(seed: int) -> dict:
+            return engine.generate_complete_week(profile, date(2025, 3, 3), seed, templates)
+
+        sequential = [run(seed) for seed in seeds]
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            concurrent = list(pool.map(run, seeds))
+        self.assertEqual(sequential, concurrent)
+
+    def test_friction_hook_receives_engine_rng(self) -> None:
+        received = []
+
+        def friction(day: int, base: float, variance: float, rng: random.Random) -> float:
+            received.append(rng)
+            return base
+
+        engine = EngineMK2(friction_generator=friction)
+        engine.generate_complete_week(create_office_worker(), date(2025, 1, 6), 5)
+        self.assertEqual(len(received), 7)
+        self.assertTrue(all(isinstance(rng, random.Random) for rng in received))
+        self.assertEqual(len({id(rng) for rng in received}), 1)
+
+    def test_generate_range_yields_consecutive_weeks(self) -> None:
+        engine = EngineMK2()
+        profile, templates = engine.select_profile("office")
+        weeks = engine.generate_range(
+            profile, date(2025, 1, 6), date(2025, 3, 30), seed=9, templates=templates
+        )
+
+        first = next(weeks)
+        self.assertEqual(first["week_start"], "2025-01-06")
+        rest = list(weeks)
+        self.assertEqual(len(rest), 11)
+        self.assertEqual(rest[-1]["week_start"], "2025-03-24")
+        self.assertTrue(all(week["metadata"]["total_events"] > 0 for week in rest))
+
+    def test_generate_range_carries_rng_across_weeks(self) -> None:
+        engine = EngineMK2()
+        profile, templates = engine.select_profile("office")
+        start, end = date(2025, 1, 6), date(2025, 1, 19)
+
+        weeks = list(engine.generate_range(profile, start, end, seed=9, templates=templates))
+        rng = random.Random(9)
+        expected = [
+            engine.generate_complete_week(profile, start, 0, templates, rng=rng),
+            engine.generate_complete_week(profile, date(2025, 1, 13), 0, templates, rng=rng),
+        ]
+        self.assertEqual(weeks, expected)
+
+    def test_generate_range_rejects_inverted_dates(self) -> None:
+        engine = EngineMK2()
+        profile = create_office_worker()
+        with self.assertRaises(ValueError):
+            next(engine.generate_range(profile, date(2025, 2, 1), date(2025, 1, 1), seed=1))
+
+    def test_iter_events_matches_counter_seeded_week(self) -> None:
+        engine = EngineMK2()
+        profile, templates = engine.select_profile("parent")
+        start = date(2025, 1, 6)
+
+        events = engine.iter_events(profile, start, 14, seed=5, templates=templates, seeding="counter")
+        self.assertEqual(next(events)["date"], "2025-01-06")
+        rest = list(events)
+        second_week = engine.generate_complete_week(
+            profile, date(2025, 1, 13), 5, templates, seeding="counter"
+        )
+        second_week_events = [event for event in rest if event["date"] >= "2025-01-13"]
+        self.assertEqual(
+            [{**event, "day_index": 0, "minute_range": None} for event in second_week_events],
+            [{**event, "day_index": 0, "minute_range": None} for event in second_week["events"]],
+        )
+        self.assertEqual(rest[-1]["day_index"], 13)
+        self.assertGreaterEqual(rest[-1]["minute_range"][0], 13 * 1440)
+
+    def test_event_records_serialize_like_normalizer(self) -> None:
+        day = date(2025, 1, 7)
+        events = [
+            Event(day, "tuesday", 1380, 1440, Activity("sleep", 60, 1.0)),
+            Event(day, "tuesday", 420, 480, Activity("commute", 45, 1.3, optional=True)),
+            Event(day, "tuesday", 600, 600, Activity("break", 0, 1.0)),
+            Event(date.min, "", 0, 1440, Activity("free time", 1440, 1.0, priority=5)),
+        ]
+        records = [_EventRecord.from_event(event, 1, day, "workday") for event in events]
+
+        expected = normalize_mk2_events(
+            [record.as_raw() for record in records], week_start=date(2025, 1, 6)
+        )
+        self.assertEqual(_serialize_event_records(records), expected)
+
+    def test_activities_share_prototypes_and_models_are_slotted(self) -> None:
+        prototype = activity_prototype("lunch", 30, 1.2, optional=False, priority=2)
+        first = Activity("lunch", 30, 1.2, optional=False, priority=2)
+        second = prototype.instantiate(base_duration_minutes=45)
+        self.assertIs(first.prototype, prototype)
+        self.assertIs(second.prototype, prototype)
+        self.assertEqual((first.actual_duration, second.actual_duration), (36, 54))
+
+        first.base_duration_minutes = 20
+        first.actual_duration = 24
+        first.priority = 1
+        self.assertEqual((second.base_duration_minutes, second.priority), (45, 2))
+        self.assertEqual(prototype.base_duration_minutes, 30)
+        self.assertIs(first.prototype, activity_prototype("lunch", 30, 1.2, False, 1))
+        self.assertEqual(pickle.loads(pickle.dumps(first)), first)
+
+        self.assertFalse(hasattr(first, "__dict__"))
+        self.assertFalse(hasattr(Event(date(2025, 1, 6), "monday", 0, 30, first), "__dict__"))
+
+    def test_unused_activity_prototypes_are_released(self) -> None:
+        activity = Activity("one-off errand", 17, 1.0)
+        key = ("one-off errand", 17, 1.0, True, 5)
+        self.assertIn(key, models._PROTOTYPES)
+        del activity
+        gc.collect()
+        self.assertNotIn(key, models._PROTOTYPES)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,59 @@
+"""Tests for MK2 stage timing instrumentation."""
+
+from __future__ import annotations
+
+import pickle
+from datetime import date
+
+from engines.engine_mk2 import EngineMK2
+from modules.instrumentation import StageTimer
+from rigs.workforce_rig import WorkforceRig
+
+
+def test_stage_timer_aggregates_across_weeks() -> None:
+    timer = StageTimer()
+    rig = WorkforceRig(instrumentation=timer)
+    profile, templates = rig.select_profile("office")
+
+    results = [
+        rig.generate_complete_week(profile, date(2025, 3, 3), seed, templates) for seed in range(3)
+    ]
+
+    stats = timer.snapshot()
+    assert set(stats) == {
+        "planning",
+        "validation",
+        "compression",
+        "placement",
+        "free_time",
+        "jitter",
+        "normalization",
+        "summary",
+    }
+    assert stats["planning"].calls == 3
+    assert stats["placement"].calls == 21
+    assert stats["normalization"].events == sum(len(result["events"]) for result in results)
+    assert all(row["total_ms"] >= 0 for row in timer.report())
+
+
+def test_instrumentation_does_not_change_output() -> None:
+    engine = EngineMK2()
+    profile, templates = engine.select_profile("parent")
+    plain = engine.generate_complete_week(profile, date(2025, 5, 5), 11, templates)
+
+    engine.set_instrumentation(StageTimer())
+    assert engine.generate_complete_week(profile, date(2025, 5, 5), 11, templates) == plain
+
+
+def test_stage_timer_pickles_and_merges() -> None:
+    ticks = iter(range(100))
+    timer = StageTimer(clock=lambda: float(next(ticks)))
+    with timer.stage("placement") as stage:
+        stage.events = 4
+
+    copy = pickle.loads(pickle.dumps(StageTimer()))
+    copy.record("placement", 2.0, events=1)
+    timer.merge(copy)
+
+    stats = timer.snapshot()["placement"]
+    assert (stats.calls, stats.seconds, stats.max_seconds, stats.events) == (2, 3.0, 2.0, 5)
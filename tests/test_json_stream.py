@@ -0,0 +1,141 @@
+"""Tests for the streaming JSON writer."""
+
+from __future__ import annotations
+
+import gzip
+import io
+import json
+import tracemalloc
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+
+import cli
+from calendar_gen_v2 import write_weeks
+from modules.json_stream import dump_json, write_json
+from rigs.workforce_rig import WorkforceRig
+
+
+def _week() -> dict:
+    rig = WorkforceRig()
+    profile, templates = rig.select_profile("office")
+    return rig.generate_complete_week(profile, date(2025, 1, 6), 7, templates)
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_output_matches_json_dumps(compact: bool) -> None:
+    week = _week()
+    payload = {"weeks": [week, week], "empty": {}, "none": [], 3: (1, 2), None: list(range(40))}
+
+    buffer = io.StringIO()
+    write_json(payload, buffer, compact=compact)
+
+    if compact:
+        expected = json.dumps(payload, separators=(",", ":"))
+    else:
+        expected = json.dumps(payload, indent=2)
+    assert buffer.getvalue() == expected
+
+
+def test_gzip_output_round_trips(tmp_path: Path) -> None:
+    week = _week()
+    path = tmp_path / "week.json.gz"
+    dump_json(week, path)
+    first = path.read_bytes()
+    dump_json(week, path)
+
+    assert path.read_bytes() == first
+    assert json.loads(gzip.decompress(first)) == week
+
+
+def test_iterators_stream_with_bounded_memory() -> None:
+    def events(count: int):
+        for index in range(count):
+            yield {"index": index, "activity": "work", "minute_range": [index, index + 1]}
+
+    class _Sink(io.TextIOBase):
+        def write(self, text: str) -> int:
+            return len(text)
+
+    count = 20_000
+    full_size = len(json.dumps({"events": list(events(count))}, indent=2))
+
+    tracemalloc.start()
+    write_json({"events": events(count)}, _Sink())
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert peak < full_size // 4
+
+
+def test_cli_compact_gzip_output(tmp_path: Path, capsys) -> None:
+    output = tmp_path / "week.json"
+    cli.main(
+        [
+            "--engine",
+            "mk2",
+            "--rig",
+            "workforce",
+            "--seed",
+            "7",
+            "--start-date",
+            "2025-01-06",
+            "--output",
+            str(output),
+            "--compact",
+            "--gzip",
+        ]
+    )
+    capsys.readouterr()
+
+    text = gzip.decompress(output.read_bytes()).decode("utf-8")
+    assert "\n" not in text
+    assert json.loads(text) == _week()
+
+
+def test_cli_streams_multi_week_output(tmp_path: Path, capsys) -> None:
+    output = tmp_path / "weeks.json"
+    cli.main(
+        [
+            "--engine",
+            "mk2",
+            "--rig",
+            "workforce",
+            "--seed",
+            "7",
+            "--start-date",
+            "2025-01-06",
+            "--weeks",
+            "3",
+            "--output",
+            str(output),
+        ]
+    )
+    assert "Generated 3 weeks" in capsys.readouterr().out
+
+    rig = WorkforceRig()
+    profile, templates = rig.select_profile("office")
+    expected = list(
+        rig.generate_range(profile, date(2025, 1, 6), date(2025, 1, 20), 7, templates)
+    )
+    assert json.loads(output.read_text()) == {"person": profile.name, "weeks": expected}
+
+
+def test_write_weeks_memory_does_not_grow_with_week_count(tmp_path: Path) -> None:
+    rig = WorkforceRig()
+    profile, templates = rig.select_profile("office")
+
+    def peak(weeks: int) -> int:
+        start = date(2025, 1, 6)
+        source = rig.generate_range(
+            profile, start, start + timedelta(weeks=weeks - 1), 7, templates
+        )
+        tracemalloc.start()
+        write_weeks(source, tmp_path / f"{weeks}.json", person=profile.name)
+        _, result = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return result
+
+    peak(1)
+    assert peak(16) < 2 * peak(2)
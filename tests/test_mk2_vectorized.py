@@ -0,0 +1,84 @@
+"""Tests for the NumPy-vectorised MK2 population kernel."""
+
+from __future__ import annotations
+
+import math
+from datetime import date
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from engines.engine_mk2 import EngineMK2  # noqa: E402
+from engines.mk2_vectorized import VectorizedEngineMK2, _draw_block  # noqa: E402
+from models import PersonProfile, WeeklyBudget  # noqa: E402
+
+
+class _ReplayRandom:
+    """Feed the kernel's per-person draw streams to the scalar engine."""
+
+    def __init__(self, draws, row: int) -> None:
+        self._normals = list(draws.friction[row]) + list(draws.jitter[row])
+        self._optional = list(draws.optional[row])
+        self._placement = list(draws.placement[row])
+
+    def gauss(self, mu: float, sigma: float) -> float:
+        return mu + sigma * self._normals.pop(0)
+
+    def random(self) -> float:
+        return self._optional.pop(0)
+
+    def randint(self, low: int, high: int) -> int:
+        return low + int(math.floor(self._placement.pop(0) * (high - low + 1)))
+
+
+@pytest.mark.parametrize("archetype", ["office", "parent", "freelancer"])
+@pytest.mark.parametrize(
+    "start", [date(2025, 1, 6), date(2025, 4, 21), date(2025, 8, 4), date(2025, 12, 22)]
+)
+def test_kernel_matches_scalar_engine(archetype: str, start: date) -> None:
+    engine = EngineMK2()
+    kernel = VectorizedEngineMK2(engine, block_size=4)
+    profile, templates = engine.select_profile(archetype)
+    overworked = PersonProfile(
+        "Overworked",
+        WeeklyBudget(sleep_hours=40, work_hours=80, gym_hours=4, social_hours=12, chores_hours=9),
+        base_waste_factor=1.6,
+        friction_variance=0.05,
+    )
+    profiles = [profile] * 5 + [overworked] * 2
+
+    batch = kernel.generate_week_batch(profiles, start, 11, templates)
+
+    for index, person in enumerate(profiles):
+        block, row = divmod(index, 4)
+        draws = _draw_block(11, block, min(4, len(profiles) - block * 4))
+        expected = engine.generate_complete_week(
+            person, start, 0, templates, rng=_ReplayRandom(draws, row)
+        )
+        assert batch.result(index) == expected
+
+
+def test_total_minutes_matches_materialised_results() -> None:
+    kernel = VectorizedEngineMK2()
+    batch = kernel.generate_archetype_batch("parent", 6, date(2025, 3, 3), seed=5)
+
+    sleep = batch.total_minutes("sleep")
+    for index, result in enumerate(batch.to_results()):
+        minutes = sum(event["duration_minutes"] for event in result["events"] if event["activity"] == "sleep")
+        assert sleep[index] == minutes
+    assert not batch.total_minutes("unknown").any()
+
+
+def test_kernel_rejects_custom_friction_hooks() -> None:
+    engine = EngineMK2(friction_generator=lambda day, base, variance: base)
+    with pytest.raises(ValueError):
+        VectorizedEngineMK2(engine).generate_archetype_batch("office", 2, date(2025, 3, 3), seed=1)
+
+
+def test_kernel_ignores_unique_day_hooks() -> None:
+    engine = EngineMK2(unique_schedule_generator=lambda profile, day, unique: [])
+    batch = VectorizedEngineMK2(engine).generate_archetype_batch("office", 2, date(2025, 3, 3), seed=1)
+    expected = VectorizedEngineMK2().generate_archetype_batch("office", 2, date(2025, 3, 3), seed=1)
+
+    assert batch.to_results() == expected.to_results()
@@ -0,0 +1,81 @@
+"""Tests for the minute-occupancy bitmap."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from engines.placement import GapIndex
+from modules.occupancy import DayOccupancy
+from modules.validation import assert_day_coverage
+
+
+def test_occupancy_tracks_overlaps_labels_and_segments() -> None:
+    day = DayOccupancy()
+    day.occupy(0, 420, "sleep")
+    assert day.claim(540, 1020, "work")
+    assert not day.claim(1000, 1100, "gym")
+    assert not day.is_free(419, 421)
+    assert day.is_free(420, 540)
+    with pytest.raises(ValueError):
+        day.occupy(400, 500, "breakfast")
+
+    day.occupy(420, 450, "breakfast")
+    assert day.gaps() == [(450, 540), (1020, 1440)]
+    assert len(day) == 2
+    assert day.free_minutes() == 90 + 420
+    assert day.label_at(430) == "breakfast"
+    assert day.label_at(460) is None
+
+    day.relabel(1000, 1020, "commute_out")
+    assert day.segments() == [
+        (0, 420, "sleep"),
+        (420, 450, "breakfast"),
+        (540, 1000, "work"),
+        (1000, 1020, "commute_out"),
+    ]
+
+    copy = day.copy()
+    day.release(420, 450)
+    assert copy.label_at(430) == "breakfast"
+    assert day.gap_at(430) == (420, 540)
+
+
+def test_occupancy_gap_queries_match_gap_index() -> None:
+    rng = random.Random(17)
+    for _ in range(200):
+        minutes = rng.choice((100, 1440, 2880))
+        occupancy = DayOccupancy(minutes)
+        index = GapIndex(0, minutes)
+        for _ in range(rng.randint(0, 12)):
+            start = rng.randrange(minutes)
+            end = min(minutes, start + rng.randint(1, 300))
+            if occupancy.claim(start, end, "busy"):
+                index.reserve(start, end)
+
+        assert occupancy.gaps() == index.gaps()
+        assert len(occupancy) == len(index)
+        for _ in range(10):
+            minute = rng.randrange(minutes)
+            duration = rng.randint(1, 200)
+            assert occupancy.gap_at(minute) == index.gap_at(minute)
+            assert occupancy.first_fit_after(minute, duration) == index.first_fit_after(
+                minute, duration
+            )
+            assert occupancy.last_fit_before(minute, duration) == index.last_fit_before(
+                minute, duration
+            )
+            assert occupancy.find(minute, duration) == index.find(minute, duration)
+
+
+def test_assert_day_coverage_accepts_occupancy() -> None:
+    events = [(0, 600, "sleep"), (600, 1440, "free time")]
+    assert_day_coverage("monday", DayOccupancy.from_events(events))
+
+    with pytest.raises(ValueError, match="Gap detected"):
+        assert_day_coverage("monday", DayOccupancy.from_events(events[1:]))
+    with pytest.raises(ValueError, match="does not cover"):
+        assert_day_coverage("monday", DayOccupancy.from_events(events[:1]))
+    with pytest.raises(ValueError, match="no events"):
+        assert_day_coverage("monday", DayOccupancy())
@@ -0,0 +1,164 @@
+"""Tests for the gap-indexed MK2 placement strategy."""
+
+from __future__ import annotations
+
+import random
+from datetime import date
+
+import pytest
+
+from archetypes import DEFAULT_TEMPLATES, NIGHT_OWL_TEMPLATES
+from engines.engine_mk2 import EngineMK2
+from engines.placement import GapIndex, compile_templates, place_activities_in_gaps
+from models import Activity, ActivityTemplate
+from modules.occupancy import nearest_fit
+from modules.unique_events import UniqueDay
+from yearly_budget import YearlyBudget
+
+
+def test_gap_index_finds_nearest_fit_and_splits_gaps() -> None:
+    gaps = GapIndex(0, 100)
+    gaps.reserve(20, 40)
+    gaps.reserve(60, 90)
+
+    assert gaps.gaps() == [(0, 20), (40, 60), (90, 100)]
+    assert gaps.find(45, 10) == 45
+    assert gaps.find(55, 10) == 50
+    assert gaps.find(58, 20) == 40
+    assert gaps.find(95, 15) == 45
+    assert gaps.find(95, 30) is None
+    with pytest.raises(ValueError):
+        gaps.reserve(15, 25)
+
+
+def test_gap_index_tree_search_matches_linear_scan_at_hundreds_of_gaps() -> None:
+    rng = random.Random(11)
+    gaps = GapIndex(0, 2 * 1440)
+    for minute in range(0, 2 * 1440, 8):
+        gaps.reserve(minute, minute + rng.randint(1, 5))
+    starts = [start for start, _ in gaps.gaps()]
+    ends = [end for _, end in gaps.gaps()]
+    assert len(gaps) >= 300
+
+    for _ in range(2000):
+        preferred, duration = rng.randint(-20, 2900), rng.randint(0, 8)
+        assert gaps.find(preferred, duration) == nearest_fit(starts, ends, preferred, duration)
+        minute = rng.randint(0, 2880)
+        assert gaps.first_fit_after(minute, duration) == next(
+            ((s, e) for s, e in zip(starts, ends) if s >= minute and e - s >= duration), None
+        )
+        assert gaps.last_fit_before(minute, duration) == next(
+            (
+                (s, e)
+                for s, e in zip(reversed(starts), reversed(ends))
+                if e <= minute and e - s >= duration
+            ),
+            None,
+        )
+
+    gaps.discard(100, 2000)
+    assert gaps.find(1000, 1) == nearest_fit(
+        [start for start, _ in gaps.gaps()], [end for _, end in gaps.gaps()], 1000, 1
+    )
+
+
+def test_gap_placement_never_overlaps_with_many_activities() -> None:
+    rng = random.Random(3)
+    activities = [
+        Activity(name, rng.randint(5, 40), 1.0)
+        for name in ("breakfast", "lunch", "dinner", "chores") * 10
+    ]
+
+    events = place_activities_in_gaps(2, "wednesday", activities, DEFAULT_TEMPLATES, rng)
+
+    assert len(events) == len(activities)
+    for previous, current in zip(events, events[1:]):
+        assert previous.end_minutes <= current.start_minutes
+
+
+@pytest.mark.parametrize("archetype", ["office", "parent", "freelancer"])
+def test_gap_placement_engine_output_is_consistent(archetype: str) -> None:
+    engine = EngineMK2(placement="gap")
+    profile, templates = engine.select_profile(archetype)
+    budget = YearlyBudget(person_id="p-1", year=2025)
+    budget.add_unique_day(
+        UniqueDay(
+            date(2025, 3, 5),
+            "custom",
+            rules={"activities": [{"name": f"task_{i}", "duration": 15} for i in range(60)]},
+        )
+    )
+
+    result = engine.generate_complete_week(profile, date(2025, 3, 3), 2, templates, budget)
+
+    for day in {event["date"] for event in result["events"]}:
+        spans = sorted(
+            (event["start_minutes"], event["end_minutes"])
+            for event in result["events"]
+            if event["date"] == day
+        )
+        assert all(left[1] <= right[0] for left, right in zip(spans, spans[1:]))
+
+
+def test_unknown_placement_strategy_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        EngineMK2(placement="segment_tree")
+
+
+def test_compiled_templates_are_cached_by_content() -> None:
+    table = compile_templates(DEFAULT_TEMPLATES)
+
+    assert compile_templates(DEFAULT_TEMPLATES) is table
+    assert compile_templates(dict(DEFAULT_TEMPLATES)) is table
+    assert compile_templates(table) is table
+    assert compile_templates(NIGHT_OWL_TEMPLATES) is not table
+    assert table.entries["work"].valid_days_mask == 0b0011111
+    assert table.entries["work"].applies_to(4) and not table.entries["work"].applies_to(5)
+    assert table.start_hour("unknown") == 12
+    with pytest.raises(TypeError):
+        table.entries["work"] = table.entries["gym"]  # type: ignore[index]
+
+
+def test_templates_edited_after_use_are_recompiled() -> None:
+    templates = {"gym": ActivityTemplate("gym", 17, 60, [0, 2, 4])}
+    before = compile_templates(templates)
+
+    templates["gym"].preferred_start_hour = 6
+    templates["gym"].valid_days.append(1)  # type: ignore[union-attr]
+    after = compile_templates(templates)
+
+    assert before.entries["gym"].preferred_start_hour == 17
+    assert after.entries["gym"].preferred_start_hour == 6
+    assert after.entries["gym"].applies_to(1)
+
+
+def test_cursor_placement_accepts_dicts_and_compiled_tables() -> None:
+    templates = {
+        "sleep": ActivityTemplate("sleep", 23, 15),
+        "gym": ActivityTemplate("gym", 17, 60, [0, 2, 4]),
+    }
+    activities = [Activity("gym", 60, 1.0), Activity("sleep", 480, 1.0), Activity("read", 30, 1.0)]
+
+    from_dict = EngineMK2._place_activities_in_day(
+        1, "tuesday", activities, templates, random.Random(5)
+    )
+    from_table = EngineMK2._place_activities_in_day(
+        1, "tuesday", activities, compile_templates(templates), random.Random(5)
+    )
+
+    assert from_dict == from_table
+    assert [event.activity.name for event in from_dict] == ["read", "gym", "sleep"]
+    assert from_dict[1].start_minutes == from_dict[0].end_minutes
+
+
+def test_gap_placement_reserves_overflow_fallback() -> None:
+    # "b" fits no gap and overflows past "a"; "c" must not land on top of it.
+    activities = [
+        Activity(name, minutes, 1.0) for name, minutes in (("a", 2000), ("b", 1000), ("c", 100))
+    ]
+
+    events = place_activities_in_gaps(0, "monday", activities, {}, random.Random(0))
+
+    spans = sorted((event.start_minutes, event.end_minutes) for event in events)
+    assert spans[1] == (2000, 3000)
+    assert all(left[1] <= right[0] for left, right in zip(spans, spans[1:]))
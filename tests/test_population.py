@@ -0,0 +1,104 @@
+"""Tests for the process-pool population generator."""
+
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+from archetypes import create_exhausted_parent
+from engines.engine_mk2 import EngineMK2, EngineMK21
+from engines.population import PopulationSpec, generate_population
+from modules.calendar_provider import CalendarProvider
+from modules.date_context import DateContextIndex
+
+
+@pytest.fixture
+def population_specs():
+    """Return a factory for specs cycling through the built-in archetypes."""
+
+    def make(count: int) -> list:
+        archetypes = ["office", "parent", "freelancer"]
+        return [
+            PopulationSpec(profile=archetypes[index % 3], seed=index, start_date=date(2025, 3, 3))
+            for index in range(count)
+        ]
+
+    return make
+
+
+class _CountingProvider(CalendarProvider):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def classify_day(self, day, country="NL"):
+        self.calls += 1
+        return super().classify_day(day, country)
+
+    def get_seasonal_modifiers(self, day):
+        self.calls += 1
+        return super().get_seasonal_modifiers(day)
+
+
+def test_population_matches_single_week_generation(population_specs) -> None:
+    specs = population_specs(10)
+    engine = EngineMK2()
+    results = list(generate_population(specs, workers=1))
+
+    for spec, result in zip(specs, results):
+        profile, templates = engine.select_profile(spec.profile)
+        expected = engine.generate_complete_week(profile, spec.start_date, spec.seed, templates)
+        assert result == expected
+
+
+def test_population_output_is_independent_of_worker_count(population_specs) -> None:
+    specs = population_specs(10)
+    serial = list(generate_population(specs, workers=1))
+    parallel = list(generate_population(specs, workers=2, chunksize=3, max_pending=1))
+    assert parallel == serial
+
+
+def test_population_accepts_profile_instances() -> None:
+    spec = PopulationSpec(profile=create_exhausted_parent(), seed=4, start_date=date(2025, 1, 6))
+    (result,) = generate_population([spec], workers=1)
+    assert result["person"] == "Exhausted Parent"
+
+
+def test_population_rejects_invalid_chunksize(population_specs) -> None:
+    with pytest.raises(ValueError):
+        list(generate_population(population_specs(10), chunksize=0))
+
+
+def test_date_context_shares_calendar_work_across_people(population_specs) -> None:
+    specs = population_specs(10)
+    provider = _CountingProvider()
+    index = DateContextIndex(date(2025, 3, 3), date(2025, 3, 9), ["NL"], provider)
+    precomputed = provider.calls
+    engine = EngineMK2(provider, date_context=index)
+
+    results = list(generate_population(specs, engine=engine, workers=1))
+
+    assert provider.calls == precomputed == 14
+    assert results == list(generate_population(specs, workers=1))
+    assert list(generate_population(specs, engine=engine, workers=2, chunksize=5)) == results
+
+
+def test_date_context_must_match_engine_provider() -> None:
+    index = DateContextIndex(date(2025, 3, 3), date(2025, 3, 9))
+    with pytest.raises(ValueError):
+        EngineMK2(CalendarProvider(), date_context=index)
+
+    engine = EngineMK2(date_context=index)
+    engine.set_calendar_provider(CalendarProvider())
+    assert engine.date_context is None
+
+
+def test_mk2_1_accepts_date_context() -> None:
+    index = DateContextIndex(date(2025, 3, 3), date(2025, 3, 9))
+    engine = EngineMK21(date_context=index)
+
+    assert engine.date_context is index
+    profile, templates = engine.select_profile("office")
+    assert engine.generate_complete_week(profile, date(2025, 3, 3), 2, templates) == (
+        EngineMK21().generate_complete_week(profile, date(2025, 3, 3), 2, templates)
+    )
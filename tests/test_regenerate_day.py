@@ -0,0 +1,104 @@
+"""Tests for single-day regeneration of MK2 week results."""
+
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+from engines.engine_mk2 import EngineMK2
+from engines.web_adapter import mk2_regenerate_day_web, mk2_run_workforce_web
+from modules.unique_events import UniqueDay
+from yearly_budget import YearlyBudget
+
+WEEK_START = date(2025, 3, 3)
+
+
+@pytest.mark.parametrize("archetype", ["office", "parent", "freelancer"])
+def test_unchanged_day_regenerates_identically(archetype: str) -> None:
+    engine = EngineMK2()
+    profile, templates = engine.select_profile(archetype)
+    week = engine.generate_complete_week(profile, WEEK_START, 4, templates, seeding="counter")
+
+    for offset in range(7):
+        day = date(2025, 3, 3 + offset)
+        assert engine.regenerate_day(week, profile, day, 4, templates) == week
+
+
+def test_unique_day_patch_matches_full_regeneration() -> None:
+    engine = EngineMK2()
+    profile, templates = engine.select_profile("office")
+    budget = YearlyBudget(person_id="p-1", year=2025)
+    budget.add_unique_day(UniqueDay(date(2025, 3, 5), "vacation"))
+
+    week = engine.generate_complete_week(profile, WEEK_START, 3, templates, seeding="counter")
+    patched = engine.regenerate_day(week, profile, date(2025, 3, 5), 3, templates, budget)
+    expected = engine.generate_complete_week(
+        profile, WEEK_START, 3, templates, budget, seeding="counter"
+    )
+
+    assert patched == expected
+    assert patched["metadata"]["day_types"]["2025-03-05"] == "vacation"
+    untouched = [event for event in week["events"] if event["date"] != "2025-03-05"]
+    assert all(
+        any(event is original for event in patched["events"]) for original in untouched
+    )
+
+
+def test_regenerate_day_rejects_dates_outside_week() -> None:
+    engine = EngineMK2()
+    profile, templates = engine.select_profile("office")
+    week = engine.generate_complete_week(profile, WEEK_START, 1, templates)
+    with pytest.raises(ValueError):
+        engine.regenerate_day(week, profile, date(2025, 3, 10), 1, templates)
+
+
+def test_web_regeneration_patches_only_the_edited_day() -> None:
+    payload = mk2_run_workforce_web("parent", "2025-03-03", 8, None, seeding="counter")
+    budget = {
+        "person_id": "p-1",
+        "year": 2025,
+        "unique_days": [{"date": "2025-03-07", "day_type": "sick"}],
+    }
+
+    patched = mk2_regenerate_day_web(payload, "parent", "2025-03-07", 8, budget)
+
+    def other_days(result: dict) -> list:
+        return [event for event in result["events"] if event["date"] != "2025-03-07"]
+
+    assert other_days(patched) == other_days(payload)
+    assert patched["metadata"]["day_types"]["2025-03-07"] == "sick"
+    assert patched["metadata"]["total_events"] == len(patched["events"])
+    assert patched["metadata"]["yearly_budget"]["unique_days"][0]["day_type"] == "sick"
+    assert patched["metadata"]["rig"] == "workforce"
+    assert patched["metadata"]["seeding"] == "counter"
+    assert patched["schema_version"] == "web_v1_calendar"
+
+
+def test_web_patch_matches_full_web_regeneration() -> None:
+    budget = {
+        "person_id": "p-1",
+        "year": 2025,
+        "unique_days": [{"date": "2025-03-05", "day_type": "vacation"}],
+    }
+    payload = mk2_run_workforce_web("office", "2025-03-03", 5, None, seeding="counter")
+
+    unchanged = mk2_regenerate_day_web(payload, "office", "2025-03-04", 5)
+    patched = mk2_regenerate_day_web(payload, "office", "2025-03-05", 5, budget)
+    expected = mk2_run_workforce_web("office", "2025-03-03", 5, budget, seeding="counter")
+
+    assert unchanged["events"] == payload["events"]
+    assert patched["events"] == expected["events"]
+    assert patched["metadata"]["day_types"] == expected["metadata"]["day_types"]
+
+
+def test_web_weeks_default_to_sequential_seeding() -> None:
+    engine = EngineMK2()
+    profile, templates = engine.select_profile("office")
+    payload = mk2_run_workforce_web("office", "2025-03-03", 5, None)
+
+    expected = engine.generate_complete_week(profile, WEEK_START, 5, templates)
+    assert payload["events"] == expected["events"]
+    assert payload["metadata"]["seeding"] == "sequential"
+    with pytest.raises(ValueError, match="counter"):
+        mk2_regenerate_day_web(payload, "office", "2025-03-05", 5)
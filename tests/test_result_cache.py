@@ -0,0 +1,134 @@
+"""Tests for the MK2 week result cache."""
+
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+from modules.calendar_provider import CalendarProvider
+from modules.result_cache import WeekResultCache, fingerprint
+from modules.unique_events import UniqueDay
+from modules.validation import validate_week
+from rigs.workforce_rig import WorkforceRig
+from yearly_budget import YearlyBudget
+
+WEEK_START = date(2025, 3, 3)
+
+
+def test_rig_serves_repeated_weeks_from_cache() -> None:
+    cache = WeekResultCache()
+    rig = WorkforceRig(cache=cache)
+    profile, templates = rig.select_profile("parent")
+
+    first = rig.generate_complete_week(profile, WEEK_START, 3, templates)
+    first["events"].clear()
+    second = rig.generate_complete_week(profile, WEEK_START, 3, templates)
+
+    assert second == WorkforceRig().generate_complete_week(profile, WEEK_START, 3, templates)
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+
+
+def test_cache_key_covers_yearly_budget_contents() -> None:
+    budget = YearlyBudget(person_id="p-1", year=2025)
+    before = fingerprint(seed=1, yearly_budget=budget)
+    budget.add_unique_day(UniqueDay(date(2025, 3, 5), "vacation"))
+
+    assert fingerprint(seed=1, yearly_budget=budget) != before
+    assert fingerprint(seed=1, yearly_budget=budget) == fingerprint(yearly_budget=budget, seed=1)
+
+
+def test_lru_eviction_and_byte_limit() -> None:
+    cache = WeekResultCache(max_entries=2)
+    for key in ("a", "b", "c"):
+        cache.put(key, {"key": key})
+    assert cache.get("a") is None
+    assert cache.get("c") == {"key": "c"}
+    assert cache.stats().evictions == 1
+
+    small = WeekResultCache(max_bytes=1)
+    small.put("a", {"key": "a"})
+    small.put("b", {"key": "b"})
+    assert len(small) == 1
+
+
+def test_swapping_modules_invalidates_cache() -> None:
+    cache = WeekResultCache()
+    rig = WorkforceRig(cache=cache)
+    profile, templates = rig.select_profile("office")
+
+    rig.generate_complete_week(profile, WEEK_START, 1, templates)
+    rig.set_validator(lambda week: validate_week(week)[:0])
+    assert len(cache) == 0
+
+    rig.generate_complete_week(profile, WEEK_START, 1, templates)
+    rig.set_calendar_provider(CalendarProvider())
+    assert len(cache) == 0
+    assert cache.stats().invalidations == 2
+
+
+def test_cache_key_follows_provider_settings_and_engine_hooks() -> None:
+    class RegionalProvider(CalendarProvider):
+        def __init__(self, region: str) -> None:
+            self.region = region
+
+    rig = WorkforceRig(calendar_provider=RegionalProvider("north"))
+    profile, templates = rig.select_profile("office")
+    north = rig._cache_key(profile, WEEK_START, 1, templates, None)
+
+    rig.engine.set_calendar_provider(RegionalProvider("south"))
+    south = rig._cache_key(profile, WEEK_START, 1, templates, None)
+    assert south != north
+
+    rig.engine.set_calendar_provider(RegionalProvider("north"))
+    assert rig._cache_key(profile, WEEK_START, 1, templates, None) == north
+
+    rig.engine.set_validator(_no_issues)
+    assert rig._cache_key(profile, WEEK_START, 1, templates, None) != north
+
+
+def _no_issues(week):
+    return []
+
+
+def test_anonymous_hooks_are_never_served_from_cache() -> None:
+    with pytest.raises(TypeError):
+        fingerprint(hook=lambda week: [])
+
+    cache = WeekResultCache()
+    first = WorkforceRig(cache=cache, validator=lambda week: [])
+    second = WorkforceRig(cache=cache, validator=lambda week: validate_week(week)[:1])
+    profile, templates = first.select_profile("office")
+
+    first.generate_complete_week(profile, WEEK_START, 1, templates)
+    second.generate_complete_week(profile, WEEK_START, 1, templates)
+
+    assert len(cache) == 0
+    assert cache.stats().hits == 0
+
+
+def test_engine_setters_invalidate_rig_cache() -> None:
+    cache = WeekResultCache()
+    rig = WorkforceRig(cache=cache)
+    profile, templates = rig.select_profile("office")
+
+    rig.generate_complete_week(profile, WEEK_START, 1, templates)
+    rig.engine.set_validator(_no_issues)
+
+    assert len(cache) == 0
+    assert cache.stats().invalidations == 1
+
+
+def test_disk_store_survives_new_cache_instances(tmp_path) -> None:
+    profile, templates = WorkforceRig().select_profile("freelancer")
+    first = WorkforceRig(cache=WeekResultCache(directory=tmp_path))
+    expected = first.generate_complete_week(profile, WEEK_START, 9, templates)
+
+    cache = WeekResultCache(directory=tmp_path)
+    second = WorkforceRig(cache=cache)
+    assert second.generate_complete_week(profile, WEEK_START, 9, templates) == expected
+    assert cache.stats().disk_hits == 1
+
+    cache.invalidate()
+    assert not list(tmp_path.glob("*.json"))
@@ -6,6 +6,8 @@ const ALLOWED_FUNCTIONS = new Set([
   'mk2_run_workforce',
   'mk2_1_run_calendar',
   'mk2_1_run_workforce',
+  'mk2_regenerate_day',
+  'mk2_1_regenerate_day',
 ]);
 const FN_DISPATCH = {
   mk1_run: 'mk1_run_web',
@@ -13,6 +15,8 @@ const FN_DISPATCH = {
   mk2_run_workforce: 'mk2_run_workforce_web',
   mk2_1_run_calendar: 'mk2_1_run_calendar_web',
   mk2_1_run_workforce: 'mk2_1_run_workforce_web',
+  mk2_regenerate_day: 'mk2_regenerate_day_web',
+  mk2_1_regenerate_day: 'mk2_1_regenerate_day_web',
 };
 
 const RUN_TIMEOUT_MS = 30_000;
@@ -258,11 +262,11 @@ def mk1_run_web(archetype, week_start=None, seed=None):
     return _payload(archetype, week_start, "mk1")
 
 
-def mk2_run_calendar_web(archetype, week_start=None, seed=None):
+def mk2_run_calendar_web(archetype, week_start=None, seed=None, **_kwargs):
     return _payload(archetype, week_start, "mk2")
 
 
-def mk2_run_workforce_web(archetype, week_start=None, seed=None, yearly_budget=None):
+def mk2_run_workforce_web(archetype, week_start=None, seed=None, yearly_budget=None, **_kwargs):
     payload = _payload(archetype, week_start, "workforce")
     payload["metadata"]["yearly_budget"] = yearly_budget
     return payload
@@ -2088,6 +2092,19 @@ from engines.web_adapter import mk1_run_web, mk2_run_calendar_web, mk2_run_workf
 ARGS_JSON = ${JSON.stringify(argsJSON)}
 ARGS = json.loads(ARGS_JSON)
 
+
+def _regenerate_day(name):
+    import engines.web_adapter as adapter
+
+    return getattr(adapter, name)(
+        ARGS.get("payload") or {},
+        ARGS.get("archetype", ""),
+        ARGS.get("day"),
+        ARGS.get("seed"),
+        ARGS.get("yearly_budget"),
+    )
+
+
 _dispatch = {
     "mk1_run": lambda: mk1_run_web(
         ARGS.get("archetype", ""),
@@ -2098,24 +2115,30 @@ _dispatch = {
         ARGS.get("archetype", ""),
         ARGS.get("week_start"),
         ARGS.get("seed"),
+        seeding=ARGS.get("seeding") or "sequential",
     ),
     "mk2_run_workforce": lambda: mk2_run_workforce_web(
         ARGS.get("archetype", ""),
         ARGS.get("week_start"),
         ARGS.get("seed"),
         ARGS.get("yearly_budget"),
+        seeding=ARGS.get("seeding") or "sequential",
     ),
     "mk2_1_run_calendar": lambda: mk2_1_run_calendar_web(
         ARGS.get("archetype", ""),
         ARGS.get("week_start"),
         ARGS.get("seed"),
+        seeding=ARGS.get("seeding") or "sequential",
     ),
     "mk2_1_run_workforce": lambda: mk2_1_run_workforce_web(
         ARGS.get("archetype", ""),
         ARGS.get("week_start"),
         ARGS.get("seed"),
         ARGS.get("yearly_budget"),
+        seeding=ARGS.get("seeding") or "sequential",
     ),
+    "mk2_regenerate_day": lambda: _regenerate_day("mk2_regenerate_day_web"),
+    "mk2_1_regenerate_day": lambda: _regenerate_day("mk2_1_regenerate_day_web"),
 }
 
 res = _dispatch["${fn}"]()